@@ -7,6 +7,8 @@ from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.cache import config_fingerprint
+from ..utils.http_cache import configure_conditional_requests
 from ..utils.logging import log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
 from ..utils.ssl import configure_ssl_verification
@@ -92,6 +94,14 @@ class ConfluenceClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Revalidate rarely changing metadata instead of downloading it again
+        configure_conditional_requests(
+            service_name="Confluence",
+            url=self.confluence.url,
+            session=self.confluence._session,
+            tenant=config_fingerprint(self.config),
+        )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
@@ -43,7 +43,11 @@ class CommentsMixin(ConfluenceClient):
                 # Get the content based on format
                 body = comment_data["body"]["view"]["value"]
                 processed_html, processed_markdown = (
-                    self.preprocessor.process_html_content(body, space_key=space_key)
+                    self.preprocessor.process_html_content(
+                        body,
+                        space_key=space_key,
+                        output_format="markdown" if return_markdown else "html",
+                    )
                 )
 
                 # Create a copy of the comment data to modify
@@ -114,9 +118,10 @@ class CommentsMixin(ConfluenceClient):
                 return None
 
             # Process the comment to return a consistent model
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
+            _, processed_markdown = self.preprocessor.process_html_content(
                 response.get("body", {}).get("view", {}).get("value", ""),
                 space_key=space_key,
+                output_format="markdown",
             )
 
             # Modify the response to include processed content
@@ -1,20 +1,215 @@
 """Module for Confluence page operations."""
 
 import logging
+import time
+from collections.abc import Callable
+from typing import Any
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
+from ..preprocessing.base import OutputFormat
+from ..utils.cache import (
+    SharedTTLCache,
+    config_fingerprint,
+    load_snapshot,
+    save_snapshot,
+)
+from ..utils.environment import get_bool_env, get_int_env
 from .client import ConfluenceClient
+from .spaces import has_space
 
 logger = logging.getLogger("mcp-atlassian")
 
+PAGE_EXPAND = "body.storage,version,space,children.attachment"
+PAGE_METADATA_EXPAND = "version,space,children.attachment"
+PAGE_SNAPSHOT_NAMESPACE = "confluence-page"
+OUTPUT_FORMATS: tuple[OutputFormat, ...] = ("markdown", "html")
+
+
+def get_page_cache_ttl() -> int:
+    """Get the number of seconds converted page bodies are kept.
+
+    Controlled by CONFLUENCE_PAGE_CACHE_TTL. ``0`` disables the cache.
+    """
+    return get_int_env("CONFLUENCE_PAGE_CACHE_TTL", 3600)
+
+
+def get_page_cache_freshness() -> int:
+    """Get the number of seconds a cached page is served without any request.
+
+    Controlled by CONFLUENCE_PAGE_CACHE_FRESHNESS. After this window the page
+    version is checked (without fetching the body) before the cache is used.
+    """
+    return get_int_env("CONFLUENCE_PAGE_CACHE_FRESHNESS", 30)
+
+
+class ConvertedPage:
+    """A converted page body, together with the page version it belongs to."""
+
+    __slots__ = ("version", "content", "metadata", "checked_at")
+
+    def __init__(
+        self, version: int, content: str, metadata: dict[str, Any] | None = None
+    ) -> None:
+        self.version = version
+        self.content = content
+        # The page as returned with PAGE_METADATA_EXPAND (no body), if known.
+        self.metadata = metadata
+        self.checked_at = time.monotonic()
+
+    def age(self) -> float:
+        """Seconds since the page version was last confirmed."""
+        return time.monotonic() - self.checked_at
+
+
+def _page_version(page: dict[str, Any]) -> int | None:
+    version = page.get("version")
+    return version.get("number") if isinstance(version, dict) else None
+
+
+def _without_body(page: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in page.items() if key != "body"}
+
+
+# Converted page bodies by (credentials, page id, output format). Entries are
+# keyed by credentials so that a page is never served to a user whose own
+# request for it has not succeeded before.
+_converted_pages: SharedTTLCache[tuple[str, str, str], ConvertedPage] = SharedTTLCache(
+    maxsize=lambda: get_int_env("CONFLUENCE_PAGE_CACHE_SIZE", 256),
+    ttl=get_page_cache_ttl,
+)
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    def _page_cache_key(
+        self, page_id: str, output_format: OutputFormat
+    ) -> tuple[str, str, str] | None:
+        fingerprint = config_fingerprint(self.config)
+        if fingerprint is None or not page_id:
+            return None
+        return (fingerprint, str(page_id), output_format)
+
+    def _convert_page_body(
+        self,
+        page: dict[str, Any],
+        space_key: str,
+        output_format: OutputFormat,
+        *,
+        has_metadata: bool = False,
+    ) -> str:
+        """Convert the storage-format body of a page, reusing earlier conversions.
+
+        Conversions are addressed by page id, version and output format, so a
+        page is only converted again once it has been edited. With
+        CONFLUENCE_PAGE_CACHE_PERSIST enabled they are also snapshotted to
+        MCP_CACHE_DIR.
+
+        Args:
+            page: The page, including ``body.storage`` and ``version``.
+            space_key: The key of the space containing the page.
+            output_format: The format to convert the body to.
+            has_metadata: Whether ``page`` was fetched with everything in
+                PAGE_METADATA_EXPAND, so that it can be served from the cache.
+
+        Returns:
+            The converted body.
+        """
+        cache_key = self._page_cache_key(page.get("id", ""), output_format)
+        version = _page_version(page)
+        if cache_key is None or version is None:
+            return self._process_page_body(page, space_key, output_format)
+
+        cached = _converted_pages.get(cache_key)
+        if cached is not None and cached.version == version:
+            content = cached.content
+            metadata = cached.metadata
+        else:
+            content = self._load_page_body(
+                cache_key,
+                version,
+                lambda: self._process_page_body(page, space_key, output_format),
+            )
+            metadata = None
+        if has_metadata:
+            metadata = _without_body(page)
+        _converted_pages.set(cache_key, ConvertedPage(version, content, metadata))
+        return content
+
+    def _load_page_body(
+        self,
+        cache_key: tuple[str, str, str],
+        version: int,
+        convert: Callable[[], str],
+    ) -> str:
+        """Get a converted body from its disk snapshot, or convert it."""
+        if not get_bool_env("CONFLUENCE_PAGE_CACHE_PERSIST"):
+            return convert()
+        fingerprint, page_id, output_format = cache_key
+        snapshot_key = f"{fingerprint}:{page_id}:{version}:{output_format}"
+        ttl = get_page_cache_ttl()
+        content = load_snapshot(PAGE_SNAPSHOT_NAMESPACE, snapshot_key, ttl)
+        if isinstance(content, str):
+            return content
+        content = convert()
+        if ttl > 0:
+            save_snapshot(PAGE_SNAPSHOT_NAMESPACE, snapshot_key, content)
+        return content
+
+    def _process_page_body(
+        self, page: dict[str, Any], space_key: str, output_format: OutputFormat
+    ) -> str:
+        content = page["body"]["storage"]["value"]
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            content, space_key=space_key, output_format=output_format
+        )
+        return processed_markdown if output_format == "markdown" else processed_html
+
+    def _get_converted_page(
+        self, page_id: str, output_format: OutputFormat
+    ) -> tuple[dict[str, Any], str]:
+        """Fetch a page and its converted body, avoiding work for unchanged pages.
+
+        A page confirmed less than CONFLUENCE_PAGE_CACHE_FRESHNESS seconds ago
+        is served without a request. Otherwise a cached page is revalidated by
+        fetching it without its body, and the body is only fetched and
+        converted again if the version changed.
+        """
+        cache_key = self._page_cache_key(page_id, output_format)
+        cached = _converted_pages.get(cache_key) if cache_key else None
+        if cached is not None and cache_key is not None:
+            if (
+                cached.metadata is not None
+                and cached.age() < get_page_cache_freshness()
+            ):
+                return cached.metadata, cached.content
+            metadata = self.confluence.get_page_by_id(
+                page_id=page_id, expand=PAGE_METADATA_EXPAND
+            )
+            if _page_version(metadata) == cached.version:
+                _converted_pages.set(
+                    cache_key, ConvertedPage(cached.version, cached.content, metadata)
+                )
+                return metadata, cached.content
+
+        page = self.confluence.get_page_by_id(page_id=page_id, expand=PAGE_EXPAND)
+        space_key = page.get("space", {}).get("key", "")
+        content = self._convert_page_body(
+            page, space_key, output_format, has_metadata=True
+        )
+        return page, content
+
+    def invalidate_page_cache(self, page_id: str) -> None:
+        """Drop the converted bodies of a page, e.g. after it was changed."""
+        for output_format in OUTPUT_FORMATS:
+            cache_key = self._page_cache_key(page_id, output_format)
+            if cache_key is not None:
+                _converted_pages.pop(cache_key)
+
     def get_page_content(
         self, page_id: str, *, convert_to_markdown: bool = True
     ) -> ConfluencePage:
@@ -34,18 +229,10 @@ class PagesMixin(ConfluenceClient):
             Exception: If there is an error retrieving the page
         """
         try:
-            page = self.confluence.get_page_by_id(
-                page_id=page_id, expand="body.storage,version,space,children.attachment"
-            )
-            space_key = page.get("space", {}).get("key", "")
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
+            page, page_content = self._get_converted_page(
+                page_id, "markdown" if convert_to_markdown else "html"
             )
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
             # Create and return the ConfluencePage model
             return ConfluencePage.from_api_response(
                 page,
@@ -142,15 +329,7 @@ class PagesMixin(ConfluenceClient):
         """
         try:
             # First check if the space exists
-            spaces = self.confluence.get_all_spaces(start=0, limit=500)
-
-            # Handle case where spaces can be a dictionary with a "results" key
-            if isinstance(spaces, dict) and "results" in spaces:
-                space_keys = [s["key"] for s in spaces["results"]]
-            else:
-                space_keys = [s["key"] for s in spaces]
-
-            if space_key not in space_keys:
+            if not has_space(self.confluence, self.config, space_key):
                 logger.warning(f"Space {space_key} not found")
                 return None
 
@@ -163,14 +342,10 @@ class PagesMixin(ConfluenceClient):
                 logger.warning(f"Page '{title}' not found in space {space_key}")
                 return None
 
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
+            page_content = self._convert_page_body(
+                page, space_key, "markdown" if convert_to_markdown else "html"
             )
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
             # Create and return the ConfluencePage model
             return ConfluencePage.from_api_response(
                 page,
@@ -226,7 +401,9 @@ class PagesMixin(ConfluenceClient):
         for page in pages:
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
+                content,
+                space_key=space_key,
+                output_format="markdown" if convert_to_markdown else "html",
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -363,6 +540,7 @@ class PagesMixin(ConfluenceClient):
                 update_kwargs["parent_id"] = parent_id
 
             response = self.confluence.update_page(**update_kwargs)
+            self.invalidate_page_cache(page_id)
 
             # After update, refresh the page data
             return self.get_page_content(page_id)
@@ -422,7 +600,7 @@ class PagesMixin(ConfluenceClient):
                     content = page.get("body", {}).get("storage", {}).get("value", "")
                     if content:
                         _, processed_markdown = self.preprocessor.process_html_content(
-                            content, space_key=space_key
+                            content, space_key=space_key, output_format="markdown"
                         )
                         content_override = processed_markdown
 
@@ -460,6 +638,7 @@ class PagesMixin(ConfluenceClient):
         try:
             logger.debug(f"Deleting page {page_id}")
             response = self.confluence.remove_page(page_id=page_id)
+            self.invalidate_page_cache(page_id)
 
             # The Atlassian library's remove_page returns the raw response from
             # the REST API call. For a successful deletion, we should get a
@@ -1,17 +1,28 @@
 """Module for Confluence search operations."""
 
 import logging
+import re
+from collections import defaultdict
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage, ConfluenceSearchResult
+from ..utils.concurrency import submit_blocking
 from .client import ConfluenceClient
 from .utils import quote_cql_identifier_if_needed
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Characters that HTML-to-Markdown conversion would parse, escape or collapse
+_NON_PLAIN_TEXT = re.compile(r"[<>&*_\\]|[^\S ]| {2}")
+
+
+def _is_plain_text_excerpt(excerpt: str) -> bool:
+    """Check whether an excerpt converts to Markdown unchanged."""
+    return _NON_PLAIN_TEXT.search(excerpt) is None
+
 
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
@@ -72,27 +83,44 @@ class SearchMixin(ConfluenceClient):
                 is_cloud=self.config.is_cloud,
             )
 
+            # Index excerpts by content id (first result wins) in a single pass
+            excerpts: dict[str, str] = {}
+            for result_item in results.get("results", []):
+                content_id = result_item.get("content", {}).get("id")
+                if content_id is not None:
+                    excerpts.setdefault(content_id, result_item.get("excerpt", ""))
+
             # Process result excerpts as content
             processed_pages = []
+            pending: dict[tuple[str, str], list[ConfluencePage]] = defaultdict(list)
             for page in search_result.results:
-                # Get the excerpt from the original search results
-                for result_item in results.get("results", []):
-                    if result_item.get("content", {}).get("id") == page.id:
-                        excerpt = result_item.get("excerpt", "")
-                        if excerpt:
-                            # Process the excerpt as HTML content
-                            space_key = page.space.key if page.space else ""
-                            processed_html, processed_markdown = (
-                                self.preprocessor.process_html_content(
-                                    excerpt, space_key=space_key
-                                )
-                            )
-                            # Create a new page with processed content
-                            page.content = processed_markdown
-                        break
+                excerpt = excerpts.get(page.id)
+                if excerpt:
+                    if _is_plain_text_excerpt(excerpt):
+                        # Markdown conversion would return the text unchanged
+                        page.content = excerpt
+                    else:
+                        space_key = page.space.key if page.space else ""
+                        pending[(excerpt, space_key)].append(page)
 
                 processed_pages.append(page)
 
+            # Convert each distinct HTML excerpt once, overlapping the user
+            # lookups that mentions in excerpts may trigger
+            conversions = {
+                key: submit_blocking(
+                    self.preprocessor.process_html_content,
+                    key[0],
+                    space_key=key[1],
+                    output_format="markdown",
+                )
+                for key in pending
+            }
+            for key, future in conversions.items():
+                _, processed_markdown = future.result()
+                for page in pending[key]:
+                    page.content = processed_markdown
+
             # Return the list of result pages with processed content
             return processed_pages
         except HTTPError as http_err:
@@ -1,14 +1,172 @@
 """Module for Confluence space operations."""
 
 import logging
-from typing import cast
+import threading
+import time
+from typing import Any, cast
 
 import requests
+from atlassian.errors import ApiError
 
+from ..utils.cache import SharedTTLCache, config_fingerprint
+from ..utils.concurrency import submit_blocking
+from ..utils.environment import get_int_env
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
 
+SPACE_INDEX_PAGE_SIZE = 500
+
+
+def get_space_index_ttl() -> int:
+    """Get the number of seconds after which a space index is refreshed.
+
+    Controlled by CONFLUENCE_SPACE_CACHE_TTL. ``0`` disables the index, and
+    spaces are then checked with a single request each.
+    """
+    return get_int_env("CONFLUENCE_SPACE_CACHE_TTL", 900)
+
+
+class SpaceIndex:
+    """The keys of all spaces of a Confluence site."""
+
+    __slots__ = ("keys", "built_at")
+
+    def __init__(self, keys: frozenset[str]) -> None:
+        self.keys = keys
+        self.built_at = time.monotonic()
+
+    def __contains__(self, space_key: object) -> bool:
+        return space_key in self.keys
+
+    def age(self) -> float:
+        """Seconds since the index was built."""
+        return time.monotonic() - self.built_at
+
+    def expire(self) -> None:
+        """Mark the index as stale, so that the next lookup rebuilds it."""
+        self.built_at = float("-inf")
+
+
+# Space indexes by site URL and credentials, since users see different spaces.
+# A stale index keeps answering (for up to three more refresh intervals) while
+# it is rebuilt in the background.
+_space_indexes: SharedTTLCache[str, SpaceIndex] = SharedTTLCache(
+    maxsize=lambda: get_int_env("CONFLUENCE_SPACE_CACHE_SIZE", 32),
+    ttl=lambda: get_space_index_ttl() * 4,
+)
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def _fetch_space_keys(confluence: Any) -> frozenset[str]:
+    """Page through all spaces of a site and collect their keys."""
+    keys: set[str] = set()
+    start = 0
+    while True:
+        spaces = confluence.get_all_spaces(start=start, limit=SPACE_INDEX_PAGE_SIZE)
+        if isinstance(spaces, dict):
+            results = spaces.get("results", [])
+            if "_links" in spaces:
+                has_next = "next" in spaces["_links"]
+            else:
+                has_next = len(results) >= SPACE_INDEX_PAGE_SIZE
+        else:
+            results = spaces or []
+            has_next = len(results) >= SPACE_INDEX_PAGE_SIZE
+        keys.update(space["key"] for space in results)
+        if not results or not has_next:
+            return frozenset(keys)
+        start += len(results)
+
+
+def _refresh_space_index(confluence: Any, key: str) -> None:
+    try:
+        _space_indexes.set(key, SpaceIndex(_fetch_space_keys(confluence)))
+    except Exception as e:  # noqa: BLE001 - Keep serving the stale index
+        logger.warning(f"Error refreshing a space index: {str(e)}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(key)
+
+
+def get_space_index(confluence: Any, config: Any) -> SpaceIndex:
+    """Get the space index of a site, shared by every fetcher with the same credentials.
+
+    The first call pages through all spaces visible with the credentials.
+    Afterwards the index is served from memory and, once older than
+    CONFLUENCE_SPACE_CACHE_TTL, rebuilt in the background while the previous
+    index keeps answering.
+
+    Args:
+        confluence: The Confluence API client used to list spaces
+        config: The Confluence configuration of the client
+
+    Returns:
+        The space index of the site
+    """
+    ttl = get_space_index_ttl()
+    key = config_fingerprint(config)
+    if key is None:
+        return SpaceIndex(_fetch_space_keys(confluence))
+    index = _space_indexes.get(key)
+    if index is None:
+        index = SpaceIndex(_fetch_space_keys(confluence))
+        _space_indexes.set(key, index)
+    elif index.age() >= ttl:
+        with _refreshing_lock:
+            start_refresh = key not in _refreshing
+            _refreshing.add(key)
+        if start_refresh:
+            submit_blocking(_refresh_space_index, confluence, key)
+    return index
+
+
+def invalidate_space_index(config: Any) -> None:
+    """Drop the cached space index of a site and credentials."""
+    if key := config_fingerprint(config):
+        _space_indexes.pop(key)
+
+
+def has_space(confluence: Any, config: Any, space_key: str) -> bool:
+    """Check whether a space exists and is visible with the credentials of config.
+
+    Looks the space up in the space index first. A space missing from the
+    index may have been created after the index was built, so it is
+    confirmed with a direct request, and the index is rebuilt if it exists.
+    When the index is disabled, only the direct request is made.
+
+    Args:
+        confluence: The Confluence API client
+        config: The Confluence configuration of the client
+        space_key: The key of the space
+
+    Returns:
+        True if the space exists
+    """
+    if get_space_index_ttl() <= 0:
+        return _fetch_space_exists(confluence, space_key)
+    index = get_space_index(confluence, config)
+    if space_key in index:
+        return True
+    if not _fetch_space_exists(confluence, space_key):
+        return False
+    index.expire()
+    return True
+
+
+def _fetch_space_exists(confluence: Any, space_key: str) -> bool:
+    """Check whether a space exists with a direct request."""
+    try:
+        confluence.get_space(space_key, expand=None)
+    except ApiError:
+        return False
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return False
+        raise
+    return True
+
 
 class SpacesMixin(ConfluenceClient):
     """Mixin for Confluence space operations."""
@@ -28,6 +186,19 @@ class SpacesMixin(ConfluenceClient):
         # Cast the return value to the expected type
         return cast(dict[str, object], spaces)
 
+    def space_exists(self, space_key: str) -> bool:
+        """
+        Check whether a space exists, using the shared space index of the site
+        and credentials.
+
+        Args:
+            space_key: The key of the space
+
+        Returns:
+            True if the space exists
+        """
+        return has_space(self.confluence, self.config, space_key)
+
     def get_user_contributed_spaces(self, limit: int = 250) -> dict:
         """
         Get spaces the current user has contributed to.
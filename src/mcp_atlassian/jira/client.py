@@ -2,6 +2,7 @@
 
 import logging
 import os
+from collections.abc import Callable, Iterator
 from typing import Any, Literal
 
 from atlassian import Jira
@@ -9,6 +10,9 @@ from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.cache import config_fingerprint
+from mcp_atlassian.utils.concurrency import prefetch_call
+from mcp_atlassian.utils.http_cache import configure_conditional_requests
 from mcp_atlassian.utils.logging import log_config_param, mask_sensitive
 from mcp_atlassian.utils.oauth import configure_oauth_session
 from mcp_atlassian.utils.ssl import configure_ssl_verification
@@ -103,6 +107,14 @@ class JiraClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Revalidate rarely changing metadata instead of downloading it again
+        configure_conditional_requests(
+            service_name="Jira",
+            url=self.jira.url,
+            session=self.jira._session,
+            tenant=config_fingerprint(self.config),
+        )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
@@ -188,38 +200,89 @@ class JiraClient:
         Raises:
             ValueError: If using paged request on non-cloud Jira
         """
+        return list(
+            self.iter_paged(
+                method, url, params_or_json, absolute=absolute, prefetch=False
+            )
+        )
 
+    def iter_paged(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict | None = None,
+        *,
+        absolute: bool = False,
+        prefetch: bool = True,
+    ) -> Iterator[dict]:
+        """
+        Lazily fetch paged data from Jira API using `nextPageToken` to paginate.
+
+        Only one page is held at a time (two while prefetching), so arbitrarily
+        large result sets can be processed in constant memory.
+
+        Args:
+            method: The HTTP method to use
+            url: The URL to retrieve data from
+            params_or_json: Optional query parameters or JSON data to send
+            absolute: Whether to use absolute URL
+            prefetch: Request the next page in the background while the current
+                one is being processed
+
+        Yields:
+            The json data of each page
+
+        Raises:
+            ValueError: If using paged request on non-cloud Jira
+        """
         if not self.config.is_cloud:
             raise ValueError(
                 "Paged requests are only available for Jira Cloud platform"
             )
 
-        all_results: list[dict] = []
-        current_data = params_or_json or {}
+        current_data = dict(params_or_json or {})
+        pending: Callable[[], dict] | None = prefetch_call(
+            self._request_page, method, url, dict(current_data), absolute, enabled=False
+        )
 
-        while True:
-            if method == "get":
-                api_result = self.jira.get(
-                    path=url, params=current_data, absolute=absolute
-                )
-            else:
-                api_result = self.jira.post(
-                    path=url, json=current_data, absolute=absolute
+        while pending is not None:
+            api_result = pending()
+            pending = None
+
+            # Check if this is the last page, otherwise start on the next one
+            if "nextPageToken" in api_result:
+                current_data["nextPageToken"] = api_result["nextPageToken"]
+                pending = prefetch_call(
+                    self._request_page,
+                    method,
+                    url,
+                    dict(current_data),
+                    absolute,
+                    enabled=prefetch,
                 )
 
-            if not isinstance(api_result, dict):
-                error_message = f"API result is not a dictionary: {api_result}"
-                logger.error(error_message)
-                raise ValueError(error_message)
+            yield api_result
 
-            # Extract values from response
-            all_results.append(api_result)
-
-            # Check if this is the last page
-            if "nextPageToken" not in api_result:
-                break
+    def _request_page(
+        self,
+        method: Literal["get", "post"],
+        url: str,
+        params_or_json: dict,
+        absolute: bool,
+    ) -> dict:
+        """Fetch a single page for :meth:`iter_paged`."""
+        if method == "get":
+            api_result = self.jira.get(
+                path=url, params=params_or_json, absolute=absolute
+            )
+        else:
+            api_result = self.jira.post(
+                path=url, json=params_or_json, absolute=absolute
+            )
 
-            # Update for next iteration
-            current_data["nextPageToken"] = api_result["nextPageToken"]
+        if not isinstance(api_result, dict):
+            error_message = f"API result is not a dictionary: {api_result}"
+            logger.error(error_message)
+            raise ValueError(error_message)
 
-        return all_results
+        return api_result
@@ -13,3 +13,10 @@ DEFAULT_READ_JIRA_FIELDS: set[str] = {
     "updated",
     "issuetype",
 }
+
+# Largest page size accepted by both the Cloud and Server/DC search APIs when
+# fields are requested.
+MAX_SEARCH_PAGE_SIZE = 100
+
+# Largest number of issues Jira accepts in one bulk create request.
+MAX_BULK_CREATE_SIZE = 50
@@ -350,9 +350,12 @@ class EpicsMixin(
                     )
 
                     # If we get here, it worked - update our cached field ID
-                    if self._field_ids_cache is None:
-                        self._field_ids_cache = []
-                    self._field_ids_cache.append({"id": field_id, "name": "epic_link"})
+                    # Rebind rather than append: the list may be shared with
+                    # other fetchers through the field catalog cache
+                    self._field_ids_cache = [
+                        *(self._field_ids_cache or []),
+                        {"id": field_id, "name": "epic_link"},
+                    ]
                     return self.get_issue(issue_key)
                 except Exception as e:
                     logger.info(f"Couldn't link using fields {fields}: {str(e)}")
@@ -572,11 +575,10 @@ class EpicsMixin(
                                 f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
                             )
                             # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
+                            self._field_ids_cache = [
+                                *(self._field_ids_cache or []),
+                                {"id": field_id, "name": "epic_link"},
+                            ]
                             return issues
                     except Exception:
                         # Just try the next field ID
@@ -5,11 +5,174 @@ from typing import Any
 
 from thefuzz import fuzz
 
+from ..utils.cache import (
+    SharedTTLCache,
+    config_fingerprint,
+    delete_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+from ..utils.environment import get_bool_env, get_int_env
 from .client import JiraClient
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+FIELD_SNAPSHOT_NAMESPACE = "jira-fields"
+
+
+def _discover_epic_field_ids(fields: list[dict[str, Any]]) -> dict[str, str]:
+    """Identify Epic-related field IDs from a list of field definitions.
+
+    Args:
+        fields: Field definitions as returned by ``jira.get_all_fields()``
+
+    Returns:
+        Dictionary mapping field names (and normalized Epic keys such as
+        ``epic_link``) to their IDs
+    """
+    field_ids: dict[str, str] = {}
+
+    # Log the complete list of fields for debugging
+    all_field_names = [field.get("name", "").lower() for field in fields]
+    logger.debug(f"All field names: {all_field_names}")
+
+    # Enhanced logging for debugging
+    custom_fields = {
+        field.get("id", ""): field.get("name", "")
+        for field in fields
+        if field.get("id", "").startswith("customfield_")
+    }
+    logger.debug(f"Custom fields: {custom_fields}")
+
+    # Look for Epic-related fields - use multiple strategies to identify them
+    for field in fields:
+        field_name = field.get("name", "").lower()
+        original_name = field.get("name", "")
+        field_id = field.get("id", "")
+        field_schema = field.get("schema", {})
+        field_custom = field_schema.get("custom", "")
+
+        if original_name and field_id:
+            field_ids[original_name] = field_id
+
+        # Epic Link field - used to link issues to epics
+        if (
+            field_name == "epic link"
+            or field_name == "epic"
+            or "epic link" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
+            or field_id == "customfield_10014"
+        ):  # Common in Jira Cloud
+            field_ids["epic_link"] = field_id
+            # For backward compatibility
+            field_ids["Epic Link"] = field_id
+            logger.debug(f"Found Epic Link field: {field_id} ({original_name})")
+
+        # Epic Name field - used when creating epics
+        elif (
+            field_name == "epic name"
+            or field_name == "epic title"
+            or "epic name" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
+            or field_id == "customfield_10011"
+        ):  # Common in Jira Cloud
+            field_ids["epic_name"] = field_id
+            # For backward compatibility
+            field_ids["Epic Name"] = field_id
+            logger.debug(f"Found Epic Name field: {field_id} ({original_name})")
+
+        # Epic Status field
+        elif (
+            field_name == "epic status"
+            or "epic status" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-status"
+        ):
+            field_ids["epic_status"] = field_id
+            logger.debug(f"Found Epic Status field: {field_id} ({original_name})")
+
+        # Epic Color field
+        elif (
+            field_name == "epic color"
+            or field_name == "epic colour"
+            or "epic color" in field_name
+            or "epic colour" in field_name
+            or field_custom == "com.pyxis.greenhopper.jira:gh-epic-color"
+        ):
+            field_ids["epic_color"] = field_id
+            logger.debug(f"Found Epic Color field: {field_id} ({original_name})")
+
+        # Parent field - sometimes used instead of Epic Link
+        elif (
+            field_name == "parent"
+            or field_name == "parent issue"
+            or "parent issue" in field_name
+        ):
+            field_ids["parent"] = field_id
+            logger.debug(f"Found Parent field: {field_id} ({original_name})")
+
+        # Try to detect any other fields that might be related to Epics
+        elif "epic" in field_name and field_id.startswith("customfield_"):
+            key = f"epic_{field_name.replace(' ', '_').replace('-', '_')}"
+            field_ids[key] = field_id
+            logger.debug(
+                f"Found potential Epic-related field: {field_id} ({original_name})"
+            )
+
+    return field_ids
+
+
+class FieldCatalog:
+    """Field definitions of a Jira site together with precomputed lookup indexes.
+
+    Catalogs are immutable once built and are shared between fetcher
+    instances, so callers must not modify the returned structures.
+    """
+
+    __slots__ = ("fields", "name_to_id", "by_id", "epic_field_ids", "resolved_epic")
+
+    def __init__(self, fields: list[dict[str, Any]]) -> None:
+        """Build the indexes for a list of field definitions.
+
+        Args:
+            fields: Field definitions as returned by ``jira.get_all_fields()``
+        """
+        self.fields = fields
+
+        name_map: dict[str, str] = {}
+        id_map: dict[str, str] = {}  # Also map ID to ID for consistency
+        by_id: dict[str, dict[str, Any]] = {}
+        for field in fields:
+            field_id = field.get("id")
+            if field_id:
+                id_map[field_id] = field_id  # Map ID to itself
+                by_id.setdefault(field_id, field)
+                field_name = field.get("name")
+                if field_name:
+                    # Store lowercase name -> ID, first definition wins on collisions
+                    name_map.setdefault(field_name.lower(), field_id)
+
+        # Combine maps, ensuring IDs can also be looked up directly
+        self.name_to_id: dict[str, str] = name_map | id_map
+        self.by_id = by_id
+        self.epic_field_ids = _discover_epic_field_ids(fields)
+        # Epic field IDs after the existing-Epic fallback, filled on first use
+        self.resolved_epic: dict[str, str] | None = None
+
+
+def get_field_cache_ttl() -> int:
+    """Get the lifetime of shared field catalogs in seconds.
+
+    Controlled by JIRA_FIELD_CACHE_TTL. ``0`` disables the shared cache, so
+    every fetcher instance loads the fields itself.
+    """
+    return get_int_env("JIRA_FIELD_CACHE_TTL", 3600)
+
+
+_field_catalogs: SharedTTLCache[str, FieldCatalog] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_FIELD_CACHE_SIZE", 64), ttl=get_field_cache_ttl
+)
+
 
 class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """Mixin for Jira field operations.
@@ -19,12 +182,72 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     different Jira instances, especially for custom fields.
     """
 
-    _field_name_to_id_map: dict[str, str] | None = None  # Cache for name -> id mapping
+    _field_catalog: FieldCatalog | None = None  # Indexes over _field_ids_cache
+
+    def _field_catalog_key(self) -> str | None:
+        """Key of this fetcher's entry in the shared field catalog cache.
+
+        Catalogs are shared per site. With JIRA_FIELD_CACHE_PER_USER enabled
+        (for sites where field visibility differs between users), they are
+        shared per set of credentials instead. Returns None when sharing is
+        disabled.
+        """
+        config = getattr(self, "config", None)
+        url = getattr(config, "url", None)
+        if not isinstance(url, str) or get_field_cache_ttl() <= 0:
+            return None
+        if get_bool_env("JIRA_FIELD_CACHE_PER_USER"):
+            return config_fingerprint(config)
+        return url.rstrip("/")
+
+    def _load_shared_field_catalog(self, key: str) -> FieldCatalog | None:
+        """Get a catalog from the shared cache, falling back to a disk snapshot."""
+        catalog = _field_catalogs.get(key)
+        if catalog is not None:
+            return catalog
+
+        fields = load_snapshot(
+            FIELD_SNAPSHOT_NAMESPACE, key, max_age=get_field_cache_ttl()
+        )
+        if not isinstance(fields, list):
+            return None
+        logger.debug(f"Loaded {len(fields)} Jira fields from cache snapshot")
+        catalog = FieldCatalog(fields)
+        _field_catalogs.set(key, catalog)
+        return catalog
+
+    def _use_field_catalog(self, catalog: FieldCatalog) -> None:
+        self._field_ids_cache = catalog.fields
+        self._field_catalog = catalog
+
+    def _get_field_catalog(
+        self, refresh: bool = False, rebuild: bool = False
+    ) -> FieldCatalog:
+        """Get the lookup indexes for the fields currently known to this fetcher.
+
+        Args:
+            refresh: When True, reloads the fields from the server first
+            rebuild: When True, rebuilds the indexes even if they look current
+
+        Returns:
+            The field catalog matching the result of ``get_fields``
+        """
+        fields = self.get_fields(refresh=refresh)
+        catalog = self._field_catalog
+        # The field list may have been replaced (e.g. by epic discovery), in
+        # which case the indexes are rebuilt for this instance only.
+        if rebuild or catalog is None or catalog.fields is not fields:
+            catalog = FieldCatalog(fields)
+            self._field_catalog = catalog
+        return catalog
 
     def get_fields(self, refresh: bool = False) -> list[dict[str, Any]]:
         """
         Get all available fields from Jira.
 
+        Field definitions are shared between fetcher instances for the same site
+        (see JIRA_FIELD_CACHE_TTL) and optionally snapshotted to MCP_CACHE_DIR.
+
         Args:
             refresh: When True, forces a refresh from the server instead of using cache
 
@@ -36,10 +259,12 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             if self._field_ids_cache is not None and not refresh:
                 return self._field_ids_cache
 
-            if refresh:
-                self._field_name_to_id_map = (
-                    None  # Clear name map cache if refreshing fields
-                )
+            cache_key = self._field_catalog_key()
+            if cache_key is not None and not refresh:
+                catalog = self._load_shared_field_catalog(cache_key)
+                if catalog is not None:
+                    self._use_field_catalog(catalog)
+                    return catalog.fields
 
             # Fetch fields from Jira API
             fields = self.jira.get_all_fields()
@@ -48,11 +273,12 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Cache the fields
-            self._field_ids_cache = fields
-
-            # Regenerate the name map upon fetching new fields
-            self._generate_field_map(force_regenerate=True)
+            # Cache the fields together with their lookup indexes
+            catalog = FieldCatalog(fields)
+            self._use_field_catalog(catalog)
+            if cache_key is not None:
+                _field_catalogs.set(cache_key, catalog)
+                save_snapshot(FIELD_SNAPSHOT_NAMESPACE, cache_key, fields)
 
             # Log available fields for debugging
             self._log_available_fields(fields)
@@ -63,36 +289,20 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.error(f"Error getting Jira fields: {str(e)}")
             return []
 
+    def invalidate_field_cache(self) -> None:
+        """Drop cached field definitions for this site, in memory and on disk."""
+        self._field_ids_cache = None
+        self._field_catalog = None
+        cache_key = self._field_catalog_key()
+        if cache_key is not None:
+            _field_catalogs.pop(cache_key)
+            delete_snapshot(FIELD_SNAPSHOT_NAMESPACE, cache_key)
+
     def _generate_field_map(self, force_regenerate: bool = False) -> dict[str, str]:
         """Generates and caches a map of lowercase field names to field IDs."""
-        if self._field_name_to_id_map is not None and not force_regenerate:
-            return self._field_name_to_id_map
-
-        # Ensure fields are loaded into cache first
-        fields = (
-            self.get_fields()
-        )  # Uses cache if available unless force_regenerate was True
-        if not fields:
-            self._field_name_to_id_map = {}
-            return {}
-
-        name_map: dict[str, str] = {}
-        id_map: dict[str, str] = {}  # Also map ID to ID for consistency
-        for field in fields:
-            field_id = field.get("id")
-            field_name = field.get("name")
-            if field_id:
-                id_map[field_id] = field_id  # Map ID to itself
-                if field_name:
-                    # Store lowercase name -> ID. Handle potential name collisions if necessary.
-                    name_map.setdefault(field_name.lower(), field_id)
-
-        # Combine maps, ensuring IDs can also be looked up directly
-        self._field_name_to_id_map = name_map | id_map
-        logger.debug(
-            f"Generated/Updated field name map: {len(self._field_name_to_id_map)} entries"
-        )
-        return self._field_name_to_id_map
+        field_map = self._get_field_catalog(rebuild=force_regenerate).name_to_id
+        logger.debug(f"Using field name map: {len(field_map)} entries")
+        return field_map
 
     def get_field_id(self, field_name: str, refresh: bool = False) -> str | None:
         """
@@ -106,8 +316,7 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             Field ID if found, None otherwise
         """
         try:
-            # Ensure the map is generated/cached
-            field_map = self._generate_field_map(force_regenerate=refresh)
+            field_map = self._get_field_catalog(refresh=refresh).name_to_id
             if not field_map:
                 logger.error("Field map could not be generated.")
                 return None
@@ -140,14 +349,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             Field definition if found, None otherwise
         """
         try:
-            fields = self.get_fields(refresh=refresh)
-
-            for field in fields:
-                if field.get("id") == field_id:
-                    return field
-
-            logger.warning(f"Field with ID '{field_id}' not found")
-            return None
+            field = self._get_field_catalog(refresh=refresh).by_id.get(field_id)
+            if field is None:
+                logger.warning(f"Field with ID '{field_id}' not found")
+            return field
 
         except Exception as e:
             logger.error(f"Error getting field by ID '{field_id}': {str(e)}")
@@ -190,9 +395,11 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         """
         try:
             # Step 1: Get the ID for the given issue type name within the project
-            if not hasattr(self, "get_project_issue_types"):
+            if not hasattr(self, "get_project_issue_types") or not hasattr(
+                self, "get_issue_type_fields"
+            ):
                 logger.error(
-                    "get_project_issue_types method not available. Cannot resolve issue type ID."
+                    "Project metadata methods not available. Cannot resolve issue type ID."
                 )
                 return {}
 
@@ -209,10 +416,8 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                 )
                 return {}
 
-            # Step 2: Call the correct API method to get field metadata
-            meta = self.jira.issue_createmeta_fieldtypes(
-                project=project_key, issue_type_id=issue_type_id
-            )
+            # Step 2: Get the (cached) field metadata of the issue type
+            meta = self.get_issue_type_fields(project_key, issue_type_id)
 
             required_fields = {}
             # Step 3: Parse the response and extract required fields
@@ -256,119 +461,27 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
         try:
-            # Ensure field list and map are cached/generated
-            self._generate_field_map()  # Generates map and ensures fields are cached
-
-            # Get all fields (uses cache if available)
-            fields = self.get_fields()
-            if not fields:  # Check if get_fields failed or returned empty
+            catalog = self._get_field_catalog()
+            if not catalog.fields:  # Check if get_fields failed or returned empty
                 logger.error(
                     "Could not load field definitions for epic field discovery."
                 )
                 return {}
 
-            field_ids = {}
-
-            # Log the complete list of fields for debugging
-            all_field_names = [field.get("name", "").lower() for field in fields]
-            logger.debug(f"All field names: {all_field_names}")
+            if catalog.resolved_epic is None:
+                field_ids = dict(catalog.epic_field_ids)
 
-            # Enhanced logging for debugging
-            custom_fields = {
-                field.get("id", ""): field.get("name", "")
-                for field in fields
-                if field.get("id", "").startswith("customfield_")
-            }
-            logger.debug(f"Custom fields: {custom_fields}")
-
-            # Look for Epic-related fields - use multiple strategies to identify them
-            for field in fields:
-                field_name = field.get("name", "").lower()
-                original_name = field.get("name", "")
-                field_id = field.get("id", "")
-                field_schema = field.get("schema", {})
-                field_custom = field_schema.get("custom", "")
-
-                if original_name and field_id:
-                    field_ids[original_name] = field_id
-
-                # Epic Link field - used to link issues to epics
-                if (
-                    field_name == "epic link"
-                    or field_name == "epic"
-                    or "epic link" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-link"
-                    or field_id == "customfield_10014"
-                ):  # Common in Jira Cloud
-                    field_ids["epic_link"] = field_id
-                    # For backward compatibility
-                    field_ids["Epic Link"] = field_id
-                    logger.debug(f"Found Epic Link field: {field_id} ({original_name})")
-
-                # Epic Name field - used when creating epics
-                elif (
-                    field_name == "epic name"
-                    or field_name == "epic title"
-                    or "epic name" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-label"
-                    or field_id == "customfield_10011"
-                ):  # Common in Jira Cloud
-                    field_ids["epic_name"] = field_id
-                    # For backward compatibility
-                    field_ids["Epic Name"] = field_id
-                    logger.debug(f"Found Epic Name field: {field_id} ({original_name})")
-
-                # Epic Status field
-                elif (
-                    field_name == "epic status"
-                    or "epic status" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-status"
-                ):
-                    field_ids["epic_status"] = field_id
-                    logger.debug(
-                        f"Found Epic Status field: {field_id} ({original_name})"
-                    )
-
-                # Epic Color field
-                elif (
-                    field_name == "epic color"
-                    or field_name == "epic colour"
-                    or "epic color" in field_name
-                    or "epic colour" in field_name
-                    or field_custom == "com.pyxis.greenhopper.jira:gh-epic-color"
-                ):
-                    field_ids["epic_color"] = field_id
+                # If we couldn't find certain key fields, try alternative approaches
+                if "epic_name" not in field_ids or "epic_link" not in field_ids:
                     logger.debug(
-                        f"Found Epic Color field: {field_id} ({original_name})"
+                        "Standard field search didn't find all Epic fields, trying alternative approaches"
                     )
+                    self._try_discover_fields_from_existing_epic(field_ids)
 
-                # Parent field - sometimes used instead of Epic Link
-                elif (
-                    field_name == "parent"
-                    or field_name == "parent issue"
-                    or "parent issue" in field_name
-                ):
-                    field_ids["parent"] = field_id
-                    logger.debug(f"Found Parent field: {field_id} ({original_name})")
-
-                # Try to detect any other fields that might be related to Epics
-                elif "epic" in field_name and field_id.startswith("customfield_"):
-                    key = f"epic_{field_name.replace(' ', '_').replace('-', '_')}"
-                    field_ids[key] = field_id
-                    logger.debug(
-                        f"Found potential Epic-related field: {field_id} ({original_name})"
-                    )
-
-            # If we couldn't find certain key fields, try alternative approaches
-            if "epic_name" not in field_ids or "epic_link" not in field_ids:
-                logger.debug(
-                    "Standard field search didn't find all Epic fields, trying alternative approaches"
-                )
-                self._try_discover_fields_from_existing_epic(field_ids)
-
-            logger.debug(f"Discovered field IDs: {field_ids}")
+                logger.debug(f"Discovered field IDs: {field_ids}")
+                catalog.resolved_epic = field_ids
 
-            return field_ids
+            return dict(catalog.resolved_epic)
 
         except Exception as e:
             logger.error(f"Error discovering Jira field IDs: {str(e)}")
@@ -1,27 +1,95 @@
 """Module for Jira issue operations."""
 
 import logging
+import re
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 from typing import Any
 
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraIssue
+from ..models.jira import JiraIssue, JiraIssueRecord
 from ..models.jira.common import JiraChangelog
+from ..models.jira.record import RecordInterner
 from ..utils import parse_date
+from ..utils.cache import SharedTTLCache, config_fingerprint
+from ..utils.concurrency import submit_blocking
+from ..utils.environment import get_int_env
 from .client import JiraClient
-from .constants import DEFAULT_READ_JIRA_FIELDS
+from .constants import (
+    DEFAULT_READ_JIRA_FIELDS,
+    MAX_BULK_CREATE_SIZE,
+    MAX_SEARCH_PAGE_SIZE,
+)
 from .protocols import (
     AttachmentsOperationsProto,
     EpicOperationsProto,
     FieldsOperationsProto,
     IssueOperationsProto,
+    ProjectMetadataOperationsProto,
     UsersOperationsProto,
 )
 
 logger = logging.getLogger("mcp-jira")
 
+# Issue keys (e.g. PROJ-123) or numeric issue IDs, safe to embed in JQL
+ISSUE_KEY_PATTERN = re.compile(r"^(?:[A-Za-z][A-Za-z0-9_]*-\d+|\d+)$")
+
+# Epic details (name, summary, status) by (credentials, epic name field, epic key).
+# Kept briefly so that issues of the same epics fetched across requests do not
+# re-read the epic every time.
+_epic_cache: SharedTTLCache[tuple[str, str, str], dict[str, str | None]] = (
+    SharedTTLCache(
+        maxsize=lambda: get_int_env("JIRA_EPIC_CACHE_SIZE", 2048),
+        ttl=lambda: get_int_env("JIRA_EPIC_CACHE_TTL", 60),
+    )
+)
+
+
+def _match_requested_issues(
+    identifiers: list[str], issues: list[tuple[str, str]]
+) -> dict[str, int]:
+    """
+    Match requested issue keys or IDs to the issues Jira returned for them.
+
+    Identifiers are matched by issue ID and by (case-insensitive) key. Jira
+    resolves the old key of a moved or renamed issue to its current key, so
+    when exactly one requested key and one returned issue are left over, they
+    are paired. Search results are not in request order, so other leftovers
+    cannot be attributed and stay unmatched.
+
+    Args:
+        identifiers: The requested issue keys or numeric IDs
+        issues: (id, key) of each returned issue
+
+    Returns:
+        The index in `issues` of each matched identifier
+    """
+    index_by_identifier: dict[str, int] = {}
+    for index, (issue_id, issue_key) in enumerate(issues):
+        if issue_id:
+            index_by_identifier.setdefault(issue_id, index)
+        if issue_key:
+            index_by_identifier.setdefault(issue_key.upper(), index)
+
+    matches: dict[str, int] = {}
+    unmatched: list[str] = []
+    for identifier in identifiers:
+        index = index_by_identifier.get(identifier.upper())
+        if index is None:
+            if not identifier.isdigit():
+                unmatched.append(identifier)
+        else:
+            matches[identifier] = index
+
+    matched = set(matches.values())
+    remaining = [index for index in range(len(issues)) if index not in matched]
+    if len(unmatched) == 1 and len(remaining) == 1:
+        matches[unmatched[0]] = remaining[0]
+    return matches
+
 
 class IssuesMixin(
     JiraClient,
@@ -29,6 +97,7 @@ class IssuesMixin(
     EpicOperationsProto,
     FieldsOperationsProto,
     IssueOperationsProto,
+    ProjectMetadataOperationsProto,
     UsersOperationsProto,
 ):
     """Mixin for Jira issue operations."""
@@ -61,54 +130,7 @@ class IssuesMixin(
             Exception: If there is an error retrieving the issue
         """
         try:
-            # Determine fields_param: use provided fields or default from constant
-            fields_param = fields
-            if fields_param is None:
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields_param, list | tuple | set):
-                fields_param = ",".join(fields_param)
-
-            # Ensure necessary fields are included based on special parameters
-            if (
-                fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS)
-                or fields_param == "*all"
-            ):
-                # Default fields are being used - preserve the order
-                default_fields_list = (
-                    fields_param.split(",")
-                    if fields_param != "*all"
-                    else list(DEFAULT_READ_JIRA_FIELDS)
-                )
-                additional_fields = []
-
-                # Add appropriate fields based on expand parameter
-                if expand:
-                    expand_params = expand.split(",")
-                    if (
-                        "changelog" in expand_params
-                        and "changelog" not in default_fields_list
-                        and "changelog" not in additional_fields
-                    ):
-                        additional_fields.append("changelog")
-                    if (
-                        "renderedFields" in expand_params
-                        and "rendered" not in default_fields_list
-                        and "rendered" not in additional_fields
-                    ):
-                        additional_fields.append("rendered")
-
-                # Add appropriate fields based on properties parameter
-                if (
-                    properties
-                    and "properties" not in default_fields_list
-                    and "properties" not in additional_fields
-                ):
-                    additional_fields.append("properties")
-
-                # Combine default fields with additional fields, preserving order
-                if additional_fields:
-                    fields_param = ",".join(default_fields_list + additional_fields)
-            # Handle non-default fields string
+            fields_param = self._resolve_issue_fields_param(fields, expand, properties)
 
             # Build expand parameter if provided
             expand_param = expand
@@ -158,23 +180,9 @@ class IssuesMixin(
             # If this is linked to an epic, add the epic information to the fields
             if epic_info.get("epic_key"):
                 try:
-                    # Get field IDs for epic fields
-                    field_ids = self.get_field_ids_to_epic()
-
-                    # Add epic link field if it doesn't exist
-                    if (
-                        "epic_link" in field_ids
-                        and field_ids["epic_link"] not in fields_data
-                    ):
-                        fields_data[field_ids["epic_link"]] = epic_info["epic_key"]
-
-                    # Add epic name field if it doesn't exist
-                    if (
-                        epic_info.get("epic_name")
-                        and "epic_name" in field_ids
-                        and field_ids["epic_name"] not in fields_data
-                    ):
-                        fields_data[field_ids["epic_name"]] = epic_info["epic_name"]
+                    self._add_epic_fields(
+                        fields_data, epic_info, self.get_field_ids_to_epic()
+                    )
                 except Exception as e:
                     logger.warning(f"Error setting epic fields: {str(e)}")
 
@@ -206,6 +214,557 @@ class IssuesMixin(
             logger.error(f"Error retrieving issue {issue_key}: {error_msg}")
             raise Exception(f"Error retrieving issue {issue_key}: {error_msg}") from e
 
+    def _resolve_issue_fields_param(
+        self,
+        fields: str | list[str] | tuple[str, ...] | set[str] | None,
+        expand: str | None,
+        properties: str | list[str] | None,
+    ) -> str:
+        """
+        Build the comma-separated fields parameter for issue reads.
+
+        Args:
+            fields: Requested fields (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+            properties: Issue properties to return
+
+        Returns:
+            The fields parameter, extended with the fields required by expand/properties
+            when the default fields or "*all" are requested
+        """
+        # Determine fields_param: use provided fields or default from constant
+        fields_param = fields
+        if fields_param is None:
+            fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields_param, list | tuple | set):
+            fields_param = ",".join(fields_param)
+
+        # Ensure necessary fields are included based on special parameters
+        if fields_param == ",".join(DEFAULT_READ_JIRA_FIELDS) or fields_param == "*all":
+            # Default fields are being used - preserve the order
+            default_fields_list = (
+                fields_param.split(",")
+                if fields_param != "*all"
+                else list(DEFAULT_READ_JIRA_FIELDS)
+            )
+            additional_fields = []
+
+            # Add appropriate fields based on expand parameter
+            if expand:
+                expand_params = expand.split(",")
+                if (
+                    "changelog" in expand_params
+                    and "changelog" not in default_fields_list
+                    and "changelog" not in additional_fields
+                ):
+                    additional_fields.append("changelog")
+                if (
+                    "renderedFields" in expand_params
+                    and "rendered" not in default_fields_list
+                    and "rendered" not in additional_fields
+                ):
+                    additional_fields.append("rendered")
+
+            # Add appropriate fields based on properties parameter
+            if (
+                properties
+                and "properties" not in default_fields_list
+                and "properties" not in additional_fields
+            ):
+                additional_fields.append("properties")
+
+            # Combine default fields with additional fields, preserving order
+            if additional_fields:
+                fields_param = ",".join(default_fields_list + additional_fields)
+
+        return fields_param
+
+    def _add_epic_fields(
+        self,
+        fields_data: dict[str, Any],
+        epic_info: dict[str, Any],
+        field_ids: dict[str, str],
+    ) -> None:
+        """
+        Add the epic link and epic name of a linked epic to an issue's fields.
+
+        Args:
+            fields_data: The issue fields to update
+            epic_info: Epic information as returned by `_extract_epic_information`
+            field_ids: Epic field IDs as returned by `get_field_ids_to_epic`
+        """
+        # Add epic link field if it doesn't exist
+        if "epic_link" in field_ids and field_ids["epic_link"] not in fields_data:
+            fields_data[field_ids["epic_link"]] = epic_info["epic_key"]
+
+        # Add epic name field if it doesn't exist
+        if (
+            epic_info.get("epic_name")
+            and "epic_name" in field_ids
+            and field_ids["epic_name"] not in fields_data
+        ):
+            fields_data[field_ids["epic_name"]] = epic_info["epic_name"]
+
+    def batch_get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        expand: str | None = None,
+        comment_limit: int | str | None = 10,
+        not_found: list[str] | None = None,
+    ) -> list[JiraIssue]:
+        """
+        Get multiple Jira issues with as few requests as possible.
+
+        Issues are fetched with `key in (...)` searches of up to 100 keys each,
+        issued concurrently. Comments are taken from the search results (only
+        issues with more comments than returned are fetched individually), and
+        the epics of all issues are resolved with one additional search.
+
+        Args:
+            issue_keys: The issue keys (e.g., ['PROJECT-123', 'PROJECT-124'])
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Fields to expand in the response
+            comment_limit: Maximum number of comments to include per issue, or "all"
+            not_found: Optional list, extended with the requested keys that do
+                not exist or are not visible to the user
+
+        Returns:
+            JiraIssue models in the order of issue_keys, matched by key or ID
+            (including the old keys of moved issues). Keys that do not exist or
+            are not visible to the user are omitted.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            ValueError: If an issue key is malformed
+            Exception: If there is an error retrieving the issues
+        """
+        keys = list(dict.fromkeys(key.strip() for key in issue_keys if key.strip()))
+        invalid_keys = [key for key in keys if not ISSUE_KEY_PATTERN.match(key)]
+        if invalid_keys:
+            msg = f"Invalid issue keys: {', '.join(invalid_keys)}"
+            raise ValueError(msg)
+        if not keys:
+            return []
+
+        try:
+            fields_param = self._resolve_issue_fields_param(fields, expand, None)
+            chunks = [
+                keys[i : i + MAX_SEARCH_PAGE_SIZE]
+                for i in range(0, len(keys), MAX_SEARCH_PAGE_SIZE)
+            ]
+            searches = [
+                (
+                    chunk,
+                    submit_blocking(
+                        self._search_issues_by_keys, chunk, fields_param, expand
+                    ),
+                )
+                for chunk in chunks
+            ]
+
+            fetched: list[dict] = []
+            for chunk, search in searches:
+                fetched.extend(
+                    self._chunk_search_result(chunk, search, fields_param, expand)
+                )
+            issues_by_key = {
+                str(issue.get("key", "")).upper(): issue for issue in fetched
+            }
+
+            matches = _match_requested_issues(
+                keys,
+                [
+                    (str(issue.get("id", "")), str(issue.get("key", "")))
+                    for issue in fetched
+                ],
+            )
+            unmatched = [
+                key for key in keys if key not in matches and not key.isdigit()
+            ]
+            if unmatched and len(set(matches.values())) < len(fetched):
+                # Returned issues that could not be attributed (several moved
+                # keys); single reads follow the moves to the current keys
+                self._read_moved_issues(
+                    unmatched, fetched, matches, fields_param, expand
+                )
+            if not_found is not None:
+                not_found.extend(key for key in keys if key not in matches)
+            issues = [
+                fetched[index]
+                for index in dict.fromkeys(
+                    matches[key] for key in keys if key in matches
+                )
+            ]
+            for issue in issues:
+                issue["fields"] = issue.get("fields") or {}
+
+            self._attach_comments_in_bulk(
+                issues, self._normalize_comment_limit(comment_limit)
+            )
+            self._attach_epics_in_bulk(issues, issues_by_key)
+
+            base_url = self.config.url if hasattr(self, "config") else None
+            return [
+                JiraIssue.from_api_response(
+                    issue, base_url=base_url, requested_fields=fields
+                )
+                for issue in issues
+            ]
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            else:
+                logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+                raise
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Error retrieving issues {', '.join(keys)}: {error_msg}")
+            raise Exception(f"Error retrieving issues: {error_msg}") from e
+
+    def _read_moved_issues(
+        self,
+        keys: list[str],
+        fetched: list[dict],
+        matches: dict[str, int],
+        fields_param: str,
+        expand: str | None,
+    ) -> None:
+        """
+        Attribute returned issues to requested keys with single reads.
+
+        Jira answers a read of an old key with the moved issue, so each
+        unmatched key is read and matched to the fetched issue with the same
+        ID. Keys that cannot be read stay unmatched.
+
+        Args:
+            keys: Requested keys no returned issue was attributed to
+            fetched: Raw issues returned by the searches, extended with issues
+                that are only found by the reads
+            matches: Index in fetched of each requested key, updated in place
+            fields_param: Comma-separated fields to return
+            expand: Fields to expand in the response
+        """
+        index_by_id = {str(issue.get("id", "")): i for i, issue in enumerate(fetched)}
+        reads = [
+            submit_blocking(
+                self.jira.get_issue,
+                key,
+                fields=fields_param,
+                expand=expand,
+                update_history=False,
+            )
+            for key in keys
+        ]
+        for key, read in zip(keys, reads, strict=True):
+            try:
+                issue = read.result()
+            except HTTPError as http_err:
+                if http_err.response is not None and http_err.response.status_code in [
+                    400,
+                    404,
+                ]:
+                    logger.warning(f"Issue {key} not found: {http_err}")
+                    continue
+                raise
+            if not isinstance(issue, dict):
+                continue
+            issue_id = str(issue.get("id", ""))
+            if issue_id not in index_by_id:
+                index_by_id[issue_id] = len(fetched)
+                fetched.append(issue)
+            matches[key] = index_by_id[issue_id]
+
+    def _search_issues_by_keys(
+        self, keys: list[str], fields_param: str, expand: str | None
+    ) -> list[dict]:
+        """
+        Fetch up to MAX_SEARCH_PAGE_SIZE issues with a single `key in (...)` search.
+
+        Args:
+            keys: Validated issue keys
+            fields_param: Comma-separated fields to return
+            expand: Fields to expand in the response
+
+        Returns:
+            Raw issue dictionaries as returned by the search API
+        """
+        jql = f"key in ({', '.join(keys)})"
+        if self.config.is_cloud:
+            issues = self.jira.enhanced_jql_get_list_of_tickets(
+                jql, fields=fields_param, limit=len(keys), expand=expand
+            )
+        else:
+            # "warn" turns unknown keys into warnings instead of failing the search
+            response = self.jira.jql(
+                jql,
+                fields=fields_param,
+                start=0,
+                limit=len(keys),
+                expand=expand,
+                validate_query="warn",
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            issues = response.get("issues", [])
+
+        if not isinstance(issues, list):
+            msg = f"Unexpected return value type from issue search: {type(issues)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return issues
+
+    def _chunk_search_result(
+        self,
+        keys: list[str],
+        search: Future[list[dict]],
+        fields_param: str,
+        expand: str | None,
+    ) -> list[dict]:
+        """
+        Get the result of a `key in (...)` search, falling back to single reads.
+
+        Jira rejects the whole search (HTTP 400) when one of the keys does not
+        exist, in which case the issues of that chunk are read one by one.
+        """
+        try:
+            return search.result()
+        except HTTPError as http_err:
+            if http_err.response is None or http_err.response.status_code != 400:
+                raise
+            logger.warning(
+                f"Search for {len(keys)} issue keys was rejected, "
+                f"reading them individually: {http_err}"
+            )
+
+        reads = [
+            submit_blocking(
+                self.jira.get_issue,
+                key,
+                fields=fields_param,
+                expand=expand,
+                update_history=False,
+            )
+            for key in keys
+        ]
+        issues = []
+        for key, read in zip(keys, reads, strict=True):
+            try:
+                issue = read.result()
+            except HTTPError as http_err:
+                if http_err.response is not None and http_err.response.status_code in [
+                    400,
+                    404,
+                ]:
+                    logger.warning(f"Issue {key} not found: {http_err}")
+                    continue
+                raise
+            if isinstance(issue, dict):
+                issues.append(issue)
+        return issues
+
+    def _attach_comments_in_bulk(
+        self, issues: list[dict], comment_limit: int | None
+    ) -> None:
+        """
+        Apply the comment limit to comments embedded in search results.
+
+        Issues whose embedded comments are incomplete have their comments fetched
+        separately, concurrently.
+
+        Args:
+            issues: Raw issue dictionaries to update in place
+            comment_limit: Maximum number of comments to include, None for all
+        """
+        incomplete: list[dict] = []
+        for issue in issues:
+            comment_field = issue["fields"].get("comment")
+            if not isinstance(comment_field, dict):
+                continue
+            comments = comment_field.get("comments") or []
+            total = comment_field.get("total", len(comments))
+            wanted = total if comment_limit is None else min(comment_limit, total)
+            if isinstance(wanted, int) and wanted > len(comments):
+                incomplete.append(issue)
+            else:
+                comment_field["comments"] = comments[:comment_limit]
+
+        fetches = [
+            submit_blocking(
+                self._get_issue_comments_if_needed, issue["key"], comment_limit
+            )
+            for issue in incomplete
+        ]
+        for issue, fetch in zip(incomplete, fetches, strict=True):
+            issue["fields"]["comment"]["comments"] = fetch.result()
+
+    def _attach_epics_in_bulk(
+        self, issues: list[dict], issues_by_key: dict[str, dict]
+    ) -> None:
+        """
+        Add the epic name of linked epics to issues, with one search for all epics.
+
+        Args:
+            issues: Raw issue dictionaries to update in place
+            issues_by_key: Already fetched issues by upper-case key, reused as epics
+        """
+        try:
+            field_ids = self.get_field_ids_to_epic()
+        except Exception as e:
+            logger.warning(f"Error getting Jira fields: {str(e)}")
+            return
+
+        epic_link_field = field_ids.get("epic_link")
+        epic_name_field = field_ids.get("epic_name")
+        if not epic_link_field or not epic_name_field:
+            return
+
+        linked: list[tuple[dict, str]] = []
+        for issue in issues:
+            fields_data = issue["fields"]
+            issue_type = (fields_data.get("issuetype") or {}).get("name", "")
+            epic_key = fields_data.get(epic_link_field)
+            if (
+                issue_type.lower() != "epic"
+                and isinstance(epic_key, str)
+                and epic_key
+                and epic_name_field not in fields_data
+            ):
+                linked.append((issue, epic_key))
+        if not linked:
+            return
+
+        # Epics that are part of the batch itself need no further request
+        memo = {
+            key: self._epic_details(issue, epic_name_field)
+            for key, issue in issues_by_key.items()
+            if epic_name_field in issue["fields"]
+        }
+        epics = self._resolve_epics(
+            [epic_key for _, epic_key in linked], field_ids, memo
+        )
+
+        for issue, epic_key in linked:
+            details = epics.get(epic_key.upper())
+            if details is None:
+                continue
+            epic_info = {"epic_key": epic_key, "epic_name": details["name"]}
+            self._add_epic_fields(issue["fields"], epic_info, field_ids)
+
+    @staticmethod
+    def _epic_details(
+        epic: dict[str, Any], epic_name_field: str | None
+    ) -> dict[str, str | None]:
+        """Extract the cached details (name, summary, status) from raw epic data."""
+        epic_fields = epic.get("fields", {}) or {}
+        return {
+            "name": epic_fields.get(epic_name_field, "") if epic_name_field else None,
+            "summary": epic_fields.get("summary", ""),
+            "status": (epic_fields.get("status") or {}).get("name"),
+        }
+
+    def _resolve_epics(
+        self,
+        epic_keys: Iterable[str],
+        field_ids: dict[str, str],
+        memo: dict[str, dict[str, str | None]] | None = None,
+    ) -> dict[str, dict[str, str | None]]:
+        """
+        Look up the name, summary and status of epics.
+
+        Epics are served from ``memo`` (details already known to the current
+        request), then from a short-lived cache shared by fetchers using the
+        same credentials (JIRA_EPIC_CACHE_TTL). The remaining epics are fetched
+        with a single JQL search, or a single issue read when only one is left.
+
+        Args:
+            epic_keys: Keys of the epics to resolve (duplicates are fine)
+            field_ids: Epic field IDs as returned by `get_field_ids_to_epic`
+            memo: Optional per-request memo, updated with every resolved epic
+
+        Returns:
+            Epic details by upper-case epic key. Epics that could not be fetched
+            are missing.
+        """
+        memo = {} if memo is None else memo
+        epic_name_field = field_ids.get("epic_name")
+        fingerprint = config_fingerprint(getattr(self, "config", None))
+
+        def cache_key(epic_key: str) -> tuple[str, str, str] | None:
+            if fingerprint is None:
+                return None
+            return (fingerprint, epic_name_field or "", epic_key.upper())
+
+        resolved: dict[str, dict[str, str | None]] = {}
+        missing: dict[str, str] = {}
+        for epic_key in epic_keys:
+            upper_key = epic_key.upper()
+            if upper_key in resolved or upper_key in missing:
+                continue
+            key = cache_key(epic_key)
+            details = memo.get(upper_key) or (
+                _epic_cache.get(key) if key is not None else None
+            )
+            if details is not None:
+                resolved[upper_key] = memo[upper_key] = details
+            elif ISSUE_KEY_PATTERN.match(epic_key):
+                missing[upper_key] = epic_key
+
+        if not missing:
+            return resolved
+
+        fields_param = ",".join(
+            ["summary", "status", *([epic_name_field] if epic_name_field else [])]
+        )
+        fetched: list[dict] = []
+        if len(missing) == 1:
+            epic_key = next(iter(missing.values()))
+            try:
+                epic = self.jira.get_issue(
+                    epic_key,
+                    expand=None,
+                    fields=fields_param,
+                    properties=None,
+                    update_history=False,
+                )
+                if not isinstance(epic, dict):
+                    msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+                fetched.append({"key": epic_key, **epic})
+            except Exception as e:
+                logger.warning(f"Error getting epic details for {epic_key}: {str(e)}")
+        else:
+            keys = sorted(missing.values())
+            for i in range(0, len(keys), MAX_SEARCH_PAGE_SIZE):
+                chunk = keys[i : i + MAX_SEARCH_PAGE_SIZE]
+                try:
+                    fetched.extend(
+                        self._search_issues_by_keys(chunk, fields_param, None)
+                    )
+                except Exception as e:
+                    logger.warning(f"Error getting epic details for {chunk}: {str(e)}")
+
+        for epic in fetched:
+            upper_key = str(epic.get("key", "")).upper()
+            details = self._epic_details(epic, epic_name_field)
+            resolved[upper_key] = memo[upper_key] = details
+            key = cache_key(upper_key)
+            if key is not None:
+                _epic_cache.set(key, details)
+
+        return resolved
+
     def _normalize_comment_limit(self, comment_limit: int | str | None) -> int | None:
         """
         Normalize the comment limit to an integer or None.
@@ -310,33 +869,13 @@ class IssuesMixin(
                     epic_key = fields[epic_link_field]
                     epic_info["epic_key"] = epic_key
 
-                    # Try to get epic details
-                    try:
-                        epic = self.jira.get_issue(
-                            epic_key,
-                            expand=None,
-                            fields=None,
-                            properties=None,
-                            update_history=True,
-                        )
-                        if not isinstance(epic, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
-
-                        epic_fields = epic.get("fields", {}) or {}
-
-                        # Get epic name using the discovered field ID
-                        if "epic_name" in field_ids:
-                            epic_info["epic_name"] = epic_fields.get(
-                                field_ids["epic_name"], ""
-                            )
-
-                        epic_info["epic_summary"] = epic_fields.get("summary", "")
-                    except Exception as e:
-                        logger.warning(
-                            f"Error getting epic details for {epic_key}: {str(e)}"
-                        )
+                    # Get epic details (memoized and shared between requests)
+                    details = self._resolve_epics([epic_key], field_ids).get(
+                        epic_key.upper()
+                    )
+                    if details is not None:
+                        epic_info["epic_name"] = details["name"]
+                        epic_info["epic_summary"] = details["summary"]
         except Exception as e:
             logger.warning(f"Error extracting epic information: {str(e)}")
 
@@ -633,6 +1172,18 @@ class IssuesMixin(
             # Process **kwargs using the dynamic field map
             self._process_additional_fields(fields, kwargs_copy)
 
+            # Validate and complete the fields using the cached create metadata
+            self._apply_create_metadata(
+                fields,
+                project_key,
+                issue_type,
+                deferred_fields=[
+                    value
+                    for key, value in kwargs.items()
+                    if key.startswith("__epic_") and key.endswith("_field")
+                ],
+            )
+
             # description이 ADF 문서면 직접 API 호출
             if "description" in fields and self._is_adf_document(fields["description"]):
                 response = self._create_issue_with_adf(fields)
@@ -675,6 +1226,100 @@ class IssuesMixin(
             self._handle_create_issue_error(e, issue_type)
             raise  # Re-raise after logging
 
+    def _apply_create_metadata(
+        self,
+        fields: dict[str, Any],
+        project_key: str,
+        issue_type: str,
+        deferred_fields: Iterable[str] = (),
+    ) -> None:
+        """
+        Validate and complete issue fields using the project's create metadata.
+
+        The metadata is cached (see JIRA_PROJECT_METADATA_CACHE_TTL), so this
+        usually needs no request. The issue type name is matched
+        case-insensitively (or as an ID) and replaced by its ID, and plain
+        strings given for option fields are wrapped as ``{"value": ...}``.
+        Nothing is checked when the metadata cannot be loaded.
+
+        Args:
+            fields: The fields dictionary to update
+            project_key: The key of the project
+            issue_type: The issue type name or ID
+            deferred_fields: Field IDs set after creation (e.g. Epic fields)
+
+        Raises:
+            ValueError: If the issue type does not exist in the project, or
+                required fields without a default value are missing
+        """
+        issue_types = self.get_project_issue_types(project_key)
+        if not issue_types:
+            return
+        wanted = issue_type.lower()
+        match = next(
+            (
+                it
+                for it in issue_types
+                if it.get("id") == issue_type
+                or str(it.get("name", "")).lower() == wanted
+            ),
+            None,
+        )
+        if match is None or not match.get("id"):
+            available = ", ".join(str(it.get("name")) for it in issue_types)
+            raise ValueError(
+                f"Issue type '{issue_type}' is not available in project "
+                f"{project_key}. Available issue types: {available}"
+            )
+        fields["issuetype"] = {"id": match["id"]}
+
+        try:
+            meta = self.get_issue_type_fields(project_key, match["id"])
+        except Exception as e:  # noqa: BLE001 - Validation is best-effort
+            logger.debug(f"Could not load field metadata of {project_key}: {e}")
+            return
+        field_metas = meta.get("fields") or meta.get("values") or []
+        if not isinstance(field_metas, list):
+            return
+
+        missing = []
+        for field_meta in field_metas:
+            if not isinstance(field_meta, dict):
+                continue
+            field_id = field_meta.get("fieldId") or field_meta.get("key")
+            if not field_id:
+                continue
+            if field_id in fields:
+                fields[field_id] = self._format_option_value(
+                    fields[field_id], field_meta.get("schema") or {}
+                )
+            elif (
+                field_meta.get("required")
+                and not field_meta.get("hasDefaultValue")
+                and field_id not in deferred_fields
+                and field_id != "reporter"
+            ):
+                missing.append(f"{field_meta.get('name', field_id)} ({field_id})")
+        if missing:
+            raise ValueError(
+                f"Missing required fields for {match.get('name')} in project "
+                f"{project_key}: {', '.join(missing)}"
+            )
+
+    @staticmethod
+    def _format_option_value(value: Any, schema: dict[str, Any]) -> Any:
+        """Wrap plain strings given for option (select list) fields."""
+        schema_type = schema.get("type")
+        if schema_type == "option" and isinstance(value, str):
+            return {"value": value}
+        if (
+            schema_type == "array"
+            and schema.get("items") == "option"
+            and isinstance(value, list)
+        ):
+            return [{"value": v} if isinstance(v, str) else v for v in value]
+        return value
+
     def _prepare_epic_fields(
         self, fields: dict[str, Any], summary: str, kwargs: dict[str, Any]
     ) -> None:
@@ -1273,9 +1918,21 @@ class IssuesMixin(
         self,
         issues: list[dict[str, Any]],
         validate_only: bool = False,
+        hydrate: bool = True,
+        failed: list[dict[str, Any]] | None = None,
     ) -> list[JiraIssue]:
         """Create multiple Jira issues in a batch.
 
+        Issues are created with bulk requests of up to 50 issues each, issued
+        concurrently. The created issues are then read back with `key in (...)`
+        searches (see :meth:`batch_get_issues`), and those not yet in the
+        search index one by one.
+
+        Issues that cannot be prepared, that Jira rejects, or whose bulk
+        request fails are left out of the result and reported in failed. The
+        call only raises if no issue can be prepared or no bulk request
+        succeeds.
+
         Args:
             issues: List of issue dictionaries, each containing:
                 - project_key (str): Key of the project
@@ -1286,20 +1943,40 @@ class IssuesMixin(
                 - components (list[str], optional): List of component names
                 - **kwargs: Additional fields specific to your Jira instance
             validate_only: If True, only validates the issues without creating them
+            hydrate: If False, the created issues are not read back and only
+                carry the ID and key returned by the create requests
+            failed: Optional list, extended with one entry per issue that was
+                not created: its index in issues (None when Jira does not
+                say which issue failed), its summary and the error
 
         Returns:
-            List of created JiraIssue objects
+            List of created JiraIssue objects, in the order of issues, without
+            the issues that failed to be created
 
         Raises:
-            ValueError: If any required fields are missing or invalid
+            ValueError: If required fields are missing or invalid for every
+                issue (or for any issue when validate_only is set)
             MCPAtlassianAuthenticationError: If authentication fails
         """
         if not issues:
             return []
 
-        # Prepare issues for bulk creation
+        # Resolve every distinct assignee once, concurrently
+        account_ids = self.resolve_account_ids(
+            issue_data.get("assignee")
+            for issue_data in issues
+            if isinstance(issue_data, dict)
+        )
+
+        if failed is None:
+            failed = []
+
+        # Prepare issues for bulk creation, remembering the index of each
         issue_updates = []
-        for issue_data in issues:
+        positions: list[int] = []
+        preparation_errors: list[Exception] = []
+        for position, issue_data in enumerate(issues):
+            summary = None
             try:
                 # Extract and validate required fields
                 project_key = issue_data.pop("project_key", None)
@@ -1326,14 +2003,15 @@ class IssuesMixin(
                 if description:
                     fields["description"] = description
 
-                # Add assignee if provided
+                # Add assignee if provided (accountId for cloud, name for server)
                 if assignee:
-                    try:
-                        # _get_account_id now returns the correct identifier (accountId for cloud, name for server)
-                        assignee_identifier = self._get_account_id(assignee)
+                    assignee_identifier = account_ids.get(assignee)
+                    if assignee_identifier:
                         self._add_assignee_to_fields(fields, assignee_identifier)
-                    except ValueError as e:
-                        logger.warning(f"Could not assign issue: {str(e)}")
+                    else:
+                        logger.warning(
+                            f"Could not assign issue: no account ID for user {assignee}"
+                        )
 
                 # Add components if provided
                 if components:
@@ -1350,6 +2028,7 @@ class IssuesMixin(
 
                 # Add any remaining custom fields
                 self._process_additional_fields(fields, issue_data)
+                self._apply_create_metadata(fields, project_key, issue_type)
 
                 if validate_only:
                     # For validation, just log the issue that would be created
@@ -1360,61 +2039,154 @@ class IssuesMixin(
 
                 # Add to bulk creation list
                 issue_updates.append({"fields": fields})
+                positions.append(position)
 
             except Exception as e:
                 logger.error(f"Failed to prepare issue for creation: {str(e)}")
-                if not issue_updates:
-                    raise
+                preparation_errors.append(e)
+                failed.append({"index": position, "summary": summary, "error": str(e)})
+
+        if preparation_errors and not issue_updates:
+            raise preparation_errors[0]
 
         if validate_only:
             return []
 
         try:
-            # Call Jira's bulk create endpoint
-            response = self.jira.create_issues(issue_updates)
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
+            # Call Jira's bulk create endpoint, one request per chunk
+            chunks = [
+                issue_updates[i : i + MAX_BULK_CREATE_SIZE]
+                for i in range(0, len(issue_updates), MAX_BULK_CREATE_SIZE)
+            ]
+            pending = [
+                submit_blocking(self.jira.create_issues, chunk) for chunk in chunks
+            ]
+
+            created: list[dict[str, Any]] = []
+            failures: list[Exception] = []
+            for index, future in enumerate(pending):
+                offset = index * MAX_BULK_CREATE_SIZE
+                chunk = chunks[index]
+                chunk_positions = positions[offset : offset + len(chunk)]
+                try:
+                    response = future.result()
+                    if not isinstance(response, dict):
+                        msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
+                        logger.error(msg)
+                        raise TypeError(msg)
+                except Exception as e:
+                    logger.error(
+                        f"Bulk creation of issues {offset + 1}-"
+                        f"{offset + len(chunk)} failed: {str(e)}"
+                    )
+                    failures.append(e)
+                    failed.extend(
+                        {
+                            "index": position,
+                            "summary": update["fields"]["summary"],
+                            "error": str(e),
+                        }
+                        for position, update in zip(chunk_positions, chunk, strict=True)
+                    )
+                    continue
 
-            # Process results
-            created_issues = []
-            for issue_info in response.get("issues", []):
-                issue_key = issue_info.get("key")
-                if issue_key:
-                    try:
-                        # Fetch the full issue data
-                        issue_data = self.jira.get_issue(issue_key)
-                        if not isinstance(issue_data, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
-
-                        created_issues.append(
-                            JiraIssue.from_api_response(
-                                issue_data,
-                                base_url=(
-                                    self.config.url if hasattr(self, "config") else None
-                                ),
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching created issue {issue_key}: {str(e)}"
-                        )
+                created.extend(
+                    issue_info
+                    for issue_info in response.get("issues", [])
+                    if issue_info.get("key")
+                )
+                # Report the issues Jira rejected
+                for error in response.get("errors", []):
+                    logger.error(f"Bulk creation error (offset {offset}): {error}")
+                    element = error.get("failedElementNumber")
+                    known = isinstance(element, int) and 0 <= element < len(chunk)
+                    failed.append(
+                        {
+                            "index": chunk_positions[element] if known else None,
+                            "summary": (
+                                chunk[element]["fields"]["summary"] if known else None
+                            ),
+                            "error": self._bulk_error_message(error),
+                        }
+                    )
 
-            # Log any errors from the bulk creation
-            errors = response.get("errors", [])
-            if errors:
-                for error in errors:
-                    logger.error(f"Bulk creation error: {error}")
+            if failures and not created:
+                raise failures[0]
 
-            return created_issues
+            return self._created_issues(created, hydrate)
 
         except Exception as e:
             logger.error(f"Error in bulk issue creation: {str(e)}")
             raise
 
+    @staticmethod
+    def _bulk_error_message(error: dict[str, Any]) -> str:
+        """Get a readable message from an error entry of a bulk create response."""
+        element_errors = error.get("elementErrors")
+        if not isinstance(element_errors, dict):
+            return str(error.get("error") or error)
+        messages = list(element_errors.get("errorMessages") or [])
+        messages.extend(
+            f"{field}: {message}"
+            for field, message in (element_errors.get("errors") or {}).items()
+        )
+        return "; ".join(messages) or str(error)
+
+    def _created_issues(
+        self, created: list[dict[str, Any]], hydrate: bool
+    ) -> list[JiraIssue]:
+        """
+        Build the models of issues returned by bulk create requests.
+
+        Args:
+            created: The 'issues' entries of the create responses (id, key, self)
+            hydrate: Whether to read the full issues back from Jira
+
+        Returns:
+            JiraIssue models in the order of created. Without hydration, or
+            when an issue cannot be read back, they only carry the ID and key.
+        """
+        base_url = self.config.url if hasattr(self, "config") else None
+        if not created:
+            return []
+
+        hydrated: dict[str, JiraIssue] = {}
+        if hydrate:
+            try:
+                issues = self.batch_get_issues(
+                    [issue_info["key"] for issue_info in created], fields="*all"
+                )
+                hydrated = {issue.key.upper(): issue for issue in issues if issue.key}
+            except Exception as e:
+                logger.error(f"Error fetching created issues: {str(e)}")
+
+            # The search index can lag behind new issues, so read the issues
+            # the search did not return one by one
+            missing = [
+                issue_info["key"]
+                for issue_info in created
+                if issue_info["key"].upper() not in hydrated
+            ]
+            pending = {
+                key: submit_blocking(self.jira.get_issue, key) for key in missing
+            }
+            for key, future in pending.items():
+                try:
+                    hydrated[key.upper()] = JiraIssue.from_api_response(
+                        future.result(), base_url=base_url
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Could not read created issue {key} back, "
+                        f"returning its ID and key only: {str(e)}"
+                    )
+
+        return [
+            hydrated.get(issue_info["key"].upper())
+            or JiraIssue.from_api_response(issue_info, base_url=base_url)
+            for issue_info in created
+        ]
+
     def batch_get_changelogs(
         self, issue_ids_or_keys: list[str], fields: list[str] | None = None
     ) -> list[JiraIssue]:
@@ -1431,28 +2203,12 @@ class IssuesMixin(
         Returns:
             List of JiraIssue objects that only contain changelogs and id
         """
-
-        if not self.config.is_cloud:
-            error_msg = "Batch get issue changelogs is only available on Jira Cloud."
-            logger.error(error_msg)
-            raise NotImplementedError(error_msg)
-
-        # Get paged api results
-        paged_api_results = self.get_paged(
-            method="post",
-            url=self.jira.resource_url("changelog/bulkfetch"),
-            params_or_json={
-                "fieldIds": fields,
-                "issueIdsOrKeys": issue_ids_or_keys,
-            },
-        )
-
         # Save (issue_id, changelogs)
         issue_changelog_results: defaultdict[str, list[JiraChangelog]] = defaultdict(
             list
         )
 
-        for api_result in paged_api_results:
+        for api_result in self._get_changelog_pages(issue_ids_or_keys, fields):
             for data in api_result.get("issueChangeLogs", []):
                 issue_id = data.get("issueId", "")
                 changelogs = [
@@ -1468,3 +2224,76 @@ class IssuesMixin(
         ]
 
         return issues
+
+    def batch_get_changelog_records(
+        self,
+        issue_ids_or_keys: list[str],
+        fields: list[str] | None = None,
+        limit: int | None = None,
+        interner: RecordInterner | None = None,
+    ) -> list[JiraIssueRecord]:
+        """
+        Get changelogs for multiple issues in a batch, as compact records.
+
+        Like :meth:`batch_get_changelogs`, but every changelog entry is frozen
+        as soon as it is read, sharing authors, items and repeated strings
+        across all issues. Use it for many issues with long histories.
+
+        Warning:
+            This function is only available on Jira Cloud.
+
+        Args:
+            issue_ids_or_keys: List of issue IDs or keys
+            fields: Filter the changelogs by fields, e.g. ['status', 'assignee'],
+                None for all fields
+            limit: Maximum number of changelogs kept per issue, None for all
+            interner: Interner to share values with records created elsewhere,
+                a new one is used by default
+
+        Returns:
+            JiraIssueRecord objects with the id and changelogs of each issue
+        """
+        if interner is None:
+            interner = RecordInterner()
+
+        changelogs_by_issue: defaultdict[str, list[Any]] = defaultdict(list)
+        for api_result in self._get_changelog_pages(issue_ids_or_keys, fields):
+            for data in api_result.get("issueChangeLogs", []):
+                changelogs = changelogs_by_issue[data.get("issueId", "")]
+                for changelog_data in data.get("changeHistories", []):
+                    if limit is not None and len(changelogs) >= limit:
+                        break
+                    changelogs.append(
+                        interner.freeze(
+                            JiraChangelog.simplify_api_response(changelog_data)
+                        )
+                    )
+
+        keys = interner.freeze_keys(("id", "changelogs"))
+        return [
+            JiraIssueRecord(keys, (interner.freeze(issue_id), tuple(changelogs)))
+            for issue_id, changelogs in changelogs_by_issue.items()
+        ]
+
+    def _get_changelog_pages(
+        self, issue_ids_or_keys: list[str], fields: list[str] | None
+    ) -> Iterator[dict]:
+        """
+        Lazily get the pages of the bulk changelog API (Jira Cloud only).
+
+        Pages are requested as they are consumed, so that each page can be
+        released once its entries have been processed.
+        """
+        if not self.config.is_cloud:
+            error_msg = "Batch get issue changelogs is only available on Jira Cloud."
+            logger.error(error_msg)
+            raise NotImplementedError(error_msg)
+
+        yield from self.iter_paged(
+            "post",
+            self.jira.resource_url("changelog/bulkfetch"),
+            params_or_json={
+                "fieldIds": fields,
+                "issueIdsOrKeys": issue_ids_or_keys,
+            },
+        )
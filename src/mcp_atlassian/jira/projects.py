@@ -1,15 +1,246 @@
 """Module for Jira project operations."""
 
 import logging
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
+from ..utils.cache import SharedTTLCache, config_fingerprint
+from ..utils.concurrency import submit_blocking
+from ..utils.environment import get_int_env
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Expansion issue_createmeta() requests when none is given
+CREATEMETA_EXPAND = "projects.issuetypes.fields"
+
+# (credentials, project key, issue type ID, expand)
+ProjectMetadataKey = tuple[str, str, str, str]
+
+# Keys kept when create metadata is projected. Everything else (self links,
+# icons, avatars, expand hints) is dropped, and fixVersions is left out.
+CREATEMETA_PROJECT_KEYS = frozenset({"id", "key", "name", "issuetypes"})
+CREATEMETA_ISSUE_TYPE_KEYS = frozenset(
+    {"id", "name", "description", "subtask", "hierarchyLevel", "fields"}
+)
+CREATEMETA_FIELD_KEYS = frozenset(
+    {
+        "fieldId",
+        "key",
+        "name",
+        "required",
+        "schema",
+        "hasDefaultValue",
+        "defaultValue",
+        "operations",
+        "allowedValues",
+        "autoCompleteUrl",
+    }
+)
+ALLOWED_VALUE_KEYS = frozenset({"id", "key", "name", "value", "disabled", "children"})
+OMITTED_CREATE_FIELDS = frozenset({"fixVersions"})
+
+
+def get_max_allowed_values() -> int:
+    """Get the number of allowed values kept per field in create metadata.
+
+    Controlled by JIRA_CREATEMETA_MAX_ALLOWED_VALUES. ``0`` keeps all of them.
+    """
+    return get_int_env("JIRA_CREATEMETA_MAX_ALLOWED_VALUES", 50)
+
+
+def _project_allowed_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    projected = {k: v for k, v in value.items() if k in ALLOWED_VALUE_KEYS}
+    if isinstance(projected.get("children"), list):
+        projected["children"] = [
+            _project_allowed_value(child) for child in projected["children"]
+        ]
+    return projected
+
+
+def _project_field(field: dict[str, Any], max_allowed_values: int) -> dict[str, Any]:
+    projected = {k: v for k, v in field.items() if k in CREATEMETA_FIELD_KEYS}
+    allowed_values = projected.get("allowedValues")
+    if isinstance(allowed_values, list):
+        if 0 < max_allowed_values < len(allowed_values):
+            projected["allowedValuesTotal"] = len(allowed_values)
+            allowed_values = allowed_values[:max_allowed_values]
+        projected["allowedValues"] = [
+            _project_allowed_value(value) for value in allowed_values
+        ]
+    return projected
+
+
+def _project_fields(fields: Any, max_allowed_values: int) -> Any:
+    """Project the fields of an issue type, given as a dict or a list."""
+    if isinstance(fields, dict):
+        return {
+            field_id: _project_field(field, max_allowed_values)
+            for field_id, field in fields.items()
+            if field_id not in OMITTED_CREATE_FIELDS and isinstance(field, dict)
+        }
+    if isinstance(fields, list):
+        return [
+            _project_field(field, max_allowed_values)
+            for field in fields
+            if isinstance(field, dict)
+            and (field.get("fieldId") or field.get("key")) not in OMITTED_CREATE_FIELDS
+        ]
+    return fields
+
+
+def project_createmeta(createmeta: Any) -> Any:
+    """Reduce an ``issue_createmeta`` response to what the tools return.
+
+    Only known keys are kept at each level, fixVersions is dropped and long
+    ``allowedValues`` lists are cut to JIRA_CREATEMETA_MAX_ALLOWED_VALUES
+    entries (``allowedValuesTotal`` then holds the original length).
+    """
+    if not isinstance(createmeta, dict):
+        return createmeta
+    max_allowed_values = get_max_allowed_values()
+    projects = []
+    for project in createmeta.get("projects") or []:
+        projected_project = {
+            k: v for k, v in project.items() if k in CREATEMETA_PROJECT_KEYS
+        }
+        issue_types = []
+        for issue_type in project.get("issuetypes") or []:
+            projected_type = {
+                k: v for k, v in issue_type.items() if k in CREATEMETA_ISSUE_TYPE_KEYS
+            }
+            if "fields" in projected_type:
+                projected_type["fields"] = _project_fields(
+                    projected_type["fields"], max_allowed_values
+                )
+            issue_types.append(projected_type)
+        if "issuetypes" in project:
+            projected_project["issuetypes"] = issue_types
+        projects.append(projected_project)
+    return {"projects": projects}
+
+
+def project_field_types(field_types: Any) -> Any:
+    """Reduce an ``issue_createmeta_fieldtypes`` response like createmeta."""
+    if not isinstance(field_types, dict):
+        return field_types
+    max_allowed_values = get_max_allowed_values()
+    projected = {
+        k: v
+        for k, v in field_types.items()
+        if k in ("startAt", "maxResults", "total", "isLast")
+    }
+    for key in ("fields", "values"):
+        if key in field_types:
+            projected[key] = _project_fields(field_types[key], max_allowed_values)
+    return projected
+
+
+def get_project_metadata_ttl() -> int:
+    """Get the number of seconds after which create metadata is refreshed.
+
+    Controlled by JIRA_PROJECT_METADATA_CACHE_TTL. ``0`` disables the cache.
+    """
+    return get_int_env("JIRA_PROJECT_METADATA_CACHE_TTL", 900)
+
+
+class ProjectMetadata:
+    """Create metadata of a project (or of one issue type in a project)."""
+
+    __slots__ = ("payload", "built_at")
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+        self.built_at = time.monotonic()
+
+    def age(self) -> float:
+        """Seconds since the metadata was fetched."""
+        return time.monotonic() - self.built_at
+
+
+# Create metadata by ProjectMetadataKey. Stale metadata keeps answering (for up
+# to three more refresh intervals) while it is fetched again in the background.
+_project_metadata: SharedTTLCache[ProjectMetadataKey, ProjectMetadata] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_PROJECT_METADATA_CACHE_SIZE", 512),
+    ttl=lambda: get_project_metadata_ttl() * 4,
+)
+_refreshing: set[ProjectMetadataKey] = set()
+_refreshing_lock = threading.Lock()
+
+
+def _load_project_metadata(load: Callable[[], Any]) -> ProjectMetadata:
+    payload = load()
+    if not isinstance(payload, dict):
+        msg = f"Unexpected create metadata response type: {type(payload)}"
+        raise TypeError(msg)
+    return ProjectMetadata(payload)
+
+
+def _refresh_project_metadata(key: ProjectMetadataKey, load: Callable[[], Any]) -> None:
+    try:
+        _project_metadata.set(key, _load_project_metadata(load))
+    except Exception as e:  # noqa: BLE001 - Keep serving the stale metadata
+        logger.warning(f"Error refreshing create metadata of {key[1]}: {str(e)}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(key)
+
+
+def get_project_metadata(
+    key: ProjectMetadataKey | None, load: Callable[[], Any]
+) -> dict[str, Any]:
+    """Get create metadata, shared by every fetcher using the same credentials.
+
+    The first call for a key runs ``load``. Afterwards the metadata is served
+    from memory and, once older than JIRA_PROJECT_METADATA_CACHE_TTL, fetched
+    again in the background while the previous metadata keeps answering.
+
+    Args:
+        key: The cache key, or None to always call ``load``
+        load: Fetches the metadata from Jira
+
+    Returns:
+        The metadata. It is shared and must not be modified.
+
+    Raises:
+        TypeError: If ``load`` does not return a dictionary
+    """
+    if key is None:
+        return _load_project_metadata(load).payload
+    metadata = _project_metadata.get(key)
+    if metadata is None:
+        metadata = _load_project_metadata(load)
+        _project_metadata.set(key, metadata)
+    elif metadata.age() >= get_project_metadata_ttl():
+        with _refreshing_lock:
+            start_refresh = key not in _refreshing
+            _refreshing.add(key)
+        if start_refresh:
+            submit_blocking(_refresh_project_metadata, key, load)
+    return metadata.payload
+
+
+def get_project_members_ttl() -> int:
+    """Get the number of seconds the members of a project are cached.
+
+    Controlled by JIRA_PROJECT_MEMBERS_CACHE_TTL. ``0`` disables the cache.
+    """
+    return get_int_env("JIRA_PROJECT_MEMBERS_CACHE_TTL", 300)
+
+
+# Members of all roles of a project by (credentials, project key)
+_project_members: SharedTTLCache[tuple[str, str], dict[str, Any]] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_PROJECT_MEMBERS_CACHE_SIZE", 256),
+    ttl=get_project_members_ttl,
+)
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -18,6 +249,65 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
     including project details, components, versions, and other project-related operations.
     """
 
+    def _project_metadata_key(
+        self, project_key: str, issue_type_id: str = "", expand: str | None = None
+    ) -> ProjectMetadataKey | None:
+        fingerprint = config_fingerprint(self.config)
+        if fingerprint is None:
+            return None
+        return (fingerprint, project_key.upper(), str(issue_type_id), expand or "")
+
+    def get_project_createmeta(
+        self, project_key: str, expand: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Get the create metadata of a project.
+
+        The response is projected (see :func:`project_createmeta`), cached
+        (see JIRA_PROJECT_METADATA_CACHE_TTL) and shared by all fetchers using
+        the same credentials.
+
+        Args:
+            project_key: The project key
+            expand: Optional expansions (Jira's default is
+                'projects.issuetypes.fields')
+
+        Returns:
+            The createmeta response. It is shared and must not be modified.
+        """
+        kwargs = {"project": project_key}
+        if expand:
+            kwargs["expand"] = expand
+        return get_project_metadata(
+            self._project_metadata_key(project_key, expand=expand or CREATEMETA_EXPAND),
+            lambda: project_createmeta(self.jira.issue_createmeta(**kwargs)),
+        )
+
+    def get_issue_type_fields(
+        self, project_key: str, issue_type_id: str
+    ) -> dict[str, Any]:
+        """
+        Get the fields available when creating issues of a type in a project.
+
+        The response is cached like :meth:`get_project_createmeta`.
+
+        Args:
+            project_key: The project key
+            issue_type_id: The issue type ID
+
+        Returns:
+            The createmeta field types response. It is shared and must not be
+            modified.
+        """
+        return get_project_metadata(
+            self._project_metadata_key(project_key, issue_type_id),
+            lambda: project_field_types(
+                self.jira.issue_createmeta_fieldtypes(
+                    project=project_key, issue_type_id=issue_type_id
+                )
+            ),
+        )
+
     def get_all_projects(self, include_archived: bool = False) -> list[dict[str, Any]]:
         """
         Get all projects visible to the current user.
@@ -150,6 +440,89 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             logger.error(f"Error getting roles for project {project_key}: {str(e)}")
             return {}
 
+    def get_project_members(self, project_key: str) -> dict[str, Any]:
+        """
+        Get the unique users of a project, aggregated over all its roles.
+
+        The members of the roles are requested concurrently. Complete results
+        are cached (see JIRA_PROJECT_MEMBERS_CACHE_TTL) and shared by all
+        fetchers using the same credentials.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            A dictionary with the unique ``members`` (each with 'displayName'
+            and 'accountId') and the ``failed_roles`` whose members could not
+            be read (each with 'role', 'role_id' and 'error'). It is shared
+            and must not be modified.
+
+        Raises:
+            Exception: If the roles of the project cannot be read
+        """
+        fingerprint = config_fingerprint(self.config)
+        cache_key = (fingerprint, project_key.upper()) if fingerprint else None
+        if cache_key is not None:
+            cached = _project_members.get(cache_key)
+            if cached is not None:
+                return cached
+
+        roles = self.jira.get_project_roles(project_key=project_key)
+        if not isinstance(roles, dict):
+            roles = {}
+
+        pending = []
+        for role_name, role_url in roles.items():
+            # e.g. "https://.../rest/api/2/project/KEY/role/10000"
+            role_id = str(role_url).rstrip("/").split("/")[-1]
+            if role_id.isdigit():
+                pending.append(
+                    (
+                        role_name,
+                        role_id,
+                        submit_blocking(
+                            self.jira.get_project_actors_for_role_project,
+                            project_key=project_key,
+                            role_id=role_id,
+                        ),
+                    )
+                )
+
+        members: dict[str, dict[str, str]] = {}
+        failed_roles: list[dict[str, str]] = []
+        for role_name, role_id, future in pending:
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.warning(
+                    f"Error getting members of role {role_name} in project "
+                    f"{project_key}: {str(e)}"
+                )
+                failed_roles.append(
+                    {"role": role_name, "role_id": role_id, "error": str(e)}
+                )
+                continue
+            actors = []
+            if isinstance(response, dict):
+                actors = response.get("actors", [])
+            elif isinstance(response, list):
+                actors = response
+            for actor in actors:
+                if actor.get("type") != "atlassian-user-role-actor":
+                    continue
+                account_id = (actor.get("actorUser") or {}).get("accountId")
+                display_name = actor.get("displayName")
+                if account_id and display_name and account_id not in members:
+                    members[account_id] = {
+                        "displayName": display_name,
+                        "accountId": account_id,
+                    }
+
+        result = {"members": list(members.values()), "failed_roles": failed_roles}
+        if cache_key is not None and not failed_roles:
+            _project_members.set(cache_key, result)
+        return result
+
     def get_project_role_members(
         self, project_key: str, role_id: str
     ) -> list[dict[str, Any]]:
@@ -243,14 +616,10 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             project_key: The project key
 
         Returns:
-            List of issue type data dictionaries
+            List of issue type data dictionaries (shared, must not be modified)
         """
         try:
-            meta = self.jira.issue_createmeta(project=project_key)
-            if not isinstance(meta, dict):
-                msg = f"Unexpected return value type from `jira.issue_createmeta`: {type(meta)}"
-                logger.error(msg)
-                raise TypeError(msg)
+            meta = self.get_project_createmeta(project_key)
 
             issue_types = []
             # Extract issue types from createmeta response
@@ -1,6 +1,7 @@
 """Module for Jira protocol definitions."""
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from typing import Any, Protocol, runtime_checkable
 
 from ..models.jira import JiraIssue
@@ -154,6 +155,37 @@ class FieldsOperationsProto(Protocol):
         """
 
 
+class ProjectMetadataOperationsProto(Protocol):
+    """Protocol defining project create metadata operations interface."""
+
+    @abstractmethod
+    def get_project_issue_types(self, project_key: str) -> list[dict[str, Any]]:
+        """
+        Get all issue types available for a project.
+
+        Args:
+            project_key: The project key
+
+        Returns:
+            List of issue type data dictionaries
+        """
+
+    @abstractmethod
+    def get_issue_type_fields(
+        self, project_key: str, issue_type_id: str
+    ) -> dict[str, Any]:
+        """
+        Get the fields available when creating issues of a type in a project.
+
+        Args:
+            project_key: The project key
+            issue_type_id: The issue type ID
+
+        Returns:
+            The createmeta field types response
+        """
+
+
 @runtime_checkable
 class UsersOperationsProto(Protocol):
     """Protocol defining user operations interface."""
@@ -171,3 +203,14 @@ class UsersOperationsProto(Protocol):
         Raises:
             ValueError: If the account ID could not be found
         """
+
+    @abstractmethod
+    def resolve_account_ids(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """Resolve several usernames or account IDs at once.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs
+
+        Returns:
+            The account ID of each distinct identifier, or None if not found
+        """
@@ -1,22 +1,87 @@
 """Module for Jira search operations."""
 
 import logging
+from collections.abc import Callable, Iterator
+from typing import Any, Literal, TypeVar
 
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
+from ..models.jira import JiraIssue, JiraIssueRecord, JiraSearchResult
+from ..models.jira.common import EntityRegistry
+from ..models.jira.record import RecordInterner
+from ..utils.cache import config_fingerprint
+from ..utils.concurrency import prefetch_call, submit_blocking
 from .client import JiraClient
-from .constants import DEFAULT_READ_JIRA_FIELDS
+from .constants import DEFAULT_READ_JIRA_FIELDS, MAX_SEARCH_PAGE_SIZE
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+SearchCountMode = Literal["exact", "approximate", "skip"]
+SEARCH_COUNT_MODES: tuple[str, ...] = ("exact", "approximate", "skip")
+
+# A search result model or its simplified dictionary
+SearchResultT = TypeVar("SearchResultT", JiraSearchResult, dict[str, Any])
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
 
+    def _apply_projects_filter(self, jql: str, projects_filter: str | None) -> str:
+        """
+        Restrict a JQL query to the configured or requested projects.
+
+        Args:
+            jql: JQL query string
+            projects_filter: Optional comma-separated list of project keys, overrides config
+
+        Returns:
+            The JQL query with the project filter applied, if any
+        """
+        # Use projects_filter parameter if provided, otherwise fall back to config
+        filter_to_use = projects_filter or self.config.projects_filter
+        if not filter_to_use:
+            return jql
+
+        # Split projects filter by commas and handle possible whitespace
+        projects = [p.strip() for p in filter_to_use.split(",")]
+
+        # Build the project filter query part
+        if len(projects) == 1:
+            project_query = f"project = {projects[0]}"
+        else:
+            quoted_projects = [f'"{p}"' for p in projects]
+            projects_list = ", ".join(quoted_projects)
+            project_query = f"project IN ({projects_list})"
+
+        # Add the project filter to existing query
+        if jql and project_query:
+            if "project = " not in jql and "project IN" not in jql:
+                # Only add if not already filtering by project
+                jql = f"({jql}) AND {project_query}"
+        else:
+            jql = project_query
+
+        logger.info(f"Applied projects filter to query: {jql}")
+        return jql
+
+    def _entity_registry(self) -> EntityRegistry:
+        """Create the registry sharing the nested entities of a response."""
+        return EntityRegistry(site=config_fingerprint(self.config))
+
+    @staticmethod
+    def _format_fields_param(
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+    ) -> str:
+        """Convert requested fields to the comma-separated form used by the API."""
+        if fields is None:  # Use default if None
+            return ",".join(DEFAULT_READ_JIRA_FIELDS)
+        if isinstance(fields, list | tuple | set):
+            return ",".join(fields)
+        return fields
+
     def search_issues(
         self,
         jql: str,
@@ -25,6 +90,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
+        count_mode: SearchCountMode = "exact",
     ) -> JiraSearchResult:
         """
         Search for issues using JQL (Jira Query Language).
@@ -38,82 +104,102 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
             projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            count_mode: How ``total`` is obtained on Cloud, where it needs a separate
+                  request issued alongside the issue fetch: "exact" (search with
+                  maxResults=0), "approximate" (approximate-count endpoint) or
+                  "skip" (no request, total is -1). Ignored on Server/DC.
 
         Returns:
             JiraSearchResult object containing issues and metadata (total, start_at, max_results)
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            ValueError: If count_mode is not one of "exact", "approximate" or "skip"
+            Exception: If there is an error searching for issues
+        """
+        return self._search_issues(
+            JiraSearchResult.from_api_response,
+            jql,
+            fields=fields,
+            start=start,
+            limit=limit,
+            expand=expand,
+            projects_filter=projects_filter,
+            count_mode=count_mode,
+        )
+
+    def search_issues_simplified(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        count_mode: SearchCountMode = "exact",
+    ) -> dict[str, Any]:
+        """
+        Search for issues using JQL and return the simplified search result.
+
+        Takes the same arguments as search_issues and returns the same as
+        ``search_issues(...).to_simplified_dict()``, but converts the API
+        response directly instead of building the issue models.
+
+        Returns:
+            Dictionary with total, start_at, max_results and simplified issues
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            ValueError: If count_mode is not one of "exact", "approximate" or "skip"
             Exception: If there is an error searching for issues
         """
+        return self._search_issues(
+            JiraSearchResult.simplify_api_response,
+            jql,
+            fields=fields,
+            start=start,
+            limit=limit,
+            expand=expand,
+            projects_filter=projects_filter,
+            count_mode=count_mode,
+        )
+
+    def _search_issues(
+        self,
+        build: Callable[..., SearchResultT],
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        count_mode: SearchCountMode = "exact",
+    ) -> SearchResultT:
+        """Search for issues, converting the API response with ``build``."""
+        if count_mode not in SEARCH_COUNT_MODES:
+            msg = f"Invalid count_mode '{count_mode}'. Expected one of: {', '.join(SEARCH_COUNT_MODES)}"
+            raise ValueError(msg)
+
         try:
-            # Use projects_filter parameter if provided, otherwise fall back to config
-            filter_to_use = projects_filter or self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Build the project filter query part
-                if len(projects) == 1:
-                    project_query = f"project = {projects[0]}"
-                else:
-                    quoted_projects = [f'"{p}"' for p in projects]
-                    projects_list = ", ".join(quoted_projects)
-                    project_query = f"project IN ({projects_list})"
-
-                # Add the project filter to existing query
-                if jql and project_query:
-                    if "project = " not in jql and "project IN" not in jql:
-                        # Only add if not already filtering by project
-                        jql = f"({jql}) AND {project_query}"
-                else:
-                    jql = project_query
-
-                logger.info(f"Applied projects filter to query: {jql}")
-
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._format_fields_param(fields)
 
             if self.config.is_cloud:
-                actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
-                    )
-
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
-                        )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
+                # Call 1 (in the background): the total, which the enhanced
+                # search API does not return
+                total_future = None
+                if count_mode == "exact":
+                    total_future = submit_blocking(self._get_search_total, jql)
+                elif count_mode == "approximate":
+                    total_future = submit_blocking(
+                        self._get_approximate_search_total, jql
                     )
 
                 # Call 2: Get the actual issues using the enhanced method
                 issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
                     jql, fields=fields_param, limit=limit, expand=expand
                 )
+                actual_total = total_future.result() if total_future else -1
 
                 if not isinstance(issues_response_list, list):
                     msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
@@ -125,10 +211,11 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     "total": actual_total,
                 }
 
-                search_result = JiraSearchResult.from_api_response(
+                search_result = build(
                     response_dict_for_model,
                     base_url=self.config.url,
                     requested_fields=fields_param,
+                    registry=self._entity_registry(),
                 )
 
                 # Return the full search result object
@@ -143,9 +230,12 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                     logger.error(msg)
                     raise TypeError(msg)
 
-                # Convert the response to a search result model
-                search_result = JiraSearchResult.from_api_response(
-                    response, base_url=self.config.url, requested_fields=fields_param
+                # Convert the response to a search result
+                search_result = build(
+                    response,
+                    base_url=self.config.url,
+                    requested_fields=fields_param,
+                    registry=self._entity_registry(),
                 )
 
                 # Return the full search result object
@@ -169,6 +259,262 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def iter_issue_pages(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        expand: str | None = None,
+        page_size: int = MAX_SEARCH_PAGE_SIZE,
+        projects_filter: str | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[JiraSearchResult]:
+        """
+        Lazily iterate over all issues matching a JQL query, one page at a time.
+
+        Uses `nextPageToken` pagination on Cloud and `startAt` on Server/DC. Only
+        the current page (and, with prefetch, the next one) is held in memory,
+        so very large result sets can be exported in constant memory.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            expand: Optional items to expand (comma-separated)
+            page_size: Issues per request (1-100)
+            projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            prefetch: Request the next page in the background while the current
+                one is being processed
+
+        Yields:
+            A JiraSearchResult per page. ``total`` is -1 on Cloud, where the
+            paginated API does not report it.
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            HTTPError: If a page request fails
+        """
+        fields_param = self._format_fields_param(fields)
+        for page in self._iter_raw_issue_pages(
+            jql, fields_param, expand, page_size, projects_filter, prefetch
+        ):
+            yield JiraSearchResult.from_api_response(
+                page,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                registry=self._entity_registry(),
+            )
+
+    def iter_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        expand: str | None = None,
+        page_size: int = MAX_SEARCH_PAGE_SIZE,
+        projects_filter: str | None = None,
+        *,
+        prefetch: bool = True,
+    ) -> Iterator[JiraIssue]:
+        """
+        Lazily iterate over all issues matching a JQL query.
+
+        See :meth:`iter_issue_pages` for the arguments.
+
+        Yields:
+            JiraIssue models in result order
+        """
+        for page in self.iter_issue_pages(
+            jql,
+            fields=fields,
+            expand=expand,
+            page_size=page_size,
+            projects_filter=projects_filter,
+            prefetch=prefetch,
+        ):
+            yield from page.issues
+
+    def iter_issue_records(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        expand: str | None = None,
+        page_size: int = MAX_SEARCH_PAGE_SIZE,
+        projects_filter: str | None = None,
+        *,
+        prefetch: bool = True,
+        interner: RecordInterner | None = None,
+    ) -> Iterator[JiraIssueRecord]:
+        """
+        Lazily iterate over all issues matching a JQL query as compact records.
+
+        Records hold only the simplified entries of the requested fields and
+        share repeated strings and nested values (statuses, users, projects,
+        ...) across the whole iteration. Use them instead of :meth:`iter_issues`
+        when many issues are kept in memory, e.g. for changelog analytics.
+        See :meth:`iter_issue_pages` for the other arguments.
+
+        Args:
+            interner: Interner to share values with records created elsewhere,
+                a new one is used for the iteration by default
+
+        Yields:
+            JiraIssueRecord objects in result order
+        """
+        fields_param = self._format_fields_param(fields)
+        # Compile the requested fields once for the whole iteration
+        selection = JiraIssue.field_selection(fields_param)
+        if interner is None:
+            interner = RecordInterner()
+
+        for page in self._iter_raw_issue_pages(
+            jql, fields_param, expand, page_size, projects_filter, prefetch
+        ):
+            issues = page.get("issues", [])
+            if not isinstance(issues, list):
+                continue
+            for issue_data in issues:
+                if issue_data:
+                    yield JiraIssueRecord.from_api_response(
+                        issue_data, interner, selection=selection
+                    )
+
+    def _iter_raw_issue_pages(
+        self,
+        jql: str,
+        fields_param: str,
+        expand: str | None,
+        page_size: int,
+        projects_filter: str | None,
+        prefetch: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the raw search result pages of a JQL query."""
+        jql = self._apply_projects_filter(jql, projects_filter)
+        page_size = max(1, min(page_size, MAX_SEARCH_PAGE_SIZE))
+
+        if self.config.is_cloud:
+            params: dict[str, Any] = {
+                "jql": jql,
+                "fields": fields_param,
+                "maxResults": page_size,
+            }
+            if expand:
+                params["expand"] = expand
+            pages = self.iter_paged(
+                "get", self.jira.resource_url("search/jql"), params, prefetch=prefetch
+            )
+        else:
+            pages = self._iter_server_search_pages(
+                jql, fields_param, expand, page_size, prefetch
+            )
+
+        try:
+            yield from pages
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+
+    def _iter_server_search_pages(
+        self,
+        jql: str,
+        fields_param: str,
+        expand: str | None,
+        page_size: int,
+        prefetch: bool,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over raw Server/DC search pages using `startAt`."""
+
+        def fetch(start: int) -> dict[str, Any]:
+            response = self.jira.jql(
+                jql, fields=fields_param, start=start, limit=page_size, expand=expand
+            )
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return response
+
+        start = 0
+        pending: Callable[[], dict[str, Any]] | None = prefetch_call(
+            fetch, start, enabled=False
+        )
+        while pending is not None:
+            response = pending()
+            pending = None
+
+            issues = response.get("issues") or []
+            total = response.get("total")
+            next_start = start + len(issues)
+            if issues and (not isinstance(total, int) or next_start < total):
+                pending = prefetch_call(fetch, next_start, enabled=prefetch)
+
+            yield response
+            start = next_start
+
+    def _get_search_total(self, jql: str) -> int:
+        """
+        Get the exact number of issues matching a JQL query.
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            The total reported by the search API, or -1 if it could not be determined
+        """
+        try:
+            metadata_params = {"jql": jql, "maxResults": 0}
+            metadata_response = self.jira.get(
+                self.jira.resource_url("search"), params=metadata_params
+            )
+
+            if isinstance(metadata_response, dict) and "total" in metadata_response:
+                try:
+                    return int(metadata_response["total"])
+                except (ValueError, TypeError):
+                    logger.warning(
+                        f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
+                    )
+            else:
+                logger.warning(
+                    f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
+                )
+        except Exception as meta_err:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(meta_err)}")
+        return -1
+
+    def _get_approximate_search_total(self, jql: str) -> int:
+        """
+        Get an approximate number of issues matching a JQL query (Cloud only).
+
+        Args:
+            jql: JQL query string
+
+        Returns:
+            The approximate count, or -1 if it could not be determined
+        """
+        try:
+            response = self.jira.post(
+                "rest/api/3/search/approximate-count", data={"jql": jql}
+            )
+            if isinstance(response, dict) and "count" in response:
+                return int(response["count"])
+            logger.warning(
+                f"Could not retrieve approximate count for JQL: {jql}. Response type: {type(response)}"
+            )
+        except Exception as count_err:
+            logger.error(
+                f"Error fetching approximate count for JQL '{jql}': {str(count_err)}"
+            )
+        return -1
+
     def get_board_issues(
         self,
         board_id: str,
@@ -195,6 +541,59 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         Raises:
             Exception: If there is an error getting board issues
         """
+        return self._get_board_issues(
+            JiraSearchResult.from_api_response,
+            board_id,
+            jql,
+            fields=fields,
+            start=start,
+            limit=limit,
+            expand=expand,
+        )
+
+    def get_board_issues_simplified(
+        self,
+        board_id: str,
+        jql: str,
+        fields: str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the issues linked to a board as a simplified search result.
+
+        Takes the same arguments as get_board_issues and returns the same as
+        ``get_board_issues(...).to_simplified_dict()`` without building the
+        issue models.
+
+        Returns:
+            Dictionary with total, start_at, max_results and simplified issues
+
+        Raises:
+            Exception: If there is an error getting board issues
+        """
+        return self._get_board_issues(
+            JiraSearchResult.simplify_api_response,
+            board_id,
+            jql,
+            fields=fields,
+            start=start,
+            limit=limit,
+            expand=expand,
+        )
+
+    def _get_board_issues(
+        self,
+        build: Callable[..., SearchResultT],
+        board_id: str,
+        jql: str,
+        fields: str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+    ) -> SearchResultT:
+        """Get the issues of a board, converting the API response with ``build``."""
         try:
             # Determine fields_param
             fields_param = fields
@@ -214,11 +613,13 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Convert the response to a search result model
-            search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+            # Convert the response to a search result
+            return build(
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                registry=self._entity_registry(),
             )
-            return search_result
         except requests.HTTPError as e:
             logger.error(
                 f"Error searching issues for board with JQL '{board_id}': {str(e.response.content)}"
@@ -254,6 +655,51 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         Raises:
             Exception: If there is an error getting board issues
         """
+        return self._get_sprint_issues(
+            JiraSearchResult.from_api_response,
+            sprint_id,
+            fields=fields,
+            start=start,
+            limit=limit,
+        )
+
+    def get_sprint_issues_simplified(
+        self,
+        sprint_id: str,
+        fields: str | None = None,
+        start: int = 0,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """
+        Get the issues linked to a sprint as a simplified search result.
+
+        Takes the same arguments as get_sprint_issues and returns the same as
+        ``get_sprint_issues(...).to_simplified_dict()`` without building the
+        issue models.
+
+        Returns:
+            Dictionary with total, start_at, max_results and simplified issues
+
+        Raises:
+            Exception: If there is an error getting sprint issues
+        """
+        return self._get_sprint_issues(
+            JiraSearchResult.simplify_api_response,
+            sprint_id,
+            fields=fields,
+            start=start,
+            limit=limit,
+        )
+
+    def _get_sprint_issues(
+        self,
+        build: Callable[..., SearchResultT],
+        sprint_id: str,
+        fields: str | None = None,
+        start: int = 0,
+        limit: int = 50,
+    ) -> SearchResultT:
+        """Get the issues of a sprint, converting the API response with ``build``."""
         try:
             # Determine fields_param
             fields_param = fields
@@ -270,11 +716,13 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                 logger.error(msg)
                 raise TypeError(msg)
 
-            # Convert the response to a search result model
-            search_result = JiraSearchResult.from_api_response(
-                response, base_url=self.config.url, requested_fields=fields_param
+            # Convert the response to a search result
+            return build(
+                response,
+                base_url=self.config.url,
+                requested_fields=fields_param,
+                registry=self._entity_registry(),
             )
-            return search_result
         except requests.HTTPError as e:
             logger.error(
                 f"Error searching issues for sprint '{sprint_id}': {str(e.response.content)}"
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, TypeVar
 
 import requests
@@ -9,6 +10,9 @@ from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.jira.common import JiraUser
+from mcp_atlassian.utils.cache import SharedTTLCache, config_fingerprint
+from mcp_atlassian.utils.concurrency import submit_blocking
+from mcp_atlassian.utils.environment import get_int_env
 
 from .client import JiraClient
 
@@ -19,6 +23,18 @@ JiraUserType = TypeVar("JiraUserType", bound="JiraUser")
 
 logger = logging.getLogger("mcp-jira")
 
+# Resolved account IDs by (credentials, lower-case username/email/display name)
+_account_ids: SharedTTLCache[tuple[str, str], str] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_USER_CACHE_SIZE", 2048),
+    ttl=lambda: get_int_env("JIRA_USER_CACHE_TTL", 3600),
+)
+# Identifiers no user was found for, kept briefly so that a batch of issues
+# naming the same unknown user does not search for it again and again
+_unknown_users: SharedTTLCache[tuple[str, str], str] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_USER_CACHE_SIZE", 2048),
+    ttl=lambda: get_int_env("JIRA_USER_NEGATIVE_CACHE_TTL", 60),
+)
+
 
 class UsersMixin(JiraClient):
     """Mixin for Jira user operations."""
@@ -105,17 +121,71 @@ class UsersMixin(JiraClient):
         if assignee.startswith("5") and len(assignee) >= 10:
             return assignee
 
-        account_id = self._lookup_user_directly(assignee)
-        if account_id:
-            return account_id
+        fingerprint = config_fingerprint(self.config)
+        cache_key = (fingerprint, assignee.lower()) if fingerprint else None
+        if cache_key is not None:
+            account_id = _account_ids.get(cache_key)
+            if account_id is not None:
+                return account_id
+            if _unknown_users.get(cache_key) is not None:
+                error_msg = f"Could not find account ID for user: {assignee}"
+                raise ValueError(error_msg)
 
-        account_id = self._lookup_user_by_permissions(assignee)
+        # Only remember the user as unknown when every lookup answered; a
+        # failed request (timeout, 429, 5xx) says nothing about the user
+        lookup_failed = False
+        account_id = None
+        for lookup in (self._lookup_user_directly, self._lookup_user_by_permissions):
+            try:
+                account_id = lookup(assignee)
+            except Exception as e:  # noqa: BLE001 - Try the next lookup
+                logger.info(f"Error looking up user {assignee}: {str(e)}")
+                lookup_failed = True
+                continue
+            if account_id:
+                break
         if account_id:
+            if cache_key is not None:
+                _account_ids.set(cache_key, account_id)
             return account_id
 
+        if cache_key is not None and not lookup_failed:
+            _unknown_users.set(cache_key, assignee)
         error_msg = f"Could not find account ID for user: {assignee}"
         raise ValueError(error_msg)
 
+    def resolve_account_ids(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """
+        Resolve several usernames or account IDs at once.
+
+        Every distinct identifier is looked up only once, and the lookups that
+        are not answered from the cache run concurrently.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs.
+
+        Returns:
+            The account ID of each distinct identifier, or None if no user was
+            found for it.
+        """
+        unique = [
+            identifier
+            for identifier in dict.fromkeys(identifiers)
+            if isinstance(identifier, str) and identifier
+        ]
+        lookups = [
+            (identifier, submit_blocking(self._get_account_id, identifier))
+            for identifier in unique
+        ]
+        resolved: dict[str, str | None] = {}
+        for identifier, lookup in lookups:
+            try:
+                resolved[identifier] = lookup.result()
+            except ValueError as e:
+                logger.warning(str(e))
+                resolved[identifier] = None
+        return resolved
+
     def _lookup_user_directly(self, username: str) -> str | None:
         """
         Look up a user account ID directly.
@@ -124,45 +194,44 @@ class UsersMixin(JiraClient):
             username (str): Username to look up.
 
         Returns:
-            Optional[str]: Account ID if found, None otherwise.
+            Optional[str]: Account ID if found, None if no user matches.
+
+        Raises:
+            Exception: If the user search fails.
         """
-        try:
-            params = {}
-            if self.config.is_cloud:
-                params["query"] = username
-            else:
-                params["username"] = username
-
-            response = self.jira.user_find_by_user_string(**params, start=0, limit=1)
-            if not isinstance(response, list):
-                msg = f"Unexpected return value type from `jira.user_find_by_user_string`: {type(response)}"
-                logger.error(msg)
-                return None
-
-            for user in response:
-                if (
-                    user.get("displayName", "").lower() == username.lower()
-                    or user.get("name", "").lower() == username.lower()
-                    or user.get("emailAddress", "").lower() == username.lower()
-                ):
-                    if self.config.is_cloud:
-                        if "accountId" in user:
-                            return user["accountId"]
-                    else:
-                        if "name" in user:
-                            logger.info(
-                                "Using 'name' for assignee field in Jira Data Center/Server"
-                            )
-                            return user["name"]
-                        elif "key" in user:
-                            logger.info(
-                                "Using 'key' as fallback for assignee name in Jira Data Center/Server"
-                            )
-                            return user["key"]
-            return None
-        except Exception as e:
-            logger.info(f"Error looking up user directly: {str(e)}")
-            return None
+        params = {}
+        if self.config.is_cloud:
+            params["query"] = username
+        else:
+            params["username"] = username
+
+        response = self.jira.user_find_by_user_string(**params, start=0, limit=1)
+        if not isinstance(response, list):
+            msg = f"Unexpected return value type from `jira.user_find_by_user_string`: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        for user in response:
+            if (
+                user.get("displayName", "").lower() == username.lower()
+                or user.get("name", "").lower() == username.lower()
+                or user.get("emailAddress", "").lower() == username.lower()
+            ):
+                if self.config.is_cloud:
+                    if "accountId" in user:
+                        return user["accountId"]
+                else:
+                    if "name" in user:
+                        logger.info(
+                            "Using 'name' for assignee field in Jira Data Center/Server"
+                        )
+                        return user["name"]
+                    elif "key" in user:
+                        logger.info(
+                            "Using 'key' as fallback for assignee name in Jira Data Center/Server"
+                        )
+                        return user["key"]
+        return None
 
     def _lookup_user_by_permissions(self, username: str) -> str | None:
         """
@@ -172,48 +241,51 @@ class UsersMixin(JiraClient):
             username (str): Username to look up.
 
         Returns:
-            Optional[str]: Account ID if found, None otherwise.
-        """
-        try:
-            url = f"{self.config.url}/rest/api/2/user/permission/search"
-            params = {"query": username, "permissions": "BROWSE"}
+            Optional[str]: Account ID if found, None if no user matches.
 
-            auth = None
-            headers = {}
-            if self.config.auth_type == "token":
-                headers["Authorization"] = f"Bearer {self.config.personal_token}"
-            else:
-                auth = (self.config.username or "", self.config.api_token or "")
-
-            response = requests.get(
-                url,
-                params=params,
-                auth=auth,
-                headers=headers,
-                verify=self.config.ssl_verify,
-            )
+        Raises:
+            Exception: If the permission search fails (network error, 429 or 5xx).
+        """
+        url = f"{self.config.url}/rest/api/2/user/permission/search"
+        params = {"query": username, "permissions": "BROWSE"}
 
-            if response.status_code == 200:
-                data = response.json()
-                for user in data.get("users", []):
-                    if self.config.is_cloud:
-                        if "accountId" in user:
-                            return user["accountId"]
-                    else:
-                        if "name" in user:
-                            logger.info(
-                                "Using 'name' for assignee field in Jira Data Center/Server"
-                            )
-                            return user["name"]
-                        elif "key" in user:
-                            logger.info(
-                                "Using 'key' as fallback for assignee name in Jira Data Center/Server"
-                            )
-                            return user["key"]
-            return None
-        except Exception as e:
-            logger.info(f"Error looking up user by permissions: {str(e)}")
+        auth = None
+        headers = {}
+        if self.config.auth_type == "token":
+            headers["Authorization"] = f"Bearer {self.config.personal_token}"
+        else:
+            auth = (self.config.username or "", self.config.api_token or "")
+
+        response = requests.get(
+            url,
+            params=params,
+            auth=auth,
+            headers=headers,
+            verify=self.config.ssl_verify,
+        )
+        # Deployments without this search answer 400/404, which is no match;
+        # rate limiting and server errors are failures
+        if response.status_code in [400, 404]:
             return None
+        response.raise_for_status()
+
+        data = response.json()
+        for user in data.get("users", []):
+            if self.config.is_cloud:
+                if "accountId" in user:
+                    return user["accountId"]
+            else:
+                if "name" in user:
+                    logger.info(
+                        "Using 'name' for assignee field in Jira Data Center/Server"
+                    )
+                    return user["name"]
+                elif "key" in user:
+                    logger.info(
+                        "Using 'key' as fallback for assignee name in Jira Data Center/Server"
+                    )
+                    return user["key"]
+        return None
 
     def _determine_user_api_params(self, identifier: str) -> dict[str, str]:
         """
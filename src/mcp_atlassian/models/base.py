@@ -6,11 +6,12 @@ Jira and Confluence models to ensure consistent behavior and reduce
 code duplication.
 """
 
-from datetime import datetime
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
+from ..utils.date import TIMESTAMP_CACHE_SIZE, parse_iso8601_date
 from .constants import EMPTY_STRING
 
 # Type variable for the return type of from_api_response
@@ -43,6 +44,25 @@ class ApiModel(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement from_api_response")
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Convert an API response straight to the simplified dictionary.
+
+        The result is the same as ``from_api_response(data).to_simplified_dict()``.
+        Models on hot read paths override this to skip building the model.
+
+        Args:
+            data: The API response data
+            **kwargs: Additional context parameters
+
+        Returns:
+            The simplified dictionary for the API response
+        """
+        return cls.from_api_response(data, **kwargs).to_simplified_dict()
+
     def to_simplified_dict(self) -> dict[str, Any]:
         """
         Convert the model to a simplified dictionary for API responses.
@@ -53,6 +73,13 @@ class ApiModel(BaseModel):
         return self.model_dump(exclude_none=True)
 
 
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _format_timestamp(timestamp: str) -> str:
+    dt = parse_iso8601_date(timestamp)
+    # Same as strftime("%Y-%m-%d %H:%M:%S"), about twice as fast
+    return dt.isoformat(" ", "seconds")[:19] if dt else timestamp
+
+
 class TimestampMixin:
     """
     Mixin for handling Atlassian API timestamp formats.
@@ -71,26 +98,7 @@ class TimestampMixin:
         """
         if not timestamp:
             return EMPTY_STRING
-
-        try:
-            # Parse ISO 8601 format like "2024-01-01T10:00:00.000+0000"
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            dt = datetime.fromisoformat(ts)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        except (ValueError, TypeError):
-            return timestamp or EMPTY_STRING
+        return _format_timestamp(timestamp)
 
     @staticmethod
     def is_valid_timestamp(timestamp: str | None) -> bool:
@@ -103,24 +111,4 @@ class TimestampMixin:
         Returns:
             True if the string is a valid timestamp, False otherwise
         """
-        if not timestamp:
-            return False
-
-        try:
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            datetime.fromisoformat(ts)
-            return True
-        except (ValueError, TypeError):
-            return False
+        return bool(timestamp) and parse_iso8601_date(timestamp) is not None
@@ -20,6 +20,7 @@ from .common import (
 from .issue import JiraIssue
 from .link import JiraIssueLinkType
 from .project import JiraProject
+from .record import JiraIssueRecord
 from .search import JiraSearchResult
 from .workflow import JiraTransition
 from .worklog import JiraWorklog
@@ -42,6 +43,7 @@ __all__ = [
     "JiraBoard",
     "JiraSprint",
     "JiraIssue",
+    "JiraIssueRecord",
     "JiraSearchResult",
     "JiraIssueLinkType",
 ]
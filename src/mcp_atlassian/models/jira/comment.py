@@ -51,7 +51,9 @@ class JiraComment(ApiModel, TimestampMixin):
         author = None
         author_data = data.get("author")
         if author_data:
-            author = JiraUser.from_api_response(author_data)
+            author = JiraUser.from_api_response(
+                author_data, registry=kwargs.get("registry")
+            )
 
         # Ensure ID is a string
         comment_id = data.get("id", JIRA_DEFAULT_ID)
@@ -94,3 +96,30 @@ class JiraComment(ApiModel, TimestampMixin):
             result["updated"] = self.updated
 
         return result
+
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert comment data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        body = data.get("body")
+        if isinstance(body, dict) and "content" in body:
+            body = str(body.get("content", EMPTY_STRING))
+        else:
+            body = str(body) if body else EMPTY_STRING
+
+        result: dict[str, Any] = {"body": body}
+
+        if author := data.get("author"):
+            result["author"] = JiraUser.simplify_api_response(author)
+
+        if created := str(data.get("created", EMPTY_STRING)):
+            result["created"] = created
+
+        if updated := str(data.get("updated", EMPTY_STRING)):
+            result["updated"] = updated
+
+        return result
@@ -5,13 +5,17 @@ This module provides Pydantic models for common Jira entities like users, status
 issue types, priorities, attachments, and time tracking.
 """
 
+import functools
 import logging
+from collections.abc import Callable
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from pydantic import Field
 
 from mcp_atlassian.utils import parse_date
+from mcp_atlassian.utils.cache import SharedTTLCache
+from mcp_atlassian.utils.environment import get_int_env
 
 from ..base import ApiModel, TimestampMixin
 from ..constants import (
@@ -24,6 +28,126 @@ from ..constants import (
 
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def get_entity_cache_ttl() -> int:
+    """Get the number of seconds nested entities are shared across responses.
+
+    Controlled by JIRA_ENTITY_CACHE_TTL. ``0`` (the default) only shares them
+    within one response.
+    """
+    return get_int_env("JIRA_ENTITY_CACHE_TTL", 0)
+
+
+# (site, model, entity ID) -> (API data, model), for registries with a site
+_site_entities: SharedTTLCache[
+    tuple[str, type[ApiModel], str], tuple[dict[str, Any], ApiModel]
+] = SharedTTLCache(
+    maxsize=lambda: get_int_env("JIRA_ENTITY_CACHE_SIZE", 2048),
+    ttl=get_entity_cache_ttl,
+)
+
+
+class EntityRegistry:
+    """
+    Flyweight registry of the nested entities of API responses.
+
+    The same statuses, priorities, issue types, users and projects repeat
+    across the issues of a search page. Models created with a registry are
+    built once per entity ID and then shared, as long as the API data is the
+    same. With a site, entities are also shared across responses for
+    JIRA_ENTITY_CACHE_TTL seconds.
+
+    Shared models must not be modified.
+    """
+
+    def __init__(self, site: str | None = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            site: Fingerprint of the site (see config_fingerprint) to share
+                entities across responses, or None for this registry only
+        """
+        self.site = site
+        self._entities: dict[
+            tuple[type[ApiModel], str], tuple[dict[str, Any], ApiModel]
+        ] = {}
+
+    def get(
+        self, model_cls: type[ApiModel], entity_id: str, data: dict[str, Any]
+    ) -> ApiModel | None:
+        """
+        Get the shared model of an entity.
+
+        Args:
+            model_cls: The model class
+            entity_id: The ID of the entity
+            data: The API data of the entity
+
+        Returns:
+            The shared model, or None if there is none for this data
+        """
+        entry = self._entities.get((model_cls, entity_id))
+        if entry is None and self.site is not None:
+            entry = _site_entities.get((self.site, model_cls, entity_id))
+            if entry is not None:
+                self._entities[model_cls, entity_id] = entry
+        if entry is not None and entry[0] == data:
+            return entry[1]
+        return None
+
+    def add(
+        self,
+        model_cls: type[ApiModel],
+        entity_id: str,
+        data: dict[str, Any],
+        model: ApiModel,
+    ) -> None:
+        """Share the model built from the API data of an entity."""
+        self._entities[model_cls, entity_id] = (data, model)
+        if self.site is not None:
+            _site_entities.set((self.site, model_cls, entity_id), (data, model))
+
+
+def shared_entity(*id_keys: str) -> Callable[[F], F]:
+    """
+    Share the models created by a from_api_response through an EntityRegistry.
+
+    The registry is passed as the ``registry`` keyword argument. Models are
+    keyed by the first of ``id_keys`` present in the data; data without an
+    ID is always converted.
+
+    Args:
+        *id_keys: Keys of the entity ID in the API data, in order of preference
+
+    Returns:
+        A decorator for from_api_response, to be applied below @classmethod
+    """
+
+    def decorate(from_api_response: F) -> F:
+        @functools.wraps(from_api_response)
+        def wrapper(cls: type[ApiModel], data: Any, **kwargs: Any) -> Any:
+            registry = kwargs.get("registry")
+            if registry is None or not isinstance(data, dict):
+                return from_api_response(cls, data, **kwargs)
+
+            entity_id = next((data[key] for key in id_keys if data.get(key)), None)
+            if entity_id is None:
+                return from_api_response(cls, data, **kwargs)
+
+            entity_id = str(entity_id)
+            model = registry.get(cls, entity_id, data)
+            if model is None:
+                model = from_api_response(cls, data, **kwargs)
+                registry.add(cls, entity_id, data, model)
+            return model
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
 
 class JiraUser(ApiModel):
     """
@@ -38,6 +162,7 @@ class JiraUser(ApiModel):
     time_zone: str | None = None
 
     @classmethod
+    @shared_entity("accountId", "key", "name")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraUser":
         """
         Create a JiraUser from a Jira API response.
@@ -82,6 +207,23 @@ class JiraUser(ApiModel):
             "avatar_url": self.avatar_url,
         }
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert user data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        avatars = data.get("avatarUrls")
+        display_name = str(data.get("displayName", UNASSIGNED))
+        return {
+            "display_name": display_name,
+            "name": display_name,
+            "email": data.get("emailAddress"),
+            "avatar_url": avatars.get("48x48") if isinstance(avatars, dict) else None,
+        }
+
 
 class JiraStatusCategory(ApiModel):
     """
@@ -142,6 +284,7 @@ class JiraStatus(ApiModel):
     category: JiraStatusCategory | None = None
 
     @classmethod
+    @shared_entity("id")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraStatus":
         """
         Create a JiraStatus from a Jira API response.
@@ -190,6 +333,23 @@ class JiraStatus(ApiModel):
 
         return result
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert status data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        result = {"name": str(data.get("name", UNKNOWN))}
+        if category := data.get("statusCategory"):
+            if not isinstance(category, dict):
+                category = {}
+            result["category"] = str(category.get("name", UNKNOWN))
+            result["color"] = str(category.get("colorName", EMPTY_STRING))
+
+        return result
+
 
 class JiraIssueType(ApiModel):
     """
@@ -202,6 +362,7 @@ class JiraIssueType(ApiModel):
     icon_url: str | None = None
 
     @classmethod
+    @shared_entity("id")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraIssueType":
         """
         Create a JiraIssueType from a Jira API response.
@@ -234,6 +395,16 @@ class JiraIssueType(ApiModel):
         """Convert to simplified dictionary for API response."""
         return {"name": self.name}
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert issue type data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        return {"name": str(data.get("name", UNKNOWN))}
+
 
 class JiraPriority(ApiModel):
     """
@@ -246,6 +417,7 @@ class JiraPriority(ApiModel):
     icon_url: str | None = None
 
     @classmethod
+    @shared_entity("id")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraPriority":
         """
         Create a JiraPriority from a Jira API response.
@@ -278,6 +450,16 @@ class JiraPriority(ApiModel):
         """Convert to simplified dictionary for API response."""
         return {"name": self.name}
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert priority data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        return {"name": str(data.get("name", NONE_VALUE))}
+
 
 class JiraAttachment(ApiModel):
     """
@@ -317,7 +499,9 @@ class JiraAttachment(ApiModel):
         author = None
         author_data = data.get("author")
         if author_data:
-            author = JiraUser.from_api_response(author_data)
+            author = JiraUser.from_api_response(
+                author_data, registry=kwargs.get("registry")
+            )
 
         attachment_id = data.get("id", JIRA_DEFAULT_ID)
         if attachment_id is not None:
@@ -362,6 +546,40 @@ class JiraAttachment(ApiModel):
 
         return result
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert attachment data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        size = data.get("size", 0)
+        try:
+            size = int(size) if size is not None else 0
+        except (ValueError, TypeError):
+            size = 0
+
+        result = {
+            "filename": str(data.get("filename", EMPTY_STRING)),
+            "size": size,
+            "url": data.get("content"),
+        }
+
+        if content_type := data.get("mimeType"):
+            result["content_type"] = content_type
+
+        if author := data.get("author"):
+            result["author"] = JiraUser.simplify_api_response(author)
+
+        if thumbnail_url := data.get("thumbnail"):
+            result["thumbnail_url"] = thumbnail_url
+
+        if created := str(data.get("created", EMPTY_STRING)):
+            result["created"] = created
+
+        return result
+
 
 class JiraTimetracking(ApiModel):
     """
@@ -419,6 +637,25 @@ class JiraTimetracking(ApiModel):
 
         return result
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert timetracking data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return {}
+
+        result = {}
+
+        if original_estimate := data.get("originalEstimate"):
+            result["original_estimate"] = original_estimate
+        if remaining_estimate := data.get("remainingEstimate"):
+            result["remaining_estimate"] = remaining_estimate
+        if time_spent := data.get("timeSpent"):
+            result["time_spent"] = time_spent
+
+        return result
+
 
 class JiraResolution(ApiModel):
     """Model representing a Jira issue resolution."""
@@ -428,6 +665,7 @@ class JiraResolution(ApiModel):
     description: str | None = None
 
     @classmethod
+    @shared_entity("id")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraResolution":
         """Create a JiraResolution from a Jira API response."""
         if not isinstance(data, dict):
@@ -446,6 +684,19 @@ class JiraResolution(ApiModel):
             result["id"] = self.id
         return result
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert resolution data from the Jira API to the simplified dictionary."""
+        if not isinstance(data, dict):
+            return cls().to_simplified_dict()
+        result = {"name": data.get("name", UNKNOWN)}
+        resolution_id = str(data.get("id", JIRA_DEFAULT_ID))
+        if resolution_id != JIRA_DEFAULT_ID:
+            result["id"] = resolution_id
+        return result
+
 
 class JiraChangelogItem(ApiModel):
     """
@@ -505,6 +756,30 @@ class JiraChangelogItem(ApiModel):
 
         return result
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert a change item from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        result = {
+            "field": str(data.get("field", EMPTY_STRING)),
+            "fieldtype": str(data.get("fieldtype", EMPTY_STRING)),
+        }
+
+        for key, api_key in (
+            ("from_string", "fromString"),
+            ("to_string", "toString"),
+            ("from_id", "from"),
+            ("to_id", "to"),
+        ):
+            if (value := data.get(api_key)) is not None:
+                result[key] = value
+
+        return result
+
 
 class JiraChangelog(ApiModel, TimestampMixin):
     """
@@ -539,7 +814,9 @@ class JiraChangelog(ApiModel, TimestampMixin):
         author = None
         author_data = data.get("author")
         if author_data:
-            author = JiraUser.from_api_response(author_data)
+            author = JiraUser.from_api_response(
+                author_data, registry=kwargs.get("registry")
+            )
 
         # Ensure ID is a string
         changelog_id = data.get("id", JIRA_DEFAULT_ID)
@@ -581,3 +858,29 @@ class JiraChangelog(ApiModel, TimestampMixin):
             result["created"] = str(self.created)
 
         return result
+
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert a changelog entry from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return {}
+
+        result: dict[str, Any] = {}
+
+        items_data = data.get("items", [])
+        if isinstance(items_data, list) and items_data:
+            result["items"] = [
+                JiraChangelogItem.simplify_api_response(item_data)
+                for item_data in items_data
+            ]
+
+        if author := data.get("author"):
+            result["author"] = JiraUser.simplify_api_response(author)
+
+        if created_data := data.get("created"):
+            if created := parse_date(created_data):
+                result["created"] = str(created)
+
+        return result
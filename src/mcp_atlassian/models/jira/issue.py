@@ -6,7 +6,9 @@ This module provides Pydantic models for Jira issues.
 
 import logging
 import re
-from typing import Any, Literal
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple
 
 from pydantic import Field
 
@@ -87,30 +89,27 @@ class JiraIssue(ApiModel, TimestampMixin):
     worklog: dict | None = None
     changelogs: list[JiraChangelog] = Field(default_factory=list)
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
         """
-        Custom attribute access to handle custom field access.
+        Fall back to custom fields for unknown attributes.
 
         This allows accessing custom fields by their name as if they were
-        regular attributes of the JiraIssue class.
+        regular attributes of the JiraIssue class. Only called when normal
+        attribute lookup fails, so regular attribute access is not slowed down.
 
         Args:
             name: The attribute name to access
 
         Returns:
-            The attribute value or custom field value
+            The custom field value
         """
-        # First try to get the attribute normally
         try:
-            return super().__getattribute__(name)
+            return super().__getattr__(name)  # type: ignore[misc]
         except AttributeError:
             # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
+            custom_fields = self.__dict__.get("custom_fields")
+            if custom_fields and name in custom_fields:
+                return custom_fields[name]
             # Re-raise the original AttributeError
             raise
 
@@ -237,189 +236,76 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         return None
 
-    @classmethod
-    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraIssue":
+    @staticmethod
+    def _normalize_requested_fields(
+        requested_fields: Any,
+    ) -> Literal["*all"] | list[str] | None:
         """
-        Create a JiraIssue from a Jira API response.
+        Normalize the requested_fields parameter.
+
+        Comma-separated strings (except "*all") are split into a list of
+        field names and other collections are converted to a list.
 
         Args:
-            data: The issue data from the Jira API
-            **kwargs: Additional arguments to pass to the constructor
+            requested_fields: The requested fields as passed by the caller
 
         Returns:
-            A JiraIssue instance
+            "*all", a list of field names, or None
         """
-        if not data:
-            return cls()
+        if isinstance(requested_fields, str) and requested_fields != "*all":
+            return [field.strip() for field in requested_fields.split(",")]
+        if isinstance(requested_fields, tuple | set | frozenset):
+            return list(requested_fields)
+        return requested_fields
 
-        # Handle non-dictionary data by returning a default instance
-        if not isinstance(data, dict):
-            logger.debug("Received non-dictionary data, returning default instance")
-            return cls()
-
-        fields = data.get("fields", {})
-        if not isinstance(fields, dict):
-            fields = {}
-
-        # Get required simple fields
-        issue_id = str(data.get("id", JIRA_DEFAULT_ID))
-        key = str(data.get("key", JIRA_DEFAULT_KEY))
-        summary = str(fields.get("summary", EMPTY_STRING))
-        description = fields.get("description")
-
-        # Timestamps
-        created = str(fields.get("created", EMPTY_STRING))
-        updated = str(fields.get("updated", EMPTY_STRING))
-
-        # Extract assignee data
-        assignee = None
-        assignee_data = fields.get("assignee")
-        if assignee_data:
-            assignee = JiraUser.from_api_response(assignee_data)
-
-        # Extract reporter data
-        reporter = None
-        reporter_data = fields.get("reporter")
-        if reporter_data:
-            reporter = JiraUser.from_api_response(reporter_data)
-
-        # Extract status data
-        status = None
-        status_data = fields.get("status")
-        if status_data:
-            status = JiraStatus.from_api_response(status_data)
-
-        # Extract issue type data
-        issue_type = None
-        issue_type_data = fields.get("issuetype")
-        if issue_type_data:
-            issue_type = JiraIssueType.from_api_response(issue_type_data)
-
-        # Extract priority data
-        priority = None
-        priority_data = fields.get("priority")
-        if priority_data:
-            priority = JiraPriority.from_api_response(priority_data)
-
-        # Extract project data
-        project = None
-        project_data = fields.get("project")
-        if isinstance(project_data, dict):
-            project = JiraProject.from_api_response(project_data)
-
-        resolution = None
-        resolution_data = fields.get("resolution")
-        if isinstance(resolution_data, dict):
-            resolution = JiraResolution.from_api_response(resolution_data)
-
-        duedate = (
-            fields.get("duedate") if isinstance(fields.get("duedate"), str) else None
-        )
-        resolutiondate = (
-            fields.get("resolutiondate")
-            if isinstance(fields.get("resolutiondate"), str)
-            else None
-        )
-        parent = (
-            fields.get("parent") if isinstance(fields.get("parent"), dict) else None
-        )
-        # Ensure subtasks is a list of dicts
-        subtasks_raw = fields.get("subtasks", [])
-        subtasks = (
-            [st for st in subtasks_raw if isinstance(st, dict)]
-            if isinstance(subtasks_raw, list)
-            else []
-        )
-        security = (
-            fields.get("security") if isinstance(fields.get("security"), dict) else None
-        )
-        worklog = (
-            fields.get("worklog") if isinstance(fields.get("worklog"), dict) else None
-        )
+    @classmethod
+    def field_selection(cls, requested_fields: Any) -> "FieldSelection":
+        """
+        Get the compiled selection of output entries for the requested fields.
 
-        # Lists of strings
-        labels = []
-        if labels_data := fields.get("labels"):
-            if isinstance(labels_data, list):
-                labels = [str(label) for label in labels_data if label]
-
-        components = []
-        if components_data := fields.get("components"):
-            if isinstance(components_data, list):
-                components = [
-                    str(comp.get("name", "")) if isinstance(comp, dict) else str(comp)
-                    for comp in components_data
-                    if comp
-                ]
-
-        fix_versions = []
-        if fix_versions_data := fields.get("fixVersions"):
-            if isinstance(fix_versions_data, list):
-                fix_versions = [
-                    str(version.get("name", ""))
-                    if isinstance(version, dict)
-                    else str(version)
-                    for version in fix_versions_data
-                    if version
-                ]
-
-        # Handling comments
-        comments = []
-        comments_field = fields.get("comment", {})
-        if isinstance(comments_field, dict) and "comments" in comments_field:
-            comments_data = comments_field["comments"]
-            if isinstance(comments_data, list):
-                comments = [
-                    JiraComment.from_api_response(comment)
-                    for comment in comments_data
-                    if comment
-                ]
-
-        # Handling changelogs
-        changelogs = []
-        changelogs_data = data.get("changelog", {})
-        if isinstance(changelogs_data, dict) and "histories" in changelogs_data:
-            changelogs = [
-                JiraChangelog.from_api_response(history)
-                for history in changelogs_data["histories"]
-            ]
+        Selections are cached, so converting many issues requested with the
+        same fields compiles the selection once.
 
-        # Handling attachments
-        attachments = []
-        attachments_data = fields.get("attachment", [])
-        if isinstance(attachments_data, list):
-            attachments = [
-                JiraAttachment.from_api_response(attachment)
-                for attachment in attachments_data
-                if attachment
-            ]
+        Args:
+            requested_fields: The requested fields, as accepted by from_api_response
 
-        # Timetracking
-        timetracking = None
-        timetracking_data = fields.get("timetracking")
-        if timetracking_data:
-            timetracking = JiraTimetracking.from_api_response(timetracking_data)
+        Returns:
+            The FieldSelection for the requested fields
+        """
+        requested_fields = cls._normalize_requested_fields(requested_fields)
+        if isinstance(requested_fields, list):
+            return _compile_field_selection(tuple(requested_fields))
+        return _compile_field_selection(requested_fields)
 
-        # URL
-        url = data.get("self")  # API URL for the issue
+    @staticmethod
+    def _add_simplified_field(
+        result: dict[str, Any], field: "IssueField", value: Any
+    ) -> None:
+        """
+        Add a simplified value to the result if the spec says it is present.
 
-        # Try to find epic fields (varies by Jira instance)
-        epic_key = None
-        epic_name = None
+        Models are included even when their simplified form is empty, other
+        values only when truthy unless the spec keeps empty values.
+        """
+        if value is None:
+            value = field.default
+        if (field.model is not None and isinstance(value, dict)) or (
+            value or field.keep_empty
+        ):
+            result[field.key] = value
 
-        # Check for "Epic Link" field
-        epic_link = cls._find_custom_field_in_api_response(
-            fields, ["epic link", "parent epic"]
-        )
-        if isinstance(epic_link, str):
-            epic_key = epic_link
+    @staticmethod
+    def _extract_custom_fields(fields: dict[str, Any]) -> dict[str, Any]:
+        """
+        Collect the custom fields of an issue from the API fields.
 
-        # Check for "Epic Name" field
-        epic_name_value = cls._find_custom_field_in_api_response(fields, ["epic name"])
-        if isinstance(epic_name_value, str):
-            epic_name = epic_name_value
+        Args:
+            fields: The fields dictionary from the Jira API
 
-        # Store custom fields
+        Returns:
+            Custom field values keyed by their name when the value is a named
+            object, by their field ID otherwise
+        """
         custom_fields = {}
         for field_id, field_value in fields.items():
             if field_id.startswith("customfield_"):
@@ -433,213 +319,172 @@ class JiraIssue(ApiModel, TimestampMixin):
                 else:
                     # Use the original ID as the key (instead of shortened version)
                     custom_fields[field_id] = field_value
+        return custom_fields
 
-        # Handle requested_fields parameter
-        requested_fields_param = kwargs.get("requested_fields")
-
-        # Convert string requested_fields to list (except "*all")
-        if isinstance(requested_fields_param, str) and requested_fields_param != "*all":
-            requested_fields_param = requested_fields_param.split(",")
-            # Strip whitespace from each field name
-            requested_fields_param = [field.strip() for field in requested_fields_param]
+    @classmethod
+    def _simplify_custom_fields(
+        cls, custom_fields: dict[str, Any], selection: "FieldSelection"
+    ) -> dict[str, Any]:
+        """
+        Select and simplify the custom fields for the simplified dictionary.
 
-        # Create the issue instance with all the extracted data
-        return cls(
-            id=issue_id,
-            key=key,
-            summary=summary,
-            description=description,
-            created=created,
-            updated=updated,
-            status=status,
-            issue_type=issue_type,
-            priority=priority,
-            assignee=assignee,
-            reporter=reporter,
-            project=project,
-            resolution=resolution,
-            duedate=duedate,
-            resolutiondate=resolutiondate,
-            parent=parent,
-            subtasks=subtasks,
-            security=security,
-            worklog=worklog,
-            labels=labels,
-            components=components,
-            comments=comments,
-            attachments=attachments,
-            timetracking=timetracking,
-            url=url,
-            epic_key=epic_key,
-            epic_name=epic_name,
-            fix_versions=fix_versions,
-            custom_fields=custom_fields,
-            requested_fields=requested_fields_param,
-            changelogs=changelogs,
-        )
+        Args:
+            custom_fields: Custom fields as returned by _extract_custom_fields
+            selection: The compiled selection of the requested fields
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
-        result: dict[str, Any] = {
-            "id": self.id,
-            "key": self.key,
+        Returns:
+            The simplified custom field values to add to the result
+        """
+        if not custom_fields:
+            return {}
+
+        # Add all custom fields if "*all" is requested
+        if selection.all_custom_fields:
+            return {
+                field_id: cls._process_custom_field_value(field_value)
+                for field_id, field_value in custom_fields.items()
+            }
+
+        # Add specific requested custom fields
+        return {
+            field_id: cls._process_custom_field_value(custom_fields[field_id])
+            for field_id in selection.custom_field_ids
+            if field_id in custom_fields
         }
 
-        # Helper method to check if a field should be included
-        def should_include_field(field_name: str) -> bool:
-            return (
-                self.requested_fields == "*all"
-                or not isinstance(self.requested_fields, list)
-                or field_name in self.requested_fields
-            )
-
-        # Add summary if requested
-        if should_include_field("summary"):
-            result["summary"] = self.summary
-
-        # Add URL if available and requested
-        if self.url and should_include_field("url"):
-            result["url"] = self.url
-
-        # Add description if available and requested
-        if self.description and should_include_field("description"):
-            result["description"] = self.description
-
-        # Add status if available and requested
-        if self.status and should_include_field("status"):
-            result["status"] = self.status.to_simplified_dict()
-
-        # Add issue type if available and requested
-        if self.issue_type and should_include_field("issue_type"):
-            result["issue_type"] = self.issue_type.to_simplified_dict()
-
-        # Add priority if available and requested
-        if self.priority and should_include_field("priority"):
-            result["priority"] = self.priority.to_simplified_dict()
-
-        # Add project info if available and requested
-        if self.project and should_include_field("project"):
-            result["project"] = self.project.to_simplified_dict()
-
-        # Add resolution if available and requested
-        if self.resolution and should_include_field("resolution"):
-            result["resolution"] = self.resolution.to_simplified_dict()
-
-        # Add dates if available and requested
-        if self.duedate and should_include_field("duedate"):
-            result["duedate"] = self.duedate
-
-        if self.resolutiondate and should_include_field("resolutiondate"):
-            result["resolutiondate"] = self.resolutiondate
-
-        # Add parent and subtasks if available and requested
-        if self.parent and should_include_field("parent"):
-            result["parent"] = self.parent
+    @staticmethod
+    def _api_fields(data: dict[str, Any]) -> dict[str, Any]:
+        """Get the fields dictionary of an issue from the API response."""
+        fields = data.get("fields", {})
+        return fields if isinstance(fields, dict) else {}
 
-        if self.subtasks and should_include_field("subtasks"):
-            result["subtasks"] = self.subtasks
+    @classmethod
+    def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraIssue":
+        """
+        Create a JiraIssue from a Jira API response.
 
-        # Add security and worklog if available and requested
-        if self.security and should_include_field("security"):
-            result["security"] = self.security
+        Args:
+            data: The issue data from the Jira API
+            **kwargs: Additional arguments, such as requested_fields, or an
+                EntityRegistry as registry to share nested entities
 
-        if self.worklog and should_include_field("worklog"):
-            result["worklog"] = self.worklog
+        Returns:
+            A JiraIssue instance
+        """
+        if not data:
+            return cls()
 
-        # Add assignee if requested
-        if should_include_field("assignee"):
-            if self.assignee:
-                result["assignee"] = self.assignee.to_simplified_dict()
-            else:
-                result["assignee"] = {"display_name": "Unassigned"}
+        # Handle non-dictionary data by returning a default instance
+        if not isinstance(data, dict):
+            logger.debug("Received non-dictionary data, returning default instance")
+            return cls()
 
-        # Add reporter if available and requested
-        if self.reporter and should_include_field("reporter"):
-            result["reporter"] = self.reporter.to_simplified_dict()
+        fields = cls._api_fields(data)
+        registry = kwargs.get("registry")
+
+        # Extract the fields of the simplified output, building nested models
+        values: dict[str, Any] = {}
+        for field in ISSUE_FIELDS:
+            value = field.extract(data, fields)
+            if field.model is not None and value is not None:
+                if isinstance(value, list):
+                    value = [
+                        field.model.from_api_response(item, registry=registry)
+                        for item in value
+                    ]
+                else:
+                    value = field.model.from_api_response(value, registry=registry)
+            values[field.key] = value
 
-        # Add lists if available and requested
-        if self.labels and should_include_field("labels"):
-            result["labels"] = self.labels
+        # Create the issue instance with all the extracted data
+        return cls(
+            id=str(data.get("id", JIRA_DEFAULT_ID)),
+            key=str(data.get("key", JIRA_DEFAULT_KEY)),
+            custom_fields=cls._extract_custom_fields(fields),
+            requested_fields=cls._normalize_requested_fields(
+                kwargs.get("requested_fields")
+            ),
+            **values,
+        )
 
-        if self.components and should_include_field("components"):
-            result["components"] = self.components
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Convert issue data from the Jira API straight to the simplified dictionary.
 
-        if self.fix_versions and should_include_field("fix_versions"):
-            result["fix_versions"] = self.fix_versions
+        This gives the same result as ``from_api_response(data,
+        requested_fields=...).to_simplified_dict()`` without building the
+        issue and its nested models, and only extracts the requested fields.
 
-        # Add epic fields if available and requested
-        if self.epic_key and should_include_field("epic_key"):
-            result["epic_key"] = self.epic_key
+        Args:
+            data: The issue data from the Jira API
+            **kwargs: Additional arguments, such as requested_fields, or the
+                already compiled FieldSelection as selection
 
-        if self.epic_name and should_include_field("epic_name"):
-            result["epic_name"] = self.epic_name
+        Returns:
+            The simplified issue dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
 
-        # Add time tracking if available and requested
-        if self.timetracking and should_include_field("timetracking"):
-            result["timetracking"] = self.timetracking.to_simplified_dict()
+        fields = cls._api_fields(data)
+        selection = kwargs.get("selection") or cls.field_selection(
+            kwargs.get("requested_fields")
+        )
 
-        # Add created and updated timestamps if available and requested
-        if self.created and should_include_field("created"):
-            result["created"] = self.created
+        result: dict[str, Any] = {
+            "id": str(data.get("id", JIRA_DEFAULT_ID)),
+            "key": str(data.get("key", JIRA_DEFAULT_KEY)),
+        }
 
-        if self.updated and should_include_field("updated"):
-            result["updated"] = self.updated
+        for field in selection.fields:
+            value = field.extract(data, fields)
+            if field.model is not None and value is not None:
+                if isinstance(value, list):
+                    value = [field.model.simplify_api_response(item) for item in value]
+                else:
+                    value = field.model.simplify_api_response(value)
+            cls._add_simplified_field(result, field, value)
+
+        # Custom fields are only output for "*all" or when listed explicitly
+        if selection.all_custom_fields or selection.custom_field_ids:
+            result.update(
+                cls._simplify_custom_fields(
+                    cls._extract_custom_fields(fields), selection
+                )
+            )
 
-        # Add comments if available and requested
-        if self.comments and should_include_field("comment"):
-            result["comments"] = [
-                comment.to_simplified_dict() for comment in self.comments
-            ]
+        return {k: v for k, v in result.items() if v is not None}
 
-        # Add attachments if available and requested
-        if self.attachments and should_include_field("attachment"):
-            result["attachments"] = [
-                attachment.to_simplified_dict() for attachment in self.attachments
-            ]
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        result: dict[str, Any] = {
+            "id": self.id,
+            "key": self.key,
+        }
 
-        # Not use should_include_field since you won't get changelogs
-        # if you don't ask for them
-        if self.changelogs:
-            result["changelogs"] = [
-                changelog.to_simplified_dict() for changelog in self.changelogs
-            ]
+        # Read the attributes from the instance dictionary, which is faster
+        # than attribute access for the ~30 entries of every issue
+        values = self.__dict__
+        selection = self.field_selection(values["requested_fields"])
+        for field in selection.fields:
+            value = values[field.key]
+            if field.model is not None and value is not None:
+                if isinstance(value, list):
+                    value = [item.to_simplified_dict() for item in value]
+                else:
+                    value = value.to_simplified_dict()
+            self._add_simplified_field(result, field, value)
 
         # Process custom fields
-        if self.custom_fields:
-            # Add all custom fields if "*all" is requested
-            if self.requested_fields == "*all":
-                # Loop through custom fields and add all of them
-                for field_id, field_value in self.custom_fields.items():
-                    # Process the value to make it more user-friendly
-                    processed_value = self._process_custom_field_value(field_value)
-                    result[field_id] = processed_value
-
-            # Add specific requested custom fields
-            elif isinstance(self.requested_fields, list):
-                for field in self.requested_fields:
-                    # Check for customfield_ format
-                    if field.startswith("customfield_"):
-                        # Try to find the field in custom_fields
-                        if field in self.custom_fields:
-                            value = self._process_custom_field_value(
-                                self.custom_fields[field]
-                            )
-                            result[field] = value
-
-                    # Check for cf_ format (for backward compatibility in requests)
-                    elif field.startswith("cf_"):
-                        full_id = "customfield_" + field[3:]  # Convert to full form
-
-                        # Try to find the full version in custom_fields
-                        if full_id in self.custom_fields:
-                            value = self._process_custom_field_value(
-                                self.custom_fields[full_id]
-                            )
-                            result[full_id] = value
+        result.update(self._simplify_custom_fields(values["custom_fields"], selection))
 
         return {k: v for k, v in result.items() if v is not None}
 
-    def _process_custom_field_value(self, field_value: Any) -> Any:
+    @staticmethod
+    def _process_custom_field_value(field_value: Any) -> Any:
         """
         Process a custom field value for simplified dict output.
 
@@ -744,3 +589,254 @@ class JiraIssue(ApiModel, TimestampMixin):
                     return field_value.get("key") or field_value.get("value")
                 return str(field_value)
         return None
+
+
+class IssueField(NamedTuple):
+    """
+    One entry of the simplified issue dictionary.
+
+    ISSUE_FIELDS lists the entries in output order. The same spec drives
+    JiraIssue.from_api_response, to_simplified_dict and simplify_api_response,
+    so the model and the direct conversion of API responses stay in sync.
+    """
+
+    # Key in the simplified dictionary, also the JiraIssue attribute name
+    key: str
+    # Name selecting the entry in requested_fields (None: always included)
+    requested: str | None
+    # Gets the raw value from the API issue and its fields
+    extract: Callable[[dict[str, Any], dict[str, Any]], Any]
+    # Model of the value (or of its items, for lists), None for plain values
+    model: type[ApiModel] | None = None
+    # Include the entry even when the value is empty
+    keep_empty: bool = False
+    # Simplified value used when the raw value is missing
+    default: Any = None
+
+
+def _dict_or_none(value: Any) -> dict | None:
+    return value if isinstance(value, dict) else None
+
+
+def _str_or_none(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _names(values: Any) -> list[str]:
+    """Get the names of components or versions, which may also be plain strings."""
+    if not values or not isinstance(values, list):
+        return []
+    return [
+        str(value.get("name", "")) if isinstance(value, dict) else str(value)
+        for value in values
+        if value
+    ]
+
+
+def _labels(data: dict[str, Any], fields: dict[str, Any]) -> list[str]:
+    labels = fields.get("labels")
+    if not labels or not isinstance(labels, list):
+        return []
+    return [str(label) for label in labels if label]
+
+
+def _subtasks(data: dict[str, Any], fields: dict[str, Any]) -> list[dict]:
+    subtasks = fields.get("subtasks", [])
+    if not isinstance(subtasks, list):
+        return []
+    return [subtask for subtask in subtasks if isinstance(subtask, dict)]
+
+
+def _comments(data: dict[str, Any], fields: dict[str, Any]) -> list[dict]:
+    comment_field = fields.get("comment", {})
+    if not isinstance(comment_field, dict):
+        return []
+    comments = comment_field.get("comments")
+    if not isinstance(comments, list):
+        return []
+    return [comment for comment in comments if comment]
+
+
+def _attachments(data: dict[str, Any], fields: dict[str, Any]) -> list[dict]:
+    attachments = fields.get("attachment", [])
+    if not isinstance(attachments, list):
+        return []
+    return [attachment for attachment in attachments if attachment]
+
+
+def _changelogs(data: dict[str, Any], fields: dict[str, Any]) -> list[dict]:
+    changelog = data.get("changelog", {})
+    if not isinstance(changelog, dict):
+        return []
+    histories = changelog.get("histories")
+    return histories if isinstance(histories, list) else []
+
+
+def _epic_key(data: dict[str, Any], fields: dict[str, Any]) -> str | None:
+    return _str_or_none(
+        JiraIssue._find_custom_field_in_api_response(
+            fields, ["epic link", "parent epic"]
+        )
+    )
+
+
+def _epic_name(data: dict[str, Any], fields: dict[str, Any]) -> str | None:
+    return _str_or_none(
+        JiraIssue._find_custom_field_in_api_response(fields, ["epic name"])
+    )
+
+
+ISSUE_FIELDS: tuple[IssueField, ...] = (
+    IssueField(
+        "summary",
+        "summary",
+        lambda data, fields: str(fields.get("summary", EMPTY_STRING)),
+        keep_empty=True,
+    ),
+    IssueField("url", "url", lambda data, fields: data.get("self")),
+    IssueField(
+        "description", "description", lambda data, fields: fields.get("description")
+    ),
+    IssueField(
+        "status",
+        "status",
+        lambda data, fields: fields.get("status") or None,
+        JiraStatus,
+    ),
+    IssueField(
+        "issue_type",
+        "issue_type",
+        lambda data, fields: fields.get("issuetype") or None,
+        JiraIssueType,
+    ),
+    IssueField(
+        "priority",
+        "priority",
+        lambda data, fields: fields.get("priority") or None,
+        JiraPriority,
+    ),
+    IssueField(
+        "project",
+        "project",
+        lambda data, fields: _dict_or_none(fields.get("project")),
+        JiraProject,
+    ),
+    IssueField(
+        "resolution",
+        "resolution",
+        lambda data, fields: _dict_or_none(fields.get("resolution")),
+        JiraResolution,
+    ),
+    IssueField(
+        "duedate", "duedate", lambda data, fields: _str_or_none(fields.get("duedate"))
+    ),
+    IssueField(
+        "resolutiondate",
+        "resolutiondate",
+        lambda data, fields: _str_or_none(fields.get("resolutiondate")),
+    ),
+    IssueField(
+        "parent", "parent", lambda data, fields: _dict_or_none(fields.get("parent"))
+    ),
+    IssueField("subtasks", "subtasks", _subtasks),
+    IssueField(
+        "security",
+        "security",
+        lambda data, fields: _dict_or_none(fields.get("security")),
+    ),
+    IssueField(
+        "worklog", "worklog", lambda data, fields: _dict_or_none(fields.get("worklog"))
+    ),
+    IssueField(
+        "assignee",
+        "assignee",
+        lambda data, fields: fields.get("assignee") or None,
+        JiraUser,
+        default={"display_name": "Unassigned"},
+    ),
+    IssueField(
+        "reporter",
+        "reporter",
+        lambda data, fields: fields.get("reporter") or None,
+        JiraUser,
+    ),
+    IssueField("labels", "labels", _labels),
+    IssueField(
+        "components",
+        "components",
+        lambda data, fields: _names(fields.get("components")),
+    ),
+    IssueField(
+        "fix_versions",
+        "fix_versions",
+        lambda data, fields: _names(fields.get("fixVersions")),
+    ),
+    IssueField("epic_key", "epic_key", _epic_key),
+    IssueField("epic_name", "epic_name", _epic_name),
+    IssueField(
+        "timetracking",
+        "timetracking",
+        lambda data, fields: fields.get("timetracking") or None,
+        JiraTimetracking,
+    ),
+    IssueField(
+        "created",
+        "created",
+        lambda data, fields: str(fields.get("created", EMPTY_STRING)),
+    ),
+    IssueField(
+        "updated",
+        "updated",
+        lambda data, fields: str(fields.get("updated", EMPTY_STRING)),
+    ),
+    IssueField("comments", "comment", _comments, JiraComment),
+    IssueField("attachments", "attachment", _attachments, JiraAttachment),
+    # Changelogs are only in the response when expanded, so always output them
+    IssueField("changelogs", None, _changelogs, JiraChangelog),
+)
+
+
+class FieldSelection(NamedTuple):
+    """
+    The output entries of the simplified issue selected by requested_fields.
+
+    Compiled once per distinct requested_fields and reused for every issue.
+    """
+
+    # Entries of ISSUE_FIELDS to output, in output order
+    fields: tuple[IssueField, ...]
+    # Output all custom fields ("*all" was requested)
+    all_custom_fields: bool
+    # IDs of the custom fields requested as customfield_* or cf_*, in order
+    custom_field_ids: tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def _compile_field_selection(
+    requested_fields: str | tuple[str, ...] | None,
+) -> FieldSelection:
+    """Compile the FieldSelection for normalized, hashable requested fields."""
+    if not isinstance(requested_fields, tuple):
+        # "*all" and None select every entry, only "*all" adds custom fields
+        return FieldSelection(
+            fields=ISSUE_FIELDS,
+            all_custom_fields=requested_fields == "*all",
+            custom_field_ids=(),
+        )
+
+    names = frozenset(requested_fields)
+    custom_field_ids = []
+    for name in requested_fields:
+        if name.startswith("customfield_"):
+            custom_field_ids.append(name)
+        elif name.startswith("cf_"):
+            custom_field_ids.append("customfield_" + name[3:])
+    return FieldSelection(
+        fields=tuple(
+            field
+            for field in ISSUE_FIELDS
+            if field.requested is None or field.requested in names
+        ),
+        all_custom_fields=False,
+        custom_field_ids=tuple(custom_field_ids),
+    )
@@ -13,7 +13,7 @@ from ..constants import (
     JIRA_DEFAULT_PROJECT,
     UNKNOWN,
 )
-from .common import JiraUser
+from .common import JiraUser, shared_entity
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,7 @@ class JiraProject(ApiModel):
     avatar_url: str | None = None
 
     @classmethod
+    @shared_entity("id", "key")
     def from_api_response(cls, data: dict[str, Any], **kwargs: Any) -> "JiraProject":
         """
         Create a JiraProject from a Jira API response.
@@ -58,7 +59,9 @@ class JiraProject(ApiModel):
         lead = None
         lead_data = data.get("lead")
         if lead_data:
-            lead = JiraUser.from_api_response(lead_data)
+            lead = JiraUser.from_api_response(
+                lead_data, registry=kwargs.get("registry")
+            )
 
         # Get avatar URL from avatarUrls if available
         avatar_url = None
@@ -109,3 +112,34 @@ class JiraProject(ApiModel):
             result["lead"] = self.lead.to_simplified_dict()
 
         return result
+
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """Convert project data from the Jira API to the simplified dictionary."""
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        result: dict[str, Any] = {
+            "key": str(data.get("key", EMPTY_STRING)),
+            "name": str(data.get("name", UNKNOWN)),
+        }
+
+        if description := data.get("description"):
+            result["description"] = description
+
+        project_category = data.get("projectCategory")
+        if isinstance(project_category, dict) and (
+            category_name := project_category.get("name")
+        ):
+            result["category"] = category_name
+
+        avatars = data.get("avatarUrls")
+        if isinstance(avatars, dict) and (avatar_url := avatars.get("48x48")):
+            result["avatar_url"] = avatar_url
+
+        if lead := data.get("lead"):
+            result["lead"] = JiraUser.simplify_api_response(lead)
+
+        return result
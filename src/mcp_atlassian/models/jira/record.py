@@ -0,0 +1,217 @@
+"""
+Compact Jira issue records.
+
+This module provides a memory-compact, read-only form of simplified Jira
+issues, for holding many issues while iterating over large result sets.
+"""
+
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from cachetools import LRUCache
+
+from .issue import JiraIssue
+
+# Distinct nested values shared by one RecordInterner (least recently used
+# values are dropped first)
+DEFAULT_MAX_SHARED_VALUES = 4096
+
+# Longer strings are mostly unique (descriptions, comment bodies) and not interned
+MAX_INTERNED_STRING_LENGTH = 64
+
+
+class _FrozenDict:
+    """Immutable mapping stored as a key tuple and a value tuple."""
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        self._keys = keys
+        self._values = values
+
+
+def _thaw(value: Any) -> Any:
+    """Convert a frozen value back to plain dictionaries and lists."""
+    if isinstance(value, _FrozenDict):
+        return {
+            key: _thaw(item)
+            for key, item in zip(value._keys, value._values, strict=True)
+        }
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class RecordInterner:
+    """
+    Shares repeated strings and nested values between issue records.
+
+    Statuses, priorities, users, projects and the key sets of the simplified
+    dictionaries repeat across the issues of a result set. Records created
+    with the same interner store each of them once.
+    """
+
+    def __init__(self, max_shared_values: int = DEFAULT_MAX_SHARED_VALUES) -> None:
+        """
+        Initialize the interner.
+
+        Args:
+            max_shared_values: Maximum number of distinct nested values kept
+                for sharing
+        """
+        self._shared: LRUCache = LRUCache(maxsize=max(1, max_shared_values))
+
+    def _share(self, key: Any, value: Any) -> Any:
+        shared = self._shared.get(key)
+        if shared is None:
+            self._shared[key] = shared = value
+        return shared
+
+    def freeze_keys(self, keys: tuple[str, ...]) -> tuple[str, ...]:
+        """Get the shared tuple of interned dictionary keys."""
+        keys = tuple(sys.intern(key) for key in keys)
+        return self._share(keys, keys)
+
+    def _freeze(self, value: Any) -> tuple[Any, Any]:
+        """
+        Freeze a value and build its sharing key.
+
+        The key tags every scalar with its type, since values that compare
+        equal, like True, 1 and 1.0, must not be shared.
+        """
+        if isinstance(value, str):
+            if len(value) <= MAX_INTERNED_STRING_LENGTH:
+                value = sys.intern(value)
+            return value, value
+        if isinstance(value, dict):
+            keys = self.freeze_keys(tuple(value))
+            items = [self._freeze(item) for item in value.values()]
+            key = (dict, keys, tuple(item_key for _, item_key in items))
+            frozen = _FrozenDict(keys, tuple(item for item, _ in items))
+            return self._share(key, frozen), key
+        if isinstance(value, list):
+            items = [self._freeze(item) for item in value]
+            key = (list, tuple(item_key for _, item_key in items))
+            return self._share(key, tuple(item for item, _ in items)), key
+        return value, (type(value), value)
+
+    def freeze(self, value: Any) -> Any:
+        """
+        Convert a JSON value to its shared, immutable form.
+
+        Dictionaries and lists become immutable and equal ones are shared,
+        short strings are interned.
+
+        Args:
+            value: The value to freeze
+
+        Returns:
+            The frozen value
+        """
+        return self._freeze(value)[0]
+
+
+class JiraIssueRecord:
+    """
+    Compact, read-only form of a simplified Jira issue.
+
+    Holds only the entries of the simplified dictionary for the requested
+    fields, as a key tuple shared between records and a tuple of frozen
+    values. Use it instead of JiraIssue when many issues are kept in memory.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: tuple[str, ...], values: tuple[Any, ...]) -> None:
+        """
+        Initialize the record from frozen keys and values.
+
+        Use from_api_response or from_simplified_dict to create records, or
+        pass keys and values frozen with a RecordInterner.
+        """
+        self._keys = keys
+        self._values = values
+
+    @classmethod
+    def from_simplified_dict(
+        cls, simplified: dict[str, Any], interner: RecordInterner | None = None
+    ) -> "JiraIssueRecord":
+        """
+        Create a record from a simplified issue dictionary.
+
+        Args:
+            simplified: The simplified issue dictionary
+            interner: Interner shared by the records of a result set
+
+        Returns:
+            A JiraIssueRecord instance
+        """
+        if interner is None:
+            interner = RecordInterner()
+        return cls(
+            interner.freeze_keys(tuple(simplified)),
+            tuple(interner.freeze(value) for value in simplified.values()),
+        )
+
+    @classmethod
+    def from_api_response(
+        cls,
+        data: dict[str, Any],
+        interner: RecordInterner | None = None,
+        **kwargs: Any,
+    ) -> "JiraIssueRecord":
+        """
+        Create a record from a Jira API response.
+
+        Args:
+            data: The issue data from the Jira API
+            interner: Interner shared by the records of a result set
+            **kwargs: Arguments for JiraIssue.simplify_api_response, such as
+                requested_fields or selection
+
+        Returns:
+            A JiraIssueRecord instance
+        """
+        return cls.from_simplified_dict(
+            JiraIssue.simplify_api_response(data, **kwargs), interner
+        )
+
+    @property
+    def id(self) -> str:
+        """The issue ID."""
+        return self["id"]
+
+    @property
+    def key(self) -> str:
+        """The issue key."""
+        return self["key"]
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return _thaw(self._values[self._keys.index(name)])
+        except ValueError:
+            raise KeyError(name) from None
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"JiraIssueRecord(key={self.get('key')!r})"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get an entry of the simplified issue, or default if it is missing."""
+        return self[name] if name in self._keys else default
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        return {
+            key: _thaw(value)
+            for key, value in zip(self._keys, self._values, strict=True)
+        }
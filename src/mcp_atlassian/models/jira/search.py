@@ -10,6 +10,7 @@ from typing import Any
 from pydantic import Field, model_validator
 
 from ..base import ApiModel
+from .common import EntityRegistry
 from .issue import JiraIssue
 
 logger = logging.getLogger(__name__)
@@ -34,7 +35,8 @@ class JiraSearchResult(ApiModel):
 
         Args:
             data: The search result data from the Jira API
-            **kwargs: Additional arguments to pass to the constructor
+            **kwargs: Additional arguments, such as requested_fields, or an
+                EntityRegistry as registry (a new one is used by default)
 
         Returns:
             A JiraSearchResult instance
@@ -46,36 +48,24 @@ class JiraSearchResult(ApiModel):
             logger.debug("Received non-dictionary data, returning default instance")
             return cls()
 
+        # Build the statuses, users, ... repeated across the issues once
+        registry = kwargs.get("registry") or EntityRegistry()
+        requested_fields = kwargs.get("requested_fields")
+
         issues = []
         issues_data = data.get("issues", [])
         if isinstance(issues_data, list):
             for issue_data in issues_data:
                 if issue_data:
-                    requested_fields = kwargs.get("requested_fields")
                     issues.append(
                         JiraIssue.from_api_response(
-                            issue_data, requested_fields=requested_fields
+                            issue_data,
+                            requested_fields=requested_fields,
+                            registry=registry,
                         )
                     )
 
-        raw_total = data.get("total")
-        raw_start_at = data.get("startAt")
-        raw_max_results = data.get("maxResults")
-
-        try:
-            total = int(raw_total) if raw_total is not None else -1
-        except (ValueError, TypeError):
-            total = -1
-
-        try:
-            start_at = int(raw_start_at) if raw_start_at is not None else -1
-        except (ValueError, TypeError):
-            start_at = -1
-
-        try:
-            max_results = int(raw_max_results) if raw_max_results is not None else -1
-        except (ValueError, TypeError):
-            max_results = -1
+        total, start_at, max_results = cls._pagination(data)
 
         return cls(
             total=total,
@@ -84,6 +74,74 @@ class JiraSearchResult(ApiModel):
             issues=issues,
         )
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Convert a search result from the Jira API straight to the simplified dictionary.
+
+        This gives the same result as ``from_api_response(data,
+        requested_fields=...).to_simplified_dict()`` without building the
+        issue models, see JiraIssue.simplify_api_response.
+
+        Args:
+            data: The search result data from the Jira API
+            **kwargs: Additional arguments, such as requested_fields
+
+        Returns:
+            The simplified search result dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls().to_simplified_dict()
+
+        # Compile the requested fields once for all issues of the page
+        selection = JiraIssue.field_selection(kwargs.get("requested_fields"))
+        issues_data = data.get("issues", [])
+        issues = (
+            [
+                JiraIssue.simplify_api_response(issue_data, selection=selection)
+                for issue_data in issues_data
+                if issue_data
+            ]
+            if isinstance(issues_data, list)
+            else []
+        )
+
+        total, start_at, max_results = cls._pagination(data)
+        return {
+            "total": total,
+            "start_at": start_at,
+            "max_results": max_results,
+            "issues": issues,
+        }
+
+    @staticmethod
+    def _pagination(data: dict[str, Any]) -> tuple[int, int, int]:
+        """
+        Get the total, start index and page size of a search result.
+
+        Values that are missing or not integers are returned as -1.
+        """
+        values = []
+        for name in ("total", "startAt", "maxResults"):
+            raw_value = data.get(name)
+            try:
+                values.append(int(raw_value) if raw_value is not None else -1)
+            except (ValueError, TypeError):
+                values.append(-1)
+        total, start_at, max_results = values
+        return total, start_at, max_results
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        return {
+            "total": self.total,
+            "start_at": self.start_at,
+            "max_results": self.max_results,
+            "issues": [issue.to_simplified_dict() for issue in self.issues],
+        }
+
     @model_validator(mode="after")
     def validate_search_result(self) -> "JiraSearchResult":
         """
@@ -3,13 +3,41 @@
 import logging
 import re
 import warnings
-from typing import Any, Protocol
+from collections.abc import Iterable
+from typing import Any, Literal, Protocol
 
 from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
 from markdownify import markdownify as md
 
+from ..utils.cache import SharedTTLCache
+from ..utils.environment import get_int_env
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Kinds of user identifiers found in Confluence storage format
+ACCOUNT_ID = "accountid"
+USERNAME = "username"
+
+# Maximum number of account IDs per bulk user request (Confluence Cloud)
+USER_BULK_LIMIT = 100
+
+UserRef = tuple[str, str]
+
+OutputFormat = Literal["html", "markdown"]
+
+# Display names by (site URL, identifier kind, identifier), shared by every
+# preprocessor. Users that could not be resolved are remembered separately, as
+# an empty name, for a shorter time.
+_user_names: SharedTTLCache[tuple[str, str, str], str] = SharedTTLCache(
+    maxsize=lambda: get_int_env("CONFLUENCE_USER_CACHE_SIZE", 4096),
+    ttl=lambda: get_int_env("CONFLUENCE_USER_CACHE_TTL", 3600),
+)
+_unknown_users: SharedTTLCache[tuple[str, str, str], str] = SharedTTLCache(
+    maxsize=lambda: get_int_env("CONFLUENCE_USER_CACHE_SIZE", 4096),
+    ttl=lambda: get_int_env("CONFLUENCE_USER_NEGATIVE_CACHE_TTL", 300),
+)
+
 
 class ConfluenceClient(Protocol):
     """Protocol for Confluence client."""
@@ -40,7 +68,10 @@ class BasePreprocessor:
         self.confluence_client = confluence_client
 
     def process_html_content(
-        self, html_content: str, space_key: str = ""
+        self,
+        html_content: str,
+        space_key: str = "",
+        output_format: OutputFormat | None = None,
     ) -> tuple[str, str]:
         """
         Process HTML content to replace user refs and page links.
@@ -48,21 +79,40 @@ class BasePreprocessor:
         Args:
             html_content: The HTML content to process
             space_key: Optional space key for context
+            output_format: Produce only this output ("html" or "markdown"); the
+                other element of the returned tuple is then an empty string.
+                Both are produced by default.
 
         Returns:
             Tuple of (processed_html, processed_markdown)
         """
         try:
+            want_html = output_format != "markdown"
+            want_markdown = output_format != "html"
+
+            # Only Confluence constructs (ac:/ri: elements) need rewriting
+            rewrite = "<ac:" in html_content or "<ri:" in html_content
+            if not rewrite and not want_markdown:
+                return html_content, ""
+
             # Parse the HTML content
             soup = BeautifulSoup(html_content, "html.parser")
 
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup)
-            self._process_user_profile_macros_in_soup(soup)
+            if rewrite:
+                # Resolve every referenced user before rewriting the document
+                user_names = self._resolve_user_names_in_soup(soup)
+
+                # Process user mentions
+                self._process_user_mentions_in_soup(soup, user_names)
+                self._process_user_profile_macros_in_soup(soup, user_names)
 
             # Convert to string and markdown
-            processed_html = str(soup)
-            processed_markdown = md(processed_html)
+            processed_html = ""
+            if want_html:
+                processed_html = str(soup) if rewrite else html_content
+            processed_markdown = (
+                MarkdownConverter().convert_soup(soup) if want_markdown else ""
+            )
 
             return processed_html, processed_markdown
 
@@ -70,12 +120,184 @@ class BasePreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
-    def _process_user_mentions_in_soup(self, soup: BeautifulSoup) -> None:
+    def _resolve_user_names_in_soup(self, soup: BeautifulSoup) -> dict[UserRef, str]:
+        """
+        Look up the display names of all users mentioned in a document at once.
+
+        Args:
+            soup: BeautifulSoup object containing HTML
+
+        Returns:
+            Display names by (identifier kind, identifier); empty for unknown users
+        """
+        if self.confluence_client is None:
+            return {}
+
+        user_refs: list[UserRef] = []
+        for user_element in soup.find_all("ac:link"):
+            if not isinstance(user_element, Tag):
+                continue
+            user_ref = user_element.find("ri:user")
+            if not isinstance(user_ref, Tag):
+                continue
+            account_id = user_ref.get("ri:account-id")
+            if account_id and isinstance(account_id, str):
+                user_refs.append((ACCOUNT_ID, account_id))
+
+        for macro_element in soup.find_all(
+            "ac:structured-macro", attrs={"ac:name": "profile"}
+        ):
+            if not isinstance(macro_element, Tag):
+                continue
+            user_param = macro_element.find("ac:parameter", attrs={"ac:name": "user"})
+            if not isinstance(user_param, Tag):
+                continue
+            user_ref = user_param.find("ri:user")
+            if not isinstance(user_ref, Tag):
+                continue
+            account_id = user_ref.get("ri:account-id")
+            userkey = user_ref.get("ri:userkey")
+            if account_id and isinstance(account_id, str):
+                user_refs.append((ACCOUNT_ID, account_id))
+            elif userkey and isinstance(userkey, str):
+                user_refs.append((USERNAME, userkey))
+
+        return self._get_user_display_names(user_refs) if user_refs else {}
+
+    def _get_user_display_names(
+        self, user_refs: Iterable[UserRef]
+    ) -> dict[UserRef, str]:
+        """
+        Get display names from the shared user cache, fetching unknown users.
+
+        Account IDs are fetched with one bulk request per USER_BULK_LIMIT users
+        when the client talks to Confluence Cloud, other users one at a time.
+
+        Args:
+            user_refs: (identifier kind, identifier) pairs, duplicates allowed
+
+        Returns:
+            Display names by user reference; empty for users without a name
+        """
+        names: dict[UserRef, str] = {}
+        missing: list[UserRef] = []
+        for user_ref in dict.fromkeys(user_refs):
+            cache_key = (self.base_url, *user_ref)
+            name = _user_names.get(cache_key)
+            if name is None:
+                name = _unknown_users.get(cache_key)
+            if name is None:
+                missing.append(user_ref)
+            else:
+                names[user_ref] = name
+
+        fetched: dict[UserRef, str] = {}
+        account_ids = [identifier for kind, identifier in missing if kind == ACCOUNT_ID]
+        if len(account_ids) > 1 and self._supports_bulk_user_lookup():
+            fetched.update(self._fetch_user_display_names_in_bulk(account_ids))
+        for user_ref in missing:
+            if user_ref not in fetched:
+                fetched[user_ref] = self._fetch_user_display_name(*user_ref)
+
+        for user_ref, name in fetched.items():
+            cache = _user_names if name else _unknown_users
+            cache.set((self.base_url, *user_ref), name)
+        names.update(fetched)
+        return names
+
+    def _get_user_display_name(
+        self, kind: str, identifier: str, user_names: dict[UserRef, str] | None
+    ) -> str:
+        """Get one display name, preferring names resolved by the pre-pass."""
+        if user_names is not None and (kind, identifier) in user_names:
+            return user_names[(kind, identifier)]
+        return self._get_user_display_names([(kind, identifier)]).get(
+            (kind, identifier), ""
+        )
+
+    def _supports_bulk_user_lookup(self) -> bool:
+        """Check whether the client can use the Confluence Cloud bulk user API."""
+        client = self.confluence_client
+        return getattr(client, "cloud", False) is True and callable(
+            getattr(client, "get", None)
+        )
+
+    def _fetch_user_display_names_in_bulk(
+        self, account_ids: list[str]
+    ) -> dict[UserRef, str]:
+        """
+        Fetch display names with the Confluence Cloud bulk user API.
+
+        Args:
+            account_ids: Account IDs to look up
+
+        Returns:
+            Display names of the users of every successful request (empty for
+            users missing from the response). Users of failed requests are left
+            out so that they can be fetched one at a time.
+        """
+        client: Any = self.confluence_client
+        names: dict[UserRef, str] = {}
+        for i in range(0, len(account_ids), USER_BULK_LIMIT):
+            chunk = account_ids[i : i + USER_BULK_LIMIT]
+            try:
+                response = client.get(
+                    "rest/api/user/bulk",
+                    params={"accountId": chunk, "limit": len(chunk)},
+                )
+            except Exception as e:  # noqa: BLE001 - Fall back to single lookups
+                logger.warning(f"Error fetching user details in bulk: {str(e)}")
+                continue
+            if not isinstance(response, dict):
+                continue
+
+            found = {
+                user.get("accountId"): user.get("displayName") or ""
+                for user in response.get("results", [])
+                if isinstance(user, dict)
+            }
+            for account_id in chunk:
+                names[(ACCOUNT_ID, account_id)] = found.get(account_id, "")
+        return names
+
+    def _fetch_user_display_name(self, kind: str, identifier: str) -> str:
+        """
+        Fetch the display name of one user.
+
+        Args:
+            kind: ACCOUNT_ID or USERNAME
+            identifier: The account ID or username (userkey on Server/DC)
+
+        Returns:
+            The display name, or an empty string if it could not be fetched
+        """
+        if self.confluence_client is None:
+            return ""
+        try:
+            if kind == ACCOUNT_ID:
+                user_details = self.confluence_client.get_user_details_by_accountid(
+                    identifier
+                )
+            else:
+                # For Confluence Server/DC, userkey might be the username
+                user_details = self.confluence_client.get_user_details_by_username(
+                    identifier
+                )
+            return user_details.get("displayName", "") or ""
+        except Exception as e:
+            logger.warning(f"Error fetching user details for {identifier}: {str(e)}")
+            return ""
+
+    def _process_user_mentions_in_soup(
+        self, soup: BeautifulSoup, user_names: dict[UserRef, str] | None = None
+    ) -> None:
         """
         Process user mentions in BeautifulSoup object.
 
         Args:
             soup: BeautifulSoup object containing HTML
+            user_names: Display names resolved up front, see
+                `_resolve_user_names_in_soup`
         """
         # Find all ac:link elements that might contain user mentions
         user_mentions = soup.find_all("ac:link")
@@ -86,7 +308,7 @@ class BasePreprocessor:
                 # Case 1: Direct user reference without link-body
                 account_id = user_ref.get("ri:account-id")
                 if isinstance(account_id, str):
-                    self._replace_user_mention(user_element, account_id)
+                    self._replace_user_mention(user_element, account_id, user_names)
                     continue
 
             # Case 2: User reference with link-body containing @
@@ -96,9 +318,11 @@ class BasePreprocessor:
                 if user_ref and user_ref.get("ri:account-id"):
                     account_id = user_ref.get("ri:account-id")
                     if isinstance(account_id, str):
-                        self._replace_user_mention(user_element, account_id)
+                        self._replace_user_mention(user_element, account_id, user_names)
 
-    def _process_user_profile_macros_in_soup(self, soup: BeautifulSoup) -> None:
+    def _process_user_profile_macros_in_soup(
+        self, soup: BeautifulSoup, user_names: dict[UserRef, str] | None = None
+    ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
         Replaces <ac:structured-macro ac:name="profile">...</ac:structured-macro>
@@ -106,6 +330,8 @@ class BasePreprocessor:
 
         Args:
             soup: BeautifulSoup object containing HTML
+            user_names: Display names resolved up front, see
+                `_resolve_user_names_in_soup`
         """
         profile_macros = soup.find_all(
             "ac:structured-macro", attrs={"ac:name": "profile"}
@@ -137,18 +363,13 @@ class BasePreprocessor:
             if self.confluence_client and user_identifier_for_log:
                 try:
                     if account_id and isinstance(account_id, str):
-                        user_details = (
-                            self.confluence_client.get_user_details_by_accountid(
-                                account_id
-                            )
+                        display_name = self._get_user_display_name(
+                            ACCOUNT_ID, account_id, user_names
                         )
-                        display_name = user_details.get("displayName")
                     elif userkey and isinstance(userkey, str):
-                        # For Confluence Server/DC, userkey might be the username
-                        user_details = (
-                            self.confluence_client.get_user_details_by_username(userkey)
+                        display_name = self._get_user_display_name(
+                            USERNAME, userkey, user_names
                         )
-                        display_name = user_details.get("displayName")
                 except Exception as e:
                     logger.warning(
                         f"Error fetching user details for profile macro (user: {user_identifier_for_log}): {e}"
@@ -171,21 +392,26 @@ class BasePreprocessor:
                 macro_element.replace_with(fallback_text)
                 logger.debug(f"Using fallback for user profile macro: {fallback_text}")
 
-    def _replace_user_mention(self, user_element: Tag, account_id: str) -> None:
+    def _replace_user_mention(
+        self,
+        user_element: Tag,
+        account_id: str,
+        user_names: dict[UserRef, str] | None = None,
+    ) -> None:
         """
         Replace a user mention with the user's display name.
 
         Args:
             user_element: The HTML element containing the user mention
             account_id: The user's account ID
+            user_names: Display names resolved up front, if any
         """
         try:
             # Only attempt to get user details if we have a valid confluence client
             if self.confluence_client is not None:
-                user_details = self.confluence_client.get_user_details_by_accountid(
-                    account_id
+                display_name = self._get_user_display_name(
+                    ACCOUNT_ID, account_id, user_names
                 )
-                display_name = user_details.get("displayName", "")
                 if display_name:
                     new_text = f"@{display_name}"
                     user_element.replace_with(new_text)
@@ -8,6 +8,69 @@ from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Line-start anchors are written as a lookbehind after the leading literal
+# ("h(?<![^\n]h)" instead of "^h") so that the regex engine can jump between
+# occurrences of the literal instead of trying every position of the text.
+
+# Jira markup -> Markdown
+_JIRA_BLOCK_QUOTE = re.compile(r"b(?<![^\n]b)q\.(.*?)$", re.MULTILINE)
+_JIRA_BOLD_ITALIC = re.compile(r"([*_])(.*?)\1")
+_JIRA_LIST_ITEM = re.compile(r"^((?:#|-|\+|\*)+) (.*)$", re.MULTILINE)
+_JIRA_HEADER = re.compile(r"h(?<![^\n]h)([0-6])\.(.*)$", re.MULTILINE)
+_JIRA_INLINE_CODE = re.compile(r"\{\{([^}]+)\}\}")
+# Same language as r"\?\?((?:.[^?]|[^?].)+)\?\?", split on the first character of
+# each pair so that the alternatives never overlap. The overlapping form
+# backtracks exponentially on unterminated citations.
+_JIRA_CITATION = re.compile(r"\?\?((?:[^?\n][\s\S]|\?[^?]|\n.)+)\?\?")
+_JIRA_INSERTED = re.compile(r"\+([^+]*)\+")
+_JIRA_SUPERSCRIPT = re.compile(r"\^([^^]*)\^")
+_JIRA_SUBSCRIPT = re.compile(r"~([^~]*)~")
+_JIRA_CODE_BLOCK = re.compile(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}")
+_JIRA_NOFORMAT = re.compile(r"\{noformat\}([\s\S]*?)\{noformat\}")
+_JIRA_QUOTE = re.compile(r"\{quote\}([\s\S]*)\{quote\}")
+_JIRA_IMAGE_ALT = re.compile(r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!")
+_JIRA_IMAGE_PARAMS = re.compile(r"!([^|\n\s]+)\|([^\n!]*)!")
+_JIRA_IMAGE = re.compile(r"!([^\n\s!]+)!")
+_JIRA_LINK = re.compile(r"\[([^|]+)\|(.+?)\]")
+_JIRA_BARE_LINK = re.compile(r"\[(.+?)\]([^\(]+)")
+_JIRA_COLOR = re.compile(r"\{color:([^}]+)\}([\s\S]*?)\{color\}")
+
+# Markdown -> Jira markup
+_MD_CODE_BLOCK = re.compile(r"```(\w*)\n([\s\S]+?)```")
+_MD_INLINE_CODE = re.compile(r"`([^`]+)`")
+_MD_UNDERLINED_HEADER = re.compile(r"^(.*?)\n([=-])+$", re.MULTILINE)
+_MD_HEADER = re.compile(r"(#(?<![^\n]#)#*)(.*?)$", re.MULTILINE)
+_MD_BOLD_ITALIC = re.compile(r"([*_]+)(.*?)\1")
+_MD_BULLET_ITEM = re.compile(r"^(\s*)- (.*)$", re.MULTILINE)
+_MD_NUMBERED_ITEM = re.compile(r"^(\s+)1\. (.*)$", re.MULTILINE)
+_MD_HTML_TAGS = [
+    (re.compile(rf"<{tag}>(.*?)<\/{tag}>"), rf"{replacement}\1{replacement}")
+    for tag, replacement in {
+        "cite": "??",
+        "del": "-",
+        "ins": "+",
+        "sup": "^",
+        "sub": "~",
+    }.items()
+]
+_MD_COLOR = re.compile(r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>")
+_MD_STRIKETHROUGH = re.compile(r"~~(.*?)~~")
+_MD_IMAGE = re.compile(r"!\[\]\(([^)\n\s]+)\)")
+_MD_IMAGE_ALT = re.compile(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)")
+_MD_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MD_AUTOLINK = re.compile(r"<([^>]+)>")
+_MD_TABLE_SEPARATOR = re.compile(r"\|[-\s|]+\|")
+
+
+def _jira_emphasis_to_markdown(match: re.Match) -> str:
+    marker = "**" if match.group(1) == "*" else "*"
+    return marker + match.group(2) + marker
+
+
+def _markdown_emphasis_to_jira(match: re.Match) -> str:
+    marker = "_" if len(match.group(1)) == 1 else "*"
+    return marker + match.group(2) + marker
+
 
 class JiraPreprocessor(BasePreprocessor):
     """Handles text preprocessing for Jira content."""
@@ -114,119 +177,103 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
+        # Passes run in a fixed order; a pass is skipped when its markup cannot
+        # occur in the text, which leaves the output unchanged.
+        output = input_text
+
         # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
+        if "bq." in output:
+            output = _JIRA_BLOCK_QUOTE.sub(r"> \1\n", output)
 
         # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: ("**" if match.group(1) == "*" else "*")
-            + match.group(2)
-            + ("**" if match.group(1) == "*" else "*"),
-            output,
-        )
+        if "*" in output or "_" in output:
+            output = _JIRA_BOLD_ITALIC.sub(_jira_emphasis_to_markdown, output)
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
+        output = _JIRA_LIST_ITEM.sub(self._convert_jira_list_to_markdown, output)
 
         # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$",
-            lambda match: "#" * int(match.group(1)) + match.group(2),
-            output,
-            flags=re.MULTILINE,
+        output = _JIRA_HEADER.sub(
+            lambda match: "#" * int(match.group(1)) + match.group(2), output
         )
 
         # Inline code
-        output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
+        if "{{" in output:
+            output = _JIRA_INLINE_CODE.sub(r"`\1`", output)
 
         # Citation
-        output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+        if "??" in output:
+            output = _JIRA_CITATION.sub(r"<cite>\1</cite>", output)
 
         # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+        if "+" in output:
+            output = _JIRA_INSERTED.sub(r"<ins>\1</ins>", output)
 
         # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+        if "^" in output:
+            output = _JIRA_SUPERSCRIPT.sub(r"<sup>\1</sup>", output)
 
         # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+        if "~" in output:
+            output = _JIRA_SUBSCRIPT.sub(r"<sub>\1</sub>", output)
 
-        # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
-
-        # Code blocks with optional language specification
-        output = re.sub(
-            r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
-            r"```\1\n\2\n```",
-            output,
-            flags=re.MULTILINE,
-        )
+        # Strikethrough (-text-) is kept as is
 
-        # No format
-        output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
-
-        # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join(
-                [f"> {line}" for line in match.group(1).split("\n")]
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{" in output:
+            # Code blocks with optional language specification
+            if "{code" in output:
+                output = _JIRA_CODE_BLOCK.sub(r"```\1\n\2\n```", output)
 
-        # Images with alt text
-        output = re.sub(
-            r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!",
-            r"![\3](\1)",
-            output,
-        )
+            # No format
+            if "{noformat}" in output:
+                output = _JIRA_NOFORMAT.sub(r"```\n\1\n```", output)
+
+            # Quote blocks
+            if "{quote}" in output:
+                output = _JIRA_QUOTE.sub(
+                    lambda match: "\n".join(
+                        [f"> {line}" for line in match.group(1).split("\n")]
+                    ),
+                    output,
+                )
 
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
+        if "!" in output:
+            # Images with alt text
+            output = _JIRA_IMAGE_ALT.sub(r"![\3](\1)", output)
 
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+            # Images with other parameters (ignore them)
+            output = _JIRA_IMAGE_PARAMS.sub(r"![](\1)", output)
+
+            # Images without parameters
+            output = _JIRA_IMAGE.sub(r"![](\1)", output)
 
         # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
+        if "[" in output:
+            output = _JIRA_LINK.sub(r"[\1](\2)", output)
+            output = _JIRA_BARE_LINK.sub(r"<\1>\2", output)
 
         # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
-            r"<span style=\"color:\1\">\2</span>",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{color:" in output:
+            output = _JIRA_COLOR.sub(r"<span style=\"color:\1\">\2</span>", output)
 
         # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            if "||" in line:
-                # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
-
-                # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
-                if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1  # Skip the newly inserted line in next iteration
-
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+        if "||" in output:
+            lines = []
+            for line in output.split("\n"):
+                if "||" in line:
+                    # Replace Jira table headers
+                    line = line.replace("||", "|")
+                    lines.append(line)
+
+                    # Add a separator line for markdown tables
+                    header_cells = line.count("|") - 1
+                    if header_cells > 0:
+                        lines.append("|" + "---|" * header_cells)
+                else:
+                    lines.append(line)
+
+            # Rejoin the lines
+            output = "\n".join(lines)
 
         return output
 
@@ -284,98 +331,91 @@ class JiraPreprocessor(BasePreprocessor):
             return str(code)  # Ensure we return a string
 
         # Save code sections temporarily
-        output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
-        output = re.sub(r"`([^`]+)`", save_inline_code, output)
+        output = input_text
+        if "`" in output:
+            output = _MD_CODE_BLOCK.sub(save_code_block, output)
+            output = _MD_INLINE_CODE.sub(save_inline_code, output)
 
         # Headers with = or - underlines
-        output = re.sub(
-            r"^(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "\n=" in output or "\n-" in output:
+            output = _MD_UNDERLINED_HEADER.sub(
+                lambda match: (
+                    f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}"
+                ),
+                output,
+            )
 
         # Headers with # prefix
-        output = re.sub(
-            r"^([#]+)(.*?)$",
-            lambda match: f"h{len(match.group(1))}." + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "#" in output:
+            output = _MD_HEADER.sub(
+                lambda match: f"h{len(match.group(1))}." + match.group(2), output
+            )
 
         # Bold and italic
-        output = re.sub(
-            r"([*_]+)(.*?)\1",
-            lambda match: ("_" if len(match.group(1)) == 1 else "*")
-            + match.group(2)
-            + ("_" if len(match.group(1)) == 1 else "*"),
-            output,
-        )
+        if "*" in output or "_" in output:
+            output = _MD_BOLD_ITALIC.sub(_markdown_emphasis_to_jira, output)
 
         # Multi-level bulleted list
-        output = re.sub(
-            r"^(\s*)- (.*)$",
-            lambda match: (
-                "* " + match.group(2)
-                if not match.group(1)
-                else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "- " in output:
+            output = _MD_BULLET_ITEM.sub(
+                lambda match: (
+                    "* " + match.group(2)
+                    if not match.group(1)
+                    else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
+                ),
+                output,
+            )
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^(\s+)1\. (.*)$",
-            lambda match: "#" * (int(len(match.group(1)) / 4) + 2)
-            + " "
-            + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # HTML formatting tags to Jira markup
-        tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(
-                rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
+        if "1. " in output:
+            output = _MD_NUMBERED_ITEM.sub(
+                lambda match: (
+                    "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2)
+                ),
+                output,
             )
 
-        # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
-            r"{color:\1}\2{color}",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "<" in output:
+            # HTML formatting tags to Jira markup
+            for pattern, replacement in _MD_HTML_TAGS:
+                output = pattern.sub(replacement, output)
+
+            # Colored text
+            output = _MD_COLOR.sub(r"{color:\1}\2{color}", output)
 
         # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
+        if "~~" in output:
+            output = _MD_STRIKETHROUGH.sub(r"-\1-", output)
 
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+        if "![" in output:
+            # Images without alt text
+            output = _MD_IMAGE.sub(r"!\1!", output)
 
-        # Images with alt text
-        output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
+            # Images with alt text
+            output = _MD_IMAGE_ALT.sub(r"!\2|alt=\1!", output)
 
         # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
+        if "[" in output:
+            output = _MD_LINK.sub(r"[\1|\2]", output)
+        if "<" in output:
+            output = _MD_AUTOLINK.sub(r"[\1]", output)
 
         # Convert markdown tables to Jira table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
-                # Convert header row to Jira format
-                lines[i] = lines[i].replace("|", "||")
-                # Remove the separator line
-                lines.pop(i + 1)
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+        if "|" in output:
+            lines = output.split("\n")
+            converted = []
+            i = 0
+            while i < len(lines):
+                if i < len(lines) - 1 and _MD_TABLE_SEPARATOR.match(lines[i + 1]):
+                    # Convert header row to Jira format and drop the separator line
+                    converted.append(lines[i].replace("|", "||"))
+                    i += 2
+                else:
+                    converted.append(lines[i])
+                    i += 1
+
+            # Rejoin the lines
+            output = "\n".join(converted)
 
         return output
 
@@ -1,6 +1,5 @@
 """Confluence FastMCP server instance and tool definitions."""
 
-import json
 import logging
 from typing import Annotated
 
@@ -8,10 +7,12 @@ from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.utils.concurrency import run_blocking
 from mcp_atlassian.utils.decorators import (
     check_write_access,
     convert_empty_defaults_to_none,
 )
+from mcp_atlassian.utils.encoding import dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -92,22 +93,28 @@ async def search(
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_blocking(
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_blocking(
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        pages = await run_blocking(
+            confluence_fetcher.search, query, limit=limit, spaces_filter=spaces_filter
         )
     search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    return dump_json(search_results)
 
 
 @convert_empty_defaults_to_none
@@ -185,27 +192,28 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            page_object = await run_blocking(
+                confluence_fetcher.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
-                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+            return dump_json(
+                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"}
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await run_blocking(
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
-            return json.dumps(
+            return dump_json(
                 {
                     "error": f"Page with title '{title}' not found in space '{space_key}'."
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
     else:
         raise ValueError(
@@ -213,18 +221,14 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_json({"error": "Page not found with the provided identifiers."})
 
     if include_metadata:
         result = {"metadata": page_object.to_simplified_dict()}
     else:
         result = {"content": {"value": page_object.content}}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -290,7 +294,8 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        pages = await run_blocking(
+            confluence_fetcher.get_page_children,
             page_id=parent_id,
             start=start,
             limit=limit,
@@ -312,7 +317,7 @@ async def get_page_children(
         )
         result = {"error": f"Failed to get child pages: {e}"}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -339,9 +344,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await run_blocking(confluence_fetcher.get_page_comments, page_id)
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return dump_json(formatted_comments)
 
 
 @confluence_mcp.tool(tags={"confluence", "read"})
@@ -368,9 +373,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await run_blocking(confluence_fetcher.get_page_labels, page_id)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dump_json(formatted_labels)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -394,9 +399,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await run_blocking(confluence_fetcher.add_page_label, page_id, name)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dump_json(formatted_labels)
 
 
 @convert_empty_defaults_to_none
@@ -441,7 +446,8 @@ async def create_page(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    page = confluence_fetcher.create_page(
+    page = await run_blocking(
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -449,11 +455,7 @@ async def create_page(
         is_markdown=True,
     )
     result = page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_json({"message": "Page created successfully", "page": result})
 
 
 @convert_empty_defaults_to_none
@@ -498,7 +500,8 @@ async def update_page(
     # TODO: revert this once Cursor IDE handles optional parameters with Union types correctly.
     actual_parent_id = parent_id if parent_id else None
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await run_blocking(
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -508,11 +511,7 @@ async def update_page(
         parent_id=actual_parent_id,
     )
     page_data = updated_page.to_simplified_dict()
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_json({"message": "Page updated successfully", "page": page_data})
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -535,7 +534,7 @@ async def delete_page(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        result = confluence_fetcher.delete_page(page_id=page_id)
+        result = await run_blocking(confluence_fetcher.delete_page, page_id=page_id)
         if result:
             response = {
                 "success": True,
@@ -554,7 +553,7 @@ async def delete_page(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_json(response)
 
 
 @confluence_mcp.tool(tags={"confluence", "write"})
@@ -583,7 +582,9 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await run_blocking(
+            confluence_fetcher.add_comment, page_id=page_id, content=content
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
@@ -604,4 +605,4 @@ async def add_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_json(response)
@@ -1,14 +1,20 @@
 """Dependency providers for JiraFetcher and ConfluenceFetcher with context awareness.
 
 Provides get_jira_fetcher and get_confluence_fetcher for use in tool functions.
+User-specific fetchers are pooled in a process-wide FetcherRegistry so that warm
+HTTP sessions are reused across requests carrying the same credentials.
 """
 
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
+import threading
+import time
 from typing import TYPE_CHECKING, Any
 
+from cachetools import TTLCache
 from fastmcp import Context
 from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
@@ -16,6 +22,8 @@ from starlette.requests import Request
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.utils.concurrency import run_blocking
+from mcp_atlassian.utils.environment import get_int_env
 from mcp_atlassian.utils.oauth import OAuthConfig
 
 if TYPE_CHECKING:
@@ -27,6 +35,148 @@ if TYPE_CHECKING:
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
 
+@dataclasses.dataclass
+class PooledFetcher:
+    """A fetcher held by the FetcherRegistry together with its validation state."""
+
+    fetcher: JiraFetcher | ConfluenceFetcher
+    validated_at: float | None = None
+    user_info: Any = None
+
+
+class FetcherRegistry:
+    """Bounded, TTL-evicting pool of fetchers keyed by credential fingerprint.
+
+    Fetchers (and therefore their ``requests.Session`` and preprocessor) are
+    reused for every request presenting the same credentials. The registry also
+    records when a credential was last validated against the Atlassian API so the
+    ``myself()``/``user/current`` round-trip can be skipped for recently checked
+    tokens.
+    """
+
+    def __init__(
+        self, maxsize: int = 100, ttl: int = 3600, validation_ttl: int = 300
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            maxsize: Maximum number of pooled fetchers.
+            ttl: Seconds a pooled fetcher is kept before it is rebuilt.
+            validation_ttl: Seconds a successful token validation stays valid.
+        """
+        self._entries: TTLCache[str, PooledFetcher] = TTLCache(
+            maxsize=max(maxsize, 1), ttl=max(ttl, 1)
+        )
+        self._lock = threading.Lock()
+        self.validation_ttl = validation_ttl
+
+    @staticmethod
+    def fingerprint(service: str, auth_type: str, token: str, base_url: str) -> str:
+        """Build a registry key without keeping the raw token around.
+
+        Args:
+            service: 'jira' or 'confluence'.
+            auth_type: The authentication type ('oauth', 'pat', 'basic', ...).
+            token: The credential presented by the caller.
+            base_url: The Atlassian instance URL.
+
+        Returns:
+            A SHA-256 hex digest identifying the credential/site combination.
+        """
+        raw = "\x1f".join([service, auth_type, token, base_url.rstrip("/")])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> PooledFetcher | None:
+        """Return the pooled entry for a key, if present and not expired."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, fetcher: JiraFetcher | ConfluenceFetcher) -> PooledFetcher:
+        """Add a fetcher to the pool, replacing any existing entry for the key."""
+        entry = PooledFetcher(fetcher=fetcher)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def needs_validation(self, key: str) -> bool:
+        """Check whether the credential for a key must be (re)validated."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.validated_at is None:
+                return True
+            return time.monotonic() - entry.validated_at >= self.validation_ttl
+
+    def mark_validated(self, key: str, user_info: Any = None) -> None:
+        """Record a successful validation for a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.validated_at = time.monotonic()
+                entry.user_info = user_info
+
+    def invalidate(self, key: str) -> None:
+        """Drop a key from the pool (e.g. after a failed validation)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every pooled fetcher."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+fetcher_registry = FetcherRegistry(
+    maxsize=get_int_env("MCP_FETCHER_POOL_SIZE", 100),
+    ttl=get_int_env("MCP_FETCHER_POOL_TTL", 3600),
+    validation_ttl=get_int_env("MCP_TOKEN_VALIDATION_TTL", 300),
+)
+
+
+def _global_fetcher_key(service: str, config: JiraConfig | ConfluenceConfig) -> str:
+    """Registry key for the fetcher built from the server-wide configuration."""
+    credential = config.personal_token or config.api_token or ""
+    if config.oauth_config and config.oauth_config.access_token:
+        credential = config.oauth_config.access_token
+    return FetcherRegistry.fingerprint(
+        f"{service}:global",
+        f"{config.auth_type}:{config.username or ''}",
+        credential,
+        config.url,
+    )
+
+
+def _get_global_fetcher(
+    service: str,
+    config: JiraConfig | ConfluenceConfig,
+    factory: type[JiraFetcher] | type[ConfluenceFetcher],
+) -> JiraFetcher | ConfluenceFetcher:
+    """Return the pooled fetcher for the global configuration, building it if needed.
+
+    OAuth fetchers are rebuilt once the access token is about to expire, because
+    the token is only refreshed while the session is being configured.
+    """
+    key = _global_fetcher_key(service, config)
+    entry = fetcher_registry.get(key)
+    token_expiring = (
+        config.auth_type == "oauth"
+        and config.oauth_config is not None
+        and bool(config.oauth_config.refresh_token)
+        and config.oauth_config.is_token_expired
+    )
+    if entry is not None and not token_expiring:
+        return entry.fetcher
+    if entry is not None:
+        fetcher_registry.invalidate(key)
+    fetcher = factory(config=config)
+    # The refresh may have changed the access token, so key on the new state.
+    fetcher_registry.put(_global_fetcher_key(service, config), fetcher)
+    return fetcher
+
+
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
     auth_type: str,
@@ -184,22 +334,42 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                     "Jira global configuration (URL, SSL) is not available from lifespan context."
                 )
             logger.info(
-                f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
+                f"Resolving user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
             user_specific_config = _create_user_config_for_fetcher(
                 base_config=app_lifespan_ctx.full_jira_config,
                 auth_type=user_auth_type,
                 credentials=credentials,
             )
+            registry_key = FetcherRegistry.fingerprint(
+                "jira",
+                user_auth_type,
+                str(user_token),
+                app_lifespan_ctx.full_jira_config.url,
+            )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
-                logger.debug(
-                    f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
-                )
+                pooled = fetcher_registry.get(registry_key)
+                if pooled is None:
+                    pooled = fetcher_registry.put(
+                        registry_key, JiraFetcher(config=user_specific_config)
+                    )
+                else:
+                    logger.debug("get_jira_fetcher: Reusing pooled JiraFetcher.")
+                user_jira_fetcher = pooled.fetcher
+                if fetcher_registry.needs_validation(registry_key):
+                    # Force a fresh myself() round-trip instead of the memoized id
+                    user_jira_fetcher._current_user_account_id = None
+                    current_user_id = await run_blocking(
+                        user_jira_fetcher.get_current_user_account_id
+                    )
+                    fetcher_registry.mark_validated(registry_key, current_user_id)
+                    logger.debug(
+                        f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
+                    )
                 request.state.jira_fetcher = user_jira_fetcher
                 return user_jira_fetcher
             except Exception as e:
+                fetcher_registry.invalidate(registry_key)
                 logger.error(
                     f"get_jira_fetcher: Failed to create/validate user-specific JiraFetcher: {e}",
                     exc_info=True,
@@ -225,7 +395,9 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
             "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        return _get_global_fetcher(
+            "jira", app_lifespan_ctx_global.full_jira_config, JiraFetcher
+        )
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -286,16 +458,37 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                     "Confluence global configuration (URL, SSL) is not available from lifespan context."
                 )
             logger.info(
-                f"Creating user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
+                f"Resolving user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
             user_specific_config = _create_user_config_for_fetcher(
                 base_config=app_lifespan_ctx.full_confluence_config,
                 auth_type=user_auth_type,
                 credentials=credentials,
             )
+            registry_key = FetcherRegistry.fingerprint(
+                "confluence",
+                user_auth_type,
+                str(user_token),
+                app_lifespan_ctx.full_confluence_config.url,
+            )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                pooled = fetcher_registry.get(registry_key)
+                if pooled is None:
+                    pooled = fetcher_registry.put(
+                        registry_key, ConfluenceFetcher(config=user_specific_config)
+                    )
+                else:
+                    logger.debug(
+                        "get_confluence_fetcher: Reusing pooled ConfluenceFetcher."
+                    )
+                user_confluence_fetcher = pooled.fetcher
+                if fetcher_registry.needs_validation(registry_key):
+                    current_user_data = await run_blocking(
+                        user_confluence_fetcher.get_current_user_info
+                    )
+                    fetcher_registry.mark_validated(registry_key, current_user_data)
+                else:
+                    current_user_data = pooled.user_info
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -321,6 +514,7 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                     request.state.user_atlassian_email = current_user_data["email"]
                 return user_confluence_fetcher
             except Exception as e:
+                fetcher_registry.invalidate(registry_key)
                 logger.error(
                     f"get_confluence_fetcher: Failed to create/validate user-specific ConfluenceFetcher: {e}"
                 )
@@ -344,7 +538,11 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
             "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return _get_global_fetcher(
+            "confluence",
+            app_lifespan_ctx_global.full_confluence_config,
+            ConfluenceFetcher,
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
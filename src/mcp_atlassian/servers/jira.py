@@ -13,7 +13,9 @@ from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
 from mcp_atlassian.utils import convert_empty_defaults_to_none
+from mcp_atlassian.utils.concurrency import iterate_blocking, run_blocking
 from mcp_atlassian.utils.decorators import check_write_access
+from mcp_atlassian.utils.encoding import dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +50,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await run_blocking(
+            jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -78,7 +82,7 @@ async def get_user_profile(
             f"get_user_profile failed for '{user_identifier}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_json(response_data)
 
 
 @convert_empty_defaults_to_none
@@ -153,7 +157,8 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    issue = await run_blocking(
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -162,7 +167,87 @@ async def get_issue(
         update_history=update_history,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
+
+
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "read"})
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(
+            description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']",
+            min_length=1,
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return (e.g., 'summary,status,customfield_10010'). "
+                "Use '*all' for all fields (including custom fields), or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    expand: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Fields to expand. Examples: 'renderedFields' (for rendered content), "
+                "'transitions' (for available status transitions), 'changelog' (for history)"
+            ),
+            default="",
+        ),
+    ] = "",
+    comment_limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of comments to include per issue (0 or null for no comments)",
+            default=10,
+            ge=0,
+            le=100,
+        ),
+    ] = 10,
+) -> str:
+    """Get details of multiple Jira issues in as few requests as possible.
+
+    Prefer this over repeated jira_get_issue calls when several issues are needed.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of Jira issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        expand: Optional fields to expand.
+        comment_limit: Maximum number of comments per issue.
+
+    Returns:
+        JSON string with the issues (same shape as jira_get_issue) and the keys
+        that were not found.
+
+    Raises:
+        ValueError: If the Jira client is not configured or available.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    not_found: list[str] = []
+    issues = await run_blocking(
+        jira.batch_get_issues,
+        issue_keys=issue_keys,
+        fields=fields_list,
+        expand=expand or None,
+        comment_limit=comment_limit,
+        not_found=not_found,
+    )
+    result = {
+        "issues": [issue.to_simplified_dict() for issue in issues],
+        "not_found": not_found,
+    }
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -221,6 +306,17 @@ async def search(
             default="",
         ),
     ] = "",
+    count_mode: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) How the total number of matches is computed on Jira Cloud: "
+                "'exact' (default), 'approximate' (faster estimate), or 'skip' "
+                "(fastest, total is returned as -1). Ignored on Jira Server/DC."
+            ),
+            default="exact",
+        ),
+    ] = "exact",
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -232,6 +328,7 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        count_mode: How the total is computed ('exact', 'approximate' or 'skip').
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -241,16 +338,129 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
+    result = await run_blocking(
+        jira.search_issues_simplified,
         jql=jql,
         fields=fields_list,
         limit=limit,
         start=start_at,
         expand=expand,
         projects_filter=projects_filter,
+        count_mode=count_mode,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
+
+
+@jira_mcp.tool(tags={"jira", "read"})
+async def stream_search(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(description="JQL query string (Jira Query Language)."),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return in the results. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    max_results: Annotated[
+        int,
+        Field(
+            description="Maximum number of issues to stream. Use 0 for no limit.",
+            default=1000,
+            ge=0,
+        ),
+    ] = 1000,
+    page_size: Annotated[
+        int,
+        Field(description="Issues per page (1-100)", default=100, ge=1, le=100),
+    ] = 100,
+    projects_filter: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default="",
+        ),
+    ] = "",
+    expand: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) fields to expand. Examples: 'renderedFields', 'transitions', 'changelog'"
+            ),
+            default="",
+        ),
+    ] = "",
+) -> str:
+    """Stream all Jira issues matching a JQL query, page by page.
+
+    Each page is sent as it arrives in a log notification (logger
+    'jira_stream_search') whose data is a JSON object with 'page' and 'issues',
+    and progress is reported through progress notifications. Suited for large
+    exports; the final result only summarizes what was streamed.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        fields: Comma-separated fields to return.
+        max_results: Maximum number of issues to stream (0 for no limit).
+        page_size: Issues per page.
+        projects_filter: Comma-separated list of project keys to filter by.
+        expand: Optional fields to expand.
+
+    Returns:
+        JSON string summarizing the number of pages and issues streamed.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    pages = jira.iter_issue_pages(
+        jql,
+        fields=fields_list,
+        expand=expand or None,
+        page_size=page_size,
+        projects_filter=projects_filter or None,
+    )
+    streamed = 0
+    page_count = 0
+    total = -1
+    async for page in iterate_blocking(pages):
+        page_issues = [issue.to_simplified_dict() for issue in page.issues]
+        if max_results:
+            page_issues = page_issues[: max_results - streamed]
+        streamed += len(page_issues)
+        page_count += 1
+        total = page.total
+
+        await ctx.log(
+            dump_json({"page": page_count, "issues": page_issues}),
+            logger_name="jira_stream_search",
+        )
+        progress_total = total if total >= 0 else None
+        if max_results and progress_total is not None:
+            progress_total = min(progress_total, max_results)
+        await ctx.report_progress(progress=streamed, total=progress_total)
+
+        if max_results and streamed >= max_results:
+            break
+
+    result = {
+        "jql": jql,
+        "pages": page_count,
+        "issues_streamed": streamed,
+        "total": total,
+    }
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -283,8 +493,10 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -312,11 +524,11 @@ async def get_project_issues(
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await run_blocking(
+        jira.get_project_issues, project_key=project_key, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -335,8 +547,8 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
-    return json.dumps(transitions, indent=2, ensure_ascii=False)
+    transitions = await run_blocking(jira.get_available_transitions, issue_key)
+    return dump_json(transitions)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -354,9 +566,9 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await run_blocking(jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -378,8 +590,10 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(
+        jira.download_issue_attachments, issue_key=issue_key, target_dir=target_dir
+    )
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -421,7 +635,8 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await run_blocking(
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -429,7 +644,7 @@ async def get_agile_boards(
         limit=limit,
     )
     result = [board.to_simplified_dict() for board in boards]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -498,7 +713,8 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    result = await run_blocking(
+        jira.get_board_issues_simplified,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -506,8 +722,7 @@ async def get_board_issues(
         limit=limit,
         expand=expand,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -541,11 +756,15 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await run_blocking(
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -590,11 +809,14 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    result = await run_blocking(
+        jira.get_sprint_issues_simplified,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
-    result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -608,9 +830,9 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await run_blocking(jira.get_issue_link_types)
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
-    return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
+    return dump_json(formatted_link_types)
 
 
 @convert_empty_defaults_to_none
@@ -710,7 +932,8 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await run_blocking(
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -720,11 +943,7 @@ async def create_issue(
         **extra_fields,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(
-        {"message": "Issue created successfully", "issue": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_json({"message": "Issue created successfully", "issue": result})
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -782,18 +1001,30 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
-
-    message = (
-        "Issues validated successfully"
-        if validate_only
-        else "Issues created successfully"
+    failed: list[dict[str, Any]] = []
+    created_issues = await run_blocking(
+        jira.batch_create_issues,
+        issues_list,
+        validate_only=validate_only,
+        failed=failed,
     )
-    result = {
+
+    if validate_only:
+        message = "Issues validated successfully"
+    elif failed:
+        message = (
+            f"Created {len(created_issues)} of {len(issues_list)} issues; "
+            "the issues listed in 'failed' were not created"
+        )
+    else:
+        message = "Issues created successfully"
+    result: dict[str, Any] = {
         "message": message,
         "issues": [issue.to_simplified_dict() for issue in created_issues],
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if failed:
+        result["failed"] = failed
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -848,25 +1079,20 @@ async def batch_get_changelogs(
             "Batch get issue changelogs is only available on Jira Cloud."
         )
 
-    # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+    # Read the changelogs as compact records, keeping at most limit per issue
+    records = await run_blocking(
+        jira.batch_get_changelog_records,
+        issue_ids_or_keys=issue_ids_or_keys,
+        fields=fields,
+        limit=None if limit == -1 else limit,
     )
 
     # Format the response
-    results = []
-    limit_val = None if limit == -1 else limit
-    for issue in issues_with_changelogs:
-        results.append(
-            {
-                "issue_id": issue.id,
-                "changelogs": [
-                    changelog.to_simplified_dict()
-                    for changelog in issue.changelogs[:limit_val]
-                ],
-            }
-        )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    results = [
+        {"issue_id": record.id, "changelogs": record["changelogs"]}
+        for record in records
+    ]
+    return dump_json(results)
 
 
 @convert_empty_defaults_to_none
@@ -954,18 +1180,16 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await run_blocking(
+            jira.update_issue, issue_key=issue_key, **all_updates
+        )
         result = issue.to_simplified_dict()
         if (
             hasattr(issue, "custom_fields")
             and "attachment_results" in issue.custom_fields
         ):
             result["attachment_results"] = issue.custom_fields["attachment_results"]
-        return json.dumps(
-            {"message": "Issue updated successfully", "issue": result},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_json({"message": "Issue updated successfully", "issue": result})
     except Exception as e:
         logger.error(f"Error updating issue {issue_key}: {str(e)}", exc_info=True)
         raise ValueError(f"Failed to update issue {issue_key}: {str(e)}")
@@ -990,10 +1214,10 @@ async def delete_issue(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    deleted = jira.delete_issue(issue_key)
+    deleted = await run_blocking(jira.delete_issue, issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1018,8 +1242,8 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.add_comment, issue_key, comment)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -1078,7 +1302,8 @@ async def add_worklog(
     """
     jira = await get_jira_fetcher(ctx)
     # add_worklog returns dict
-    worklog_result = jira.add_worklog(
+    worklog_result = await run_blocking(
+        jira.add_worklog,
         issue_key=issue_key,
         time_spent=time_spent,
         comment=comment,
@@ -1087,7 +1312,7 @@ async def add_worklog(
         remaining_estimate=remaining_estimate,
     )
     result = {"message": "Worklog added successfully", "worklog": worklog_result}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1115,12 +1340,12 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await run_blocking(jira.link_issue_to_epic, issue_key, epic_key)
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -1188,8 +1413,8 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    result = await run_blocking(jira.create_issue_link, link_data)
+    return dump_json(result)
 
 
 @jira_mcp.tool(tags={"jira", "write"})
@@ -1214,8 +1439,9 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    # Returns dict on success
+    result = await run_blocking(jira.remove_issue_link, link_id)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -1278,7 +1504,8 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await run_blocking(
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1289,7 +1516,7 @@ async def transition_issue(
         "message": f"Issue {issue_key} transitioned successfully",
         "issue": issue.to_simplified_dict() if issue else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_json(result)
 
 
 @convert_empty_defaults_to_none
@@ -1326,14 +1553,15 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await run_blocking(
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
         end_date=end_date,
         goal=goal,
     )
-    return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_json(sprint.to_simplified_dict())
 
 
 @convert_empty_defaults_to_none
@@ -1375,7 +1603,8 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await run_blocking(
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1388,9 +1617,9 @@ async def update_sprint(
         error_payload = {
             "error": f"Failed to update sprint {sprint_id}. Check logs for details."
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_json(error_payload)
     else:
-        return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dump_json(sprint.to_simplified_dict())
 
 
 @convert_empty_defaults_to_none
@@ -1417,15 +1646,15 @@ async def get_project(
 
     try:
         # 기존 ProjectsMixin의 get_project 함수 활용
-        project = jira.get_project(project_key)
+        project = await run_blocking(jira.get_project, project_key)
         if project is None:
             error_payload = {"error": f"Project {project_key} not found"}
-            return json.dumps(error_payload, indent=2, ensure_ascii=False)
+            return dump_json(error_payload)
 
-        return json.dumps(project, indent=2, ensure_ascii=False)
+        return dump_json(project)
     except Exception as e:
         error_payload = {"error": f"Failed to get project {project_key}: {str(e)}"}
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_json(error_payload)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1451,7 +1680,7 @@ async def get_project_issue_types(
 
     try:
         # 기존 ProjectsMixin의 get_project_issue_types 함수 활용
-        issue_types_data = jira.get_project_issue_types(project_key)
+        issue_types_data = await run_blocking(jira.get_project_issue_types, project_key)
 
         # id, description, name 필드만 추출
         filtered_issue_types = []
@@ -1466,30 +1695,12 @@ async def get_project_issue_types(
                         }
                     )
 
-        return json.dumps(filtered_issue_types, indent=2, ensure_ascii=False)
+        return dump_json(filtered_issue_types)
     except Exception as e:
         error_payload = {
             "error": f"Failed to get issue types for project {project_key}: {str(e)}"
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
-
-
-def _remove_fix_versions_from_fields(data):
-    """Helper function to recursively remove fixVersions fields from API response data."""
-    if isinstance(data, dict):
-        # Remove fixVersions field if it exists
-        if "fixVersions" in data:
-            del data["fixVersions"]
-
-        # Recursively process nested dictionaries
-        for value in data.values():
-            _remove_fix_versions_from_fields(value)
-    elif isinstance(data, list):
-        # Recursively process list items
-        for item in data:
-            _remove_fix_versions_from_fields(item)
-
-    return data
+        return dump_json(error_payload)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1523,17 +1734,17 @@ async def get_project_createmeta(
 
     try:
         # issue_createmeta(project_key, expand) 호출 - project_key를 직접 넘김
-        createmeta = jira.jira.issue_createmeta(project=project_key, expand=expand)
-
-        # fixVersions 필드 제거
-        filtered_data = _remove_fix_versions_from_fields(createmeta)
+        createmeta = await run_blocking(
+            jira.get_project_createmeta, project_key, expand=expand
+        )
 
-        return json.dumps(filtered_data, indent=2, ensure_ascii=False)
+        # fixVersions 제거와 allowedValues 축약은 조회 시점에 처리됨
+        return dump_json(createmeta)
     except Exception as e:
         error_payload = {
             "error": f"Failed to get create metadata for project {project_key}: {str(e)}"
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_json(error_payload)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1561,34 +1772,23 @@ async def get_issue_type_fields(
 
     try:
         # issue_createmeta_fieldtypes(project_key, issue_type_id) 호출
-        response_data = jira.jira.issue_createmeta_fieldtypes(
-            project=project_key, issue_type_id=issue_type_id
+        response_data = await run_blocking(
+            jira.get_issue_type_fields, project_key, issue_type_id
         )
 
-        # 응답 구조 확인 및 fixVersions 필터링
-        if isinstance(response_data, dict) and "fields" in response_data:
-            # 응답이 {"startAt": ..., "fields": [...]} 형태인 경우
-            fields_list = response_data["fields"]
-            filtered_fields = [
-                field
-                for field in fields_list
-                if not (isinstance(field, dict) and field.get("key") == "fixVersions")
-            ]
-            # 원본 응답 구조를 유지하되 fields만 필터링
-            response_data["fields"] = filtered_fields
-            return json.dumps(response_data, indent=2, ensure_ascii=False)
-        else:
+        # fixVersions 제거와 allowedValues 축약은 조회 시점에 처리됨
+        if not isinstance(response_data, dict) or "fields" not in response_data:
             # 예상치 못한 응답 구조인 경우
             logger.warning(
                 f"Unexpected data structure from jira.issue_createmeta_fieldtypes: {type(response_data)}"
             )
-            return json.dumps(response_data, indent=2, ensure_ascii=False)
+        return dump_json(response_data)
 
     except Exception as e:
         error_payload = {
             "error": f"Failed to get fields for project {project_key} and issue type {issue_type_id}: {str(e)}"
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_json(error_payload)
 
 
 @jira_mcp.tool(tags={"jira", "read"})
@@ -1604,55 +1804,22 @@ async def get_all_project_members(
         project_key: The project key.
 
     Returns:
-        JSON string representing a list of unique member objects, each containing 'displayName' and 'accountId'.
+        JSON string with the project key, the list of unique member objects
+        ('members', each containing 'displayName' and 'accountId') and the
+        roles whose members could not be read ('failed_roles').
         Returns an error object if the project is not found or an error occurs.
     """
     jira = await get_jira_fetcher(ctx)
     if not project_key:
         raise ValueError("project_key is required")
 
-    all_members_map: dict[str, dict[str, str]] = (
-        {}
-    )  # Use accountId as key to ensure uniqueness
-
     try:
-        project_roles = jira.get_project_roles(project_key)
-        if not project_roles:
-            return json.dumps([], indent=2, ensure_ascii=False)
-
-        for role_name, role_url in project_roles.items():
-            try:
-                # Extract role_id from the role_url (e.g., "https://.../rest/api/2/project/KEY/role/10000")
-                role_id = role_url.split("/")[-1]
-                if not role_id.isdigit():
-                    continue
-
-                role_members = jira.get_project_role_members(project_key, role_id)
-                for member in role_members:
-                    actor_type = member.get("type")
-                    display_name = member.get("displayName")
-                    account_id = None
-                    if actor_type == "atlassian-user-role-actor":
-                        actor_user = member.get("actorUser")
-                        if actor_user:
-                            account_id = actor_user.get("accountId")
-                    if account_id and display_name:
-                        if account_id not in all_members_map:
-                            all_members_map[account_id] = {
-                                "displayName": display_name,
-                                "accountId": account_id,
-                            }
-            except Exception as e_inner:
-                # Continue to next role if one fails
-                pass
-
-        unique_members_list = list(all_members_map.values())
-        return json.dumps(unique_members_list, indent=2, ensure_ascii=False)
-
+        members = await run_blocking(jira.get_project_members, project_key)
+        return dump_json({"project_key": project_key, **members})
     except Exception as e:
         error_payload = {
             "success": False,
             "error": f"Failed to get all members for project {project_key}: {str(e)}",
             "project_key": project_key,
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_json(error_payload)
@@ -3,7 +3,7 @@ Utility functions for the MCP Atlassian integration.
 This package provides various utility functions used throughout the codebase.
 """
 
-from .date import parse_date
+from .date import parse_date, parse_iso8601_date
 from .decorators import convert_empty_defaults_to_none
 from .io import is_read_only_mode
 from .logging import setup_logging
@@ -0,0 +1,234 @@
+"""Process-level caches shared by every fetcher instance.
+
+In HTTP transports a fetcher is built per user, so data cached on a fetcher
+instance is lost between requests. Site metadata that rarely changes (field
+definitions, spaces, create metadata, ...) is kept in :class:`SharedTTLCache`
+instances instead, and can optionally be snapshotted to ``MCP_CACHE_DIR`` so
+that a restarted server starts warm.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from cachetools import TTLCache
+
+logger = logging.getLogger("mcp-atlassian.utils.cache")
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_shared_caches: "weakref.WeakSet[SharedTTLCache[Any, Any]]" = weakref.WeakSet()
+
+
+class SharedTTLCache(Generic[K, V]):
+    """A thread-safe, size-bounded TTL cache.
+
+    Every instance is registered so that :func:`clear_shared_caches` can reset
+    all of them at once (e.g. between tests).
+    """
+
+    def __init__(
+        self,
+        maxsize: int | Callable[[], int],
+        ttl: float | Callable[[], float],
+        getsizeof: Callable[[V], int] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Settings given as functions are read when the cache is first used, and
+        again after it is cleared. Module-level caches pass functions reading
+        environment variables, which ``.env`` files only set after import.
+
+        Args:
+            maxsize: Maximum number of entries kept, or a function returning it.
+            ttl: Seconds an entry stays valid after it was stored, or a function
+                returning it.
+            getsizeof: Size of a value. When given, maxsize bounds the total
+                size of the entries instead of their number, and values larger
+                than maxsize are not stored.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._getsizeof = getsizeof
+        self._cache: TTLCache[K, V] | None = None
+        self._lock = threading.Lock()
+        _shared_caches.add(self)
+
+    def _entries(self) -> "TTLCache[K, V]":
+        """Return the underlying cache, creating it on first use.
+
+        Must be called with the lock held.
+        """
+        if self._cache is None:
+            maxsize = self._maxsize() if callable(self._maxsize) else self._maxsize
+            ttl = self._ttl() if callable(self._ttl) else self._ttl
+            self._cache = TTLCache(
+                maxsize=max(maxsize, 1), ttl=ttl, getsizeof=self._getsizeof
+            )
+        return self._cache
+
+    @property
+    def ttl(self) -> float:
+        """Seconds an entry stays valid; 0 or less disables the cache."""
+        with self._lock:
+            return self._entries().ttl
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entries = self._entries()
+            if entries.ttl <= 0:
+                return None
+            return entries.get(key)
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key``."""
+        with self._lock:
+            entries = self._entries()
+            if entries.ttl <= 0:
+                return
+            try:
+                entries[key] = value
+            except ValueError:
+                # Larger than the whole cache; drop any older value instead
+                entries.pop(key, None)
+
+    def pop(self, key: K) -> V | None:
+        """Remove ``key`` and return its value, if present."""
+        with self._lock:
+            return self._entries().pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries, and read the settings again on next use."""
+        with self._lock:
+            self._cache = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            entries = self._entries()
+            entries.expire()
+            return len(entries)
+
+
+def clear_shared_caches() -> None:
+    """Clear every :class:`SharedTTLCache` in the process."""
+    for cache in list(_shared_caches):
+        cache.clear()
+
+
+def config_fingerprint(config: Any) -> str | None:
+    """Hash the site URL and credentials of a Jira/Confluence configuration.
+
+    Args:
+        config: A JiraConfig/ConfluenceConfig, or any object with the same
+            attributes.
+
+    Returns:
+        A hex digest identifying the site and credentials, or None if ``config``
+        has no URL.
+    """
+    url = getattr(config, "url", None)
+    if not isinstance(url, str):
+        return None
+    oauth_config = getattr(config, "oauth_config", None)
+    credential = (
+        getattr(config, "personal_token", None)
+        or getattr(config, "api_token", None)
+        or getattr(oauth_config, "access_token", None)
+        or ""
+    )
+    raw = "\x1f".join(
+        [
+            url.rstrip("/"),
+            str(getattr(config, "auth_type", "")),
+            str(getattr(config, "username", None) or ""),
+            str(credential),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cache_dir() -> Path | None:
+    """Get the directory used for on-disk cache snapshots.
+
+    Controlled by MCP_CACHE_DIR. Snapshots are disabled when it is unset.
+    """
+    cache_dir = os.getenv("MCP_CACHE_DIR", "").strip()
+    return Path(cache_dir).expanduser() if cache_dir else None
+
+
+def _snapshot_path(namespace: str, key: str) -> Path | None:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return cache_dir / f"{namespace}-{digest}.json"
+
+
+def load_snapshot(namespace: str, key: str, max_age: float) -> Any | None:
+    """Load a snapshot written by :func:`save_snapshot`.
+
+    Args:
+        namespace: Snapshot family, e.g. ``"jira-fields"``.
+        key: Identifier of the snapshot within the namespace.
+        max_age: Snapshots older than this many seconds are ignored.
+
+    Returns:
+        The stored payload, or None if snapshots are disabled or the snapshot
+        is missing, stale or unreadable.
+    """
+    path = _snapshot_path(namespace, key)
+    if path is None or not path.is_file():
+        return None
+    try:
+        with path.open(encoding="utf-8") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache snapshot {path}: {e}")
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+        return None
+    if time.time() - float(snapshot.get("saved_at", 0)) > max_age:
+        return None
+    return snapshot.get("payload")
+
+
+def save_snapshot(namespace: str, key: str, payload: Any) -> None:
+    """Atomically write ``payload`` as JSON to the snapshot directory.
+
+    Does nothing when snapshots are disabled. Failures are logged, not raised.
+    """
+    path = _snapshot_path(namespace, key)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(
+                    {"key": key, "saved_at": time.time(), "payload": payload},
+                    tmp_file,
+                )
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write cache snapshot {path}: {e}")
+
+
+def delete_snapshot(namespace: str, key: str) -> None:
+    """Remove a snapshot, if snapshots are enabled and it exists."""
+    path = _snapshot_path(namespace, key)
+    if path is not None:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,215 @@
+"""Execution helpers for running blocking Atlassian API calls.
+
+The ``atlassian-python-api`` clients are synchronous. Tools call them through
+:func:`run_blocking`, which moves the call onto a bounded worker-thread pool so
+that a slow request does not stall every other MCP session sharing the event
+loop. A per-tenant limit (one tenant per set of credentials) stops a single
+user from occupying the whole pool.
+
+Synchronous fetcher code that needs to overlap independent HTTP requests (for
+example a search and its count query) uses :func:`submit_blocking`, which runs
+calls on a separate, bounded fan-out pool.
+"""
+
+import functools
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import anyio
+import anyio.to_thread
+import sniffio
+from cachetools import TTLCache
+
+from .cache import config_fingerprint
+from .environment import get_int_env
+
+logger = logging.getLogger("mcp-atlassian.utils.concurrency")
+
+T = TypeVar("T")
+
+DEFAULT_WORKER_THREADS = 16
+DEFAULT_TENANT_CONCURRENCY = 4
+DEFAULT_FANOUT_THREADS = 8
+
+# Limiters are bound to the async backend they were created in, so they are
+# keyed by backend name (e.g. "asyncio" or "trio").
+_thread_limiters: dict[str, anyio.CapacityLimiter] = {}
+_tenant_limiters: TTLCache[tuple[str, str], anyio.CapacityLimiter] = TTLCache(
+    maxsize=1024, ttl=3600
+)
+_limiters_lock = threading.Lock()
+
+_fanout_executor: ThreadPoolExecutor | None = None
+_fanout_lock = threading.Lock()
+
+
+def get_worker_threads() -> int:
+    """Get the size of the worker-thread pool used for blocking API calls.
+
+    Controlled by MCP_WORKER_THREADS. ``0`` disables offloading and runs calls
+    directly on the event loop.
+    """
+    return get_int_env("MCP_WORKER_THREADS", DEFAULT_WORKER_THREADS)
+
+
+def get_tenant_concurrency() -> int:
+    """Get the maximum number of concurrent blocking calls per tenant.
+
+    Controlled by MCP_TENANT_CONCURRENCY. ``0`` disables the per-tenant limit.
+    """
+    return get_int_env("MCP_TENANT_CONCURRENCY", DEFAULT_TENANT_CONCURRENCY)
+
+
+def get_fanout_threads() -> int:
+    """Get the size of the pool used to overlap requests inside one tool call.
+
+    Controlled by MCP_FANOUT_THREADS. ``0`` runs such requests one after another.
+    """
+    return get_int_env("MCP_FANOUT_THREADS", DEFAULT_FANOUT_THREADS)
+
+
+def tenant_key(func: Callable[..., Any]) -> str | None:
+    """Derive the tenant of a bound fetcher method from its configuration.
+
+    Args:
+        func: The callable about to be executed, typically ``fetcher.method``.
+
+    Returns:
+        A hash of the site URL and credentials, or None if the callable is not
+        bound to an object carrying a Jira/Confluence configuration.
+    """
+    owner = getattr(func, "__self__", None)
+    return config_fingerprint(getattr(owner, "config", None))
+
+
+def _get_thread_limiter(backend: str, total_tokens: int) -> anyio.CapacityLimiter:
+    with _limiters_lock:
+        limiter = _thread_limiters.get(backend)
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(total_tokens)
+            _thread_limiters[backend] = limiter
+        elif limiter.total_tokens != total_tokens:
+            limiter.total_tokens = total_tokens
+        return limiter
+
+
+def _get_tenant_limiter(
+    backend: str, tenant: str, total_tokens: int
+) -> anyio.CapacityLimiter:
+    with _limiters_lock:
+        limiter = _tenant_limiters.get((backend, tenant))
+        if limiter is None:
+            limiter = anyio.CapacityLimiter(total_tokens)
+        elif limiter.total_tokens != total_tokens:
+            limiter.total_tokens = total_tokens
+        # Re-insert so that active tenants are not evicted by the TTL.
+        _tenant_limiters[(backend, tenant)] = limiter
+        return limiter
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous fetcher call without blocking the event loop.
+
+    Args:
+        func: The blocking callable (usually a bound JiraFetcher or
+            ConfluenceFetcher method).
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        Whatever ``func`` returns. Exceptions raised by ``func`` propagate
+        unchanged.
+    """
+    call = functools.partial(func, *args, **kwargs)
+    worker_threads = get_worker_threads()
+    if worker_threads == 0:
+        return call()
+
+    backend = sniffio.current_async_library()
+    thread_limiter = _get_thread_limiter(backend, worker_threads)
+    tenant = tenant_key(func)
+    tenant_concurrency = get_tenant_concurrency()
+    if tenant is None or tenant_concurrency == 0:
+        return await anyio.to_thread.run_sync(call, limiter=thread_limiter)
+
+    async with _get_tenant_limiter(backend, tenant, tenant_concurrency):
+        return await anyio.to_thread.run_sync(call, limiter=thread_limiter)
+
+
+def _get_fanout_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _fanout_executor
+    with _fanout_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mcp-atlassian-fanout"
+            )
+        return _fanout_executor
+
+
+def submit_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+    """Start a blocking call in the background from synchronous code.
+
+    Submitted calls must not wait on other submitted calls themselves, otherwise
+    the bounded pool could deadlock.
+
+    Args:
+        func: The blocking callable, typically a single HTTP request.
+        *args: Positional arguments for ``func``.
+        **kwargs: Keyword arguments for ``func``.
+
+    Returns:
+        A future for the result. With MCP_FANOUT_THREADS=0 the call runs
+        immediately and the returned future is already resolved.
+    """
+    fanout_threads = get_fanout_threads()
+    if fanout_threads > 0:
+        return _get_fanout_executor(fanout_threads).submit(func, *args, **kwargs)
+
+    future: Future[T] = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def prefetch_call(
+    func: Callable[..., T], /, *args: Any, enabled: bool = True
+) -> Callable[[], T]:
+    """Optionally start a blocking call ahead of the moment its result is needed.
+
+    Args:
+        func: The blocking callable, e.g. a request for the next result page.
+        *args: Positional arguments for ``func``.
+        enabled: When False, nothing runs until the returned callable is invoked.
+
+    Returns:
+        A callable returning the result (or raising the call's exception).
+    """
+    if enabled:
+        return submit_blocking(func, *args).result
+    return functools.partial(func, *args)
+
+
+async def iterate_blocking(iterable: Iterable[T]) -> AsyncIterator[T]:
+    """Consume a blocking iterator (e.g. a paging generator) asynchronously.
+
+    Each step of the iterator runs through :func:`run_blocking`, so pages are
+    fetched on the worker-thread pool while the event loop stays responsive.
+
+    Args:
+        iterable: The blocking iterable to consume.
+
+    Yields:
+        The items produced by ``iterable``.
+    """
+    iterator = iter(iterable)
+    exhausted = object()
+    while True:
+        item = await run_blocking(next, iterator, exhausted)
+        if item is exhausted:
+            return
+        yield item  # type: ignore[misc]
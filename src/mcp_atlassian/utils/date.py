@@ -2,11 +2,42 @@
 
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import dateutil.parser
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Distinct timestamp strings kept parsed (least recently used are dropped first)
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_iso8601_date(date_str: str) -> datetime | None:
+    """
+    Parse an ISO 8601 timestamp as returned by the Atlassian APIs.
+
+    Handles the "Z" suffix and offsets without a colon ("+0000") directly,
+    so that timestamps like "2024-01-01T10:00:00.000+0000" parse in a single
+    pass. Results are cached by the raw string.
+
+    Args:
+        date_str: Timestamp string
+
+    Returns:
+        Parsed datetime or None if date_str is not an ISO 8601 timestamp
+    """
+    if not isinstance(date_str, str):
+        return None
+    if date_str.endswith("Z"):
+        date_str = date_str[:-1] + "+00:00"
+    elif len(date_str) > 10 and date_str[-5] in "+-" and date_str[-4:].isdigit():
+        date_str = f"{date_str[:-2]}:{date_str[-2:]}"
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
 
 def parse_date(date_str: str | int | None) -> datetime | None:
     """
@@ -15,6 +46,7 @@ def parse_date(date_str: str | int | None) -> datetime | None:
     The input string `date_str` accepts:
     - None
     - Epoch timestamp (only contains digits and is in milliseconds)
+    - ISO 8601 timestamps with a time part, parsed with `parse_iso8601_date`
     - Other formats supported by `dateutil.parser` (ISO 8601, RFC 3339, etc.)
 
     Args:
@@ -28,4 +60,8 @@ def parse_date(date_str: str | int | None) -> datetime | None:
         return None
     if isinstance(date_str, int) or date_str.isdigit():
         return datetime.fromtimestamp(int(date_str) / 1000, tz=timezone.utc)
+    # Only timestamps with a time part take the fast path: fromisoformat reads
+    # an offset after a bare date ("2024-01-02+0530") as the time
+    if date_str[10:11] in ("T", " ") and (parsed := parse_iso8601_date(date_str)):
+        return parsed
     return dateutil.parser.parse(date_str)
@@ -0,0 +1,85 @@
+"""JSON encoding of tool responses.
+
+Every tool returns its result as a JSON string built by :func:`dump_json`, so
+the encoding is configured in one place:
+
+- MCP_JSON_COMPACT: drop indentation and the spaces after separators.
+- MCP_JSON_OMIT_EMPTY: leave out null values and empty strings, lists and
+  objects.
+
+When the optional ``orjson`` package is installed it is used to encode, which
+is several times faster than the standard library for large results.
+"""
+
+import json
+import logging
+from typing import Any
+
+from .environment import get_bool_env
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger("mcp-atlassian.utils.encoding")
+
+
+def is_json_compact() -> bool:
+    """Whether tool responses are encoded without indentation (MCP_JSON_COMPACT)."""
+    return get_bool_env("MCP_JSON_COMPACT")
+
+
+def is_json_omit_empty() -> bool:
+    """Whether empty values are left out of tool responses (MCP_JSON_OMIT_EMPTY)."""
+    return get_bool_env("MCP_JSON_OMIT_EMPTY")
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (
+        isinstance(value, str | list | tuple | dict) and len(value) == 0
+    )
+
+
+def omit_empty(data: Any) -> Any:
+    """Recursively remove null and empty values from the objects in ``data``.
+
+    Objects that become empty are removed as well. List items are kept (only
+    cleaned), so positions in lists do not shift.
+    """
+    if isinstance(data, dict):
+        cleaned = {}
+        for key, value in data.items():
+            value = omit_empty(value)
+            if not _is_empty(value):
+                cleaned[key] = value
+        return cleaned
+    if isinstance(data, list | tuple):
+        return [omit_empty(item) for item in data]
+    return data
+
+
+def dump_json(data: Any) -> str:
+    """Encode a tool result as JSON according to the server-wide settings.
+
+    Args:
+        data: The JSON-serializable result.
+
+    Returns:
+        The JSON text. Non-ASCII characters are written as-is.
+    """
+    compact = is_json_compact()
+    if is_json_omit_empty():
+        data = omit_empty(data)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError as e:
+            # e.g. integers beyond 64 bits; the standard library handles them
+            logger.debug(f"orjson could not encode the response: {e}")
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(data, indent=2, ensure_ascii=False)
@@ -98,3 +98,48 @@ def get_available_services() -> dict[str, bool | None]:
         )
 
     return {"confluence": confluence_is_setup, "jira": jira_is_setup}
+
+
+def get_int_env(name: str, default: int) -> int:
+    """Read a non-negative integer setting from the environment.
+
+    Args:
+        name: The environment variable to read.
+        default: Value returned when the variable is unset or invalid.
+
+    Returns:
+        The parsed integer, or ``default`` if it is missing, malformed or negative.
+    """
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        value = int(raw_value.strip())
+    except ValueError:
+        logger.warning(
+            f"Invalid integer value for {name}: '{raw_value}'. Using default {default}."
+        )
+        return default
+    if value < 0:
+        logger.warning(
+            f"Negative value for {name}: '{raw_value}'. Using default {default}."
+        )
+        return default
+    return value
+
+
+def get_bool_env(name: str, default: bool = False) -> bool:
+    """Read a boolean setting from the environment.
+
+    Args:
+        name: The environment variable to read.
+        default: Value returned when the variable is unset or empty.
+
+    Returns:
+        True for "true", "1", "yes", "y" or "on" (case-insensitive), False for
+        any other non-empty value.
+    """
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    return raw_value.strip().lower() in ("true", "1", "yes", "y", "on")
@@ -0,0 +1,189 @@
+"""Conditional-request (ETag / Last-Modified) caching for Atlassian sessions.
+
+Project, issue type, create metadata, link type, board and space listings
+rarely change but can be large. :func:`configure_conditional_requests` mounts
+an adapter on a client's ``requests`` session that remembers the validators
+and body of such responses, revalidates them with ``If-None-Match`` /
+``If-Modified-Since``, and answers a ``304 Not Modified`` from the stored body.
+"""
+
+import logging
+import re
+from collections.abc import Mapping
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.sessions import Session
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .cache import SharedTTLCache
+from .environment import get_int_env
+
+logger = logging.getLogger("mcp-atlassian.utils.http_cache")
+
+# Larger bodies are not kept (e.g. createmeta of very big projects).
+MAX_CACHED_RESPONSE_BYTES = 8 * 1024 * 1024
+
+BYTES_PER_MB = 1024 * 1024
+
+# Metadata resources whose responses are revalidated instead of re-downloaded.
+CONDITIONAL_PATHS = re.compile(
+    r"/rest/(?:"
+    r"api/(?:2|3|latest)/(?:project|issuetype|issueLinkType|issue/createmeta"
+    r"|field|priority|status|resolution)"
+    r"|agile/1\.0/board"
+    r"|api/space"
+    r")(?:/|$)"
+)
+
+
+def get_http_cache_ttl() -> int:
+    """Get the number of seconds a cached response can be revalidated.
+
+    Controlled by MCP_HTTP_CACHE_TTL. ``0`` disables conditional requests.
+    """
+    return get_int_env("MCP_HTTP_CACHE_TTL", 3600)
+
+
+class CachedResponse:
+    """The validators and body of a successful response."""
+
+    __slots__ = ("etag", "last_modified", "headers", "content")
+
+    def __init__(self, response: Response) -> None:
+        self.etag: str | None = response.headers.get("ETag")
+        self.last_modified: str | None = response.headers.get("Last-Modified")
+        self.headers = dict(response.headers)
+        self.content: bytes = response.content
+
+
+# Responses by (tenant, URL, Accept header). Keyed by tenant because the same
+# resource can look different to users with different permissions. Bounded by
+# the total size of the cached bodies, since createmeta and board responses
+# can be megabytes each.
+_responses: SharedTTLCache[tuple[str, str, str], CachedResponse] = SharedTTLCache(
+    maxsize=lambda: get_int_env("MCP_HTTP_CACHE_MAX_MB", 64) * BYTES_PER_MB,
+    ttl=get_http_cache_ttl,
+    getsizeof=lambda cached: max(len(cached.content), 1),
+)
+
+
+def is_conditional_request(request: PreparedRequest) -> bool:
+    """Whether ``request`` reads a metadata resource that may be revalidated."""
+    if request.method != "GET" or not request.url:
+        return False
+    return CONDITIONAL_PATHS.search(urlsplit(request.url).path) is not None
+
+
+class ConditionalRequestAdapter(BaseAdapter):
+    """Transport adapter adding conditional requests to another adapter.
+
+    Every request is sent through the wrapped adapter, so SSL and proxy
+    settings of the session keep applying.
+    """
+
+    def __init__(self, adapter: BaseAdapter, tenant: str) -> None:
+        """Initialize the adapter.
+
+        Args:
+            adapter: The adapter that actually sends requests.
+            tenant: Identifier of the site and credentials the session uses.
+        """
+        super().__init__()
+        self.adapter = adapter
+        self.tenant = tenant
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> Response:
+        """Send a request, revalidating cached metadata responses."""
+        if stream or not is_conditional_request(request):
+            return self.adapter.send(
+                request,
+                stream=stream,
+                timeout=timeout,
+                verify=verify,
+                cert=cert,
+                proxies=proxies,
+            )
+
+        cache_key = (self.tenant, str(request.url), request.headers.get("Accept", ""))
+        cached = _responses.get(cache_key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.adapter.send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Serving {request.url} from the response cache")
+            _responses.set(cache_key, cached)
+            return self._from_cache(response, cached)
+
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            if len(response.content) <= MAX_CACHED_RESPONSE_BYTES:
+                _responses.set(cache_key, CachedResponse(response))
+            else:
+                _responses.pop(cache_key)
+        elif cached is not None:
+            _responses.pop(cache_key)
+        return response
+
+    @staticmethod
+    def _from_cache(response: Response, cached: CachedResponse) -> Response:
+        """Turn a ``304 Not Modified`` into the cached ``200 OK``."""
+        # Read the (empty) body so that the connection returns to the pool.
+        _ = response.content
+        headers = CaseInsensitiveDict(cached.headers)
+        headers.update(response.headers)
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response._content = cached.content
+        response.encoding = get_encoding_from_headers(headers)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped adapter."""
+        self.adapter.close()
+
+
+def configure_conditional_requests(
+    service_name: str, url: str, session: Session, tenant: str | None
+) -> None:
+    """Enable conditional requests for metadata resources of a service.
+
+    Args:
+        service_name: Name of the service for logging (e.g., "Confluence", "Jira")
+        url: The base URL requests are sent to
+        session: The requests session to configure
+        tenant: Identifier of the site and credentials (see
+            :func:`~mcp_atlassian.utils.cache.config_fingerprint`); nothing
+            is configured when it is None
+    """
+    if tenant is None or not isinstance(url, str) or get_http_cache_ttl() <= 0:
+        return
+    prefix = url.rstrip("/")
+    adapter = session.get_adapter(prefix)
+    if isinstance(adapter, ConditionalRequestAdapter):
+        adapter = adapter.adapter
+    session.mount(prefix, ConditionalRequestAdapter(adapter, tenant))
+    logger.debug(f"{service_name} conditional requests enabled for {prefix}")
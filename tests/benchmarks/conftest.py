@@ -0,0 +1,38 @@
+"""Configuration for micro-benchmarks."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+def pytest_configure(config):
+    """Add benchmark marker."""
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a micro-benchmark (slow, timing based)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless explicitly requested."""
+    if not config.getoption("--run-benchmarks", default=False):
+        skip_benchmark = pytest.mark.skip(reason="Need --run-benchmarks option to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
+
+@pytest.fixture
+def best_of() -> Callable[..., float]:
+    """Return a timer reporting the fastest of several runs, in seconds."""
+
+    def run(func: Callable[..., Any], *args: Any, repeat: int = 5) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return run
@@ -0,0 +1,50 @@
+"""Micro-benchmarks for converting Confluence storage format.
+
+Run with ``pytest tests/benchmarks --run-benchmarks -s``.
+"""
+
+import pytest
+
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+
+pytestmark = pytest.mark.benchmark
+
+# A section of a large wiki page: headings, rich text, a table, a list, a
+# code macro and user mentions.
+PAGE_SECTION = (
+    "<h2>Release checklist</h2>"
+    '<p>Owner: <ac:link><ri:user ri:account-id="5b10a2844c20165700ede21g"/>'
+    '</ac:link>. See <a href="https://example.com/runbook">the runbook</a> and '
+    "<strong>do not</strong> skip the <code>smoke</code> tests.</p>"
+    "<table><tbody><tr><th>Step</th><th>Status</th></tr>"
+    "<tr><td>Freeze</td><td>Done</td></tr><tr><td>Deploy</td><td>Pending</td></tr>"
+    "</tbody></table>"
+    "<ul><li>Notify support</li><li>Update the status page</li></ul>"
+    '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+    "<![CDATA[kubectl rollout status deploy/api]]></ac:plain-text-body>"
+    "</ac:structured-macro>"
+)
+
+
+class _UserDirectory:
+    def get_user_details_by_accountid(self, account_id):
+        return {"displayName": "Release Manager"}
+
+
+@pytest.fixture(scope="module")
+def preprocessor() -> ConfluencePreprocessor:
+    return ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=_UserDirectory()
+    )
+
+
+@pytest.mark.parametrize("output_format", [None, "markdown", "html"])
+def test_process_html_content_large_page(preprocessor, best_of, output_format):
+    """Measure converting a 1 MB storage-format page."""
+    html = PAGE_SECTION * (1_000_000 // len(PAGE_SECTION))
+    elapsed = best_of(
+        lambda: preprocessor.process_html_content(html, output_format=output_format),
+        repeat=2,
+    )
+    print(f"\nprocess_html_content output_format={output_format}: {elapsed:.2f}s")
+    assert elapsed < 30
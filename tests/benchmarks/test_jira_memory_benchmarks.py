@@ -0,0 +1,128 @@
+"""Memory benchmarks for holding many Jira issues.
+
+Reports the bytes retained per issue by issue models, simplified dictionaries
+and compact records. Run with ``pytest tests/benchmarks --run-benchmarks -s``.
+"""
+
+import copy
+import tracemalloc
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.models.jira import JiraIssue, JiraIssueRecord
+from mcp_atlassian.models.jira.record import RecordInterner
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+pytestmark = pytest.mark.benchmark
+
+ISSUE_COUNT = 1000
+HISTORIES_PER_ISSUE = 5
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+
+
+def _issues() -> list[dict]:
+    """Return distinct issues with a changelog, like an expanded search result."""
+    issues = []
+    for number in range(ISSUE_COUNT):
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        issue["id"] = str(10000 + number)
+        issue["key"] = f"PROJ-{number}"
+        issue["fields"]["summary"] = f"Issue number {number}"
+        issue["changelog"] = {
+            "histories": [
+                {
+                    "id": str(number * HISTORIES_PER_ISSUE + index),
+                    "author": copy.deepcopy(issue["fields"]["reporter"]),
+                    "created": f"2024-01-{index + 1:02d}T10:00:00.000+0000",
+                    "items": [
+                        {
+                            "field": "status",
+                            "fieldtype": "jira",
+                            "fromString": STATUSES[index % 4],
+                            "toString": STATUSES[(index + 1) % 4],
+                        }
+                    ],
+                }
+                for index in range(HISTORIES_PER_ISSUE)
+            ]
+        }
+        issues.append(issue)
+    return issues
+
+
+def _retained_bytes(build) -> int:
+    """Return the memory still allocated after building, in bytes."""
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+@pytest.mark.parametrize("requested_fields", ["summary,status,assignee", "*all"])
+def test_bytes_per_issue(requested_fields):
+    """Report the memory retained per issue for each representation."""
+    issues = _issues()
+
+    def models() -> list:
+        return [
+            JiraIssue.from_api_response(issue, requested_fields=requested_fields)
+            for issue in issues
+        ]
+
+    def dicts() -> list:
+        return [
+            JiraIssue.simplify_api_response(issue, requested_fields=requested_fields)
+            for issue in issues
+        ]
+
+    def records() -> list:
+        interner = RecordInterner()
+        return [
+            JiraIssueRecord.from_api_response(
+                issue, interner, requested_fields=requested_fields
+            )
+            for issue in issues
+        ]
+
+    print(f"\n{ISSUE_COUNT} issues, fields {requested_fields}:")
+    sizes = {}
+    for name, build in (("models", models), ("dicts", dicts), ("records", records)):
+        sizes[name] = _retained_bytes(build) / ISSUE_COUNT
+        print(f"  {name:8} {sizes[name]:10.0f} bytes/issue")
+    assert sizes["records"] < sizes["dicts"] < sizes["models"]
+
+
+def test_changelog_bytes_per_issue():
+    """Report the memory retained per issue for bulk-fetched changelogs."""
+    fetcher = JiraFetcher.__new__(JiraFetcher)
+    fetcher.config = MagicMock(is_cloud=True)
+    fetcher.jira = MagicMock()
+    pages = [
+        {
+            "issueChangeLogs": [
+                {
+                    "issueId": issue["id"],
+                    "changeHistories": issue["changelog"]["histories"],
+                }
+                for issue in _issues()
+            ]
+        }
+    ]
+    fetcher.iter_paged = MagicMock(side_effect=lambda *args, **kwargs: iter(pages))
+    keys = [f"PROJ-{number}" for number in range(ISSUE_COUNT)]
+
+    print(f"\n{ISSUE_COUNT} issues, {HISTORIES_PER_ISSUE} changelogs each:")
+    sizes = {}
+    for name, build in (
+        ("models", lambda: fetcher.batch_get_changelogs(keys)),
+        ("records", lambda: fetcher.batch_get_changelog_records(keys)),
+    ):
+        sizes[name] = _retained_bytes(build) / ISSUE_COUNT
+        print(f"  {name:8} {sizes[name]:10.0f} bytes/issue")
+    assert sizes["records"] < sizes["models"]
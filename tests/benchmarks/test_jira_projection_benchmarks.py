@@ -0,0 +1,117 @@
+"""Micro-benchmarks for converting Jira search results to tool output.
+
+Compares building the models and simplifying them with converting the API
+response directly. Run with ``pytest tests/benchmarks --run-benchmarks -s``.
+"""
+
+import copy
+import tracemalloc
+
+import pytest
+
+from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+pytestmark = pytest.mark.benchmark
+
+PAGE_SIZE = 100
+
+REQUESTED_FIELDS = {
+    "default": ",".join(DEFAULT_READ_JIRA_FIELDS),
+    "narrow": "summary,status",
+    "all": "*all",
+}
+
+
+def _page(size: int = PAGE_SIZE) -> dict:
+    issues = []
+    for number in range(size):
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        issue["id"] = str(10000 + number)
+        issue["key"] = f"PROJ-{number}"
+        issues.append(issue)
+    return {"issues": issues, "total": size, "startAt": 0, "maxResults": size}
+
+
+def _via_models(page: dict, requested_fields: str) -> dict:
+    return JiraSearchResult.from_api_response(
+        page, requested_fields=requested_fields
+    ).to_simplified_dict()
+
+
+def _direct(page: dict, requested_fields: str) -> dict:
+    return JiraSearchResult.simplify_api_response(
+        page, requested_fields=requested_fields
+    )
+
+
+def _peak_memory(func, *args) -> int:
+    """Return the peak memory allocated during one call, in bytes."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize("fields", list(REQUESTED_FIELDS))
+def test_search_page_projection(best_of, fields):
+    """Report time and peak memory to simplify a 100-issue page."""
+    page = _page()
+    requested_fields = REQUESTED_FIELDS[fields]
+    assert _direct(page, requested_fields) == _via_models(page, requested_fields)
+
+    print(f"\n{PAGE_SIZE} issues, {fields} fields:")
+    timings = {}
+    for name, func in (("models", _via_models), ("direct", _direct)):
+        timings[name] = best_of(func, page, requested_fields, repeat=10)
+        peak = _peak_memory(func, page, requested_fields)
+        print(f"  {name:8} {timings[name] * 1e3:8.2f} ms {peak / 1024:8.1f} KiB peak")
+    print(f"  speedup  {timings['models'] / timings['direct']:8.1f}x")
+    assert timings["direct"] < timings["models"]
+
+
+def test_serialize_1000_issues_all_fields(best_of):
+    """Report the time to simplify 1,000 issue models requested with *all."""
+    page = _page(1000)
+    issues = [
+        JiraIssue.from_api_response(issue, requested_fields="*all")
+        for issue in page["issues"]
+    ]
+
+    def simplify() -> list:
+        return [issue.to_simplified_dict() for issue in issues]
+
+    elapsed = best_of(simplify, repeat=5)
+    print(
+        f"\n1000 issues, *all: {elapsed * 1e3:8.2f} ms ({elapsed * 1e3:.1f} us/issue)"
+    )
+    assert len(simplify()) == 1000
+
+
+def test_search_page_entity_sharing(best_of):
+    """Report the time and memory saved by sharing entities within a page."""
+    page = _page()
+    requested_fields = REQUESTED_FIELDS["default"]
+
+    def unshared() -> list:
+        return [
+            JiraIssue.from_api_response(issue, requested_fields=requested_fields)
+            for issue in page["issues"]
+        ]
+
+    def shared() -> list:
+        return JiraSearchResult.from_api_response(
+            page, requested_fields=requested_fields
+        ).issues
+
+    print(f"\n{PAGE_SIZE} issue models, default fields:")
+    peaks = {}
+    for name, func in (("unshared", unshared), ("shared", shared)):
+        elapsed = best_of(func, repeat=10)
+        peaks[name] = _peak_memory(func)
+        print(f"  {name:8} {elapsed * 1e3:8.2f} ms {peaks[name] / 1024:8.1f} KiB peak")
+    assert peaks["shared"] < peaks["unshared"]
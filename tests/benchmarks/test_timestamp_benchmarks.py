@@ -0,0 +1,132 @@
+"""Micro-benchmarks for parsing and formatting Atlassian timestamps.
+
+Compares the previous string-rewriting and dateutil parsers with the cached
+ISO 8601 codec over 10,000 changelog entries. Run with
+``pytest tests/benchmarks --run-benchmarks -s``.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import dateutil.parser
+import pytest
+
+from mcp_atlassian.models.base import TimestampMixin, _format_timestamp
+from mcp_atlassian.models.jira.common import JiraChangelog
+from mcp_atlassian.utils.date import parse_iso8601_date
+from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+
+pytestmark = pytest.mark.benchmark
+
+CHANGELOG_COUNT = 10000
+
+
+def _changelogs() -> list[dict]:
+    """Return changelog entries a few minutes apart, as in an expanded issue."""
+    start = datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+    author = MOCK_JIRA_ISSUE_RESPONSE["fields"]["reporter"]
+    return [
+        {
+            "id": str(number),
+            "author": author,
+            "created": (start + timedelta(minutes=7 * number)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000+0000"
+            ),
+            "items": [{"field": "status", "fromString": "To Do", "toString": "Done"}],
+        }
+        for number in range(CHANGELOG_COUNT)
+    ]
+
+
+def _legacy_parse(timestamp: str) -> datetime:
+    """The previous TimestampMixin parsing, shared by both methods."""
+    ts = timestamp.replace("Z", "+00:00")
+    if "+" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("+")
+        if tz_pos != -1 and len(ts) >= tz_pos + 5:
+            ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+    elif "-" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("-")
+        if tz_pos != -1 and len(ts) >= tz_pos + 5:
+            ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+    return datetime.fromisoformat(ts)
+
+
+def _legacy_is_valid_timestamp(timestamp: str) -> bool:
+    try:
+        _legacy_parse(timestamp)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _legacy_format_timestamp(timestamp: str) -> str:
+    try:
+        return _legacy_parse(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError):
+        return timestamp
+
+
+def _clear_caches() -> None:
+    parse_iso8601_date.cache_clear()
+    _format_timestamp.cache_clear()
+
+
+def test_format_changelog_timestamps(best_of):
+    """Report the time to validate and format 10,000 changelog timestamps."""
+    timestamps = [entry["created"] for entry in _changelogs()]
+
+    def legacy() -> list:
+        return [
+            _legacy_format_timestamp(ts)
+            for ts in timestamps
+            if _legacy_is_valid_timestamp(ts)
+        ]
+
+    def codec() -> list:
+        return [
+            TimestampMixin.format_timestamp(ts)
+            for ts in timestamps
+            if TimestampMixin.is_valid_timestamp(ts)
+        ]
+
+    def cold() -> list:
+        _clear_caches()
+        return codec()
+
+    assert cold() == legacy()
+
+    print(f"\n{CHANGELOG_COUNT} changelog timestamps, validate and format:")
+    timings = {}
+    for name, func in (("legacy", legacy), ("codec", cold)):
+        timings[name] = best_of(func, repeat=5)
+        print(f"  {name:8} {timings[name] * 1e3:8.2f} ms")
+    assert timings["codec"] < timings["legacy"]
+
+
+def test_build_changelogs(best_of):
+    """Report the time to parse and build 10,000 changelog models."""
+    changelogs = _changelogs()
+
+    def dateutil_parse() -> list:
+        return [dateutil.parser.parse(entry["created"]) for entry in changelogs]
+
+    def codec_parse() -> list:
+        _clear_caches()
+        return [parse_iso8601_date(entry["created"]) for entry in changelogs]
+
+    def build() -> list:
+        _clear_caches()
+        return [JiraChangelog.from_api_response(entry) for entry in changelogs]
+
+    assert codec_parse() == dateutil_parse()
+
+    print(f"\n{CHANGELOG_COUNT} changelogs:")
+    timings = {}
+    for name, func in (
+        ("dateutil", dateutil_parse),
+        ("codec", codec_parse),
+        ("models", build),
+    ):
+        timings[name] = best_of(func, repeat=5)
+        print(f"  {name:8} {timings[name] * 1e3:8.2f} ms")
+    assert timings["codec"] < timings["dateutil"]
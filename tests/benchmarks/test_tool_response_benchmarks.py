@@ -0,0 +1,122 @@
+"""Micro-benchmarks for encoding tool responses.
+
+Run with ``pytest tests/benchmarks --run-benchmarks -s``.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.models.confluence import (
+    ConfluenceComment,
+    ConfluencePage,
+    ConfluenceSearchResult,
+)
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.utils import encoding
+from mcp_atlassian.utils.encoding import dump_json
+from tests.fixtures.confluence_mocks import (
+    MOCK_COMMENTS_RESPONSE,
+    MOCK_CQL_SEARCH_RESPONSE,
+    MOCK_PAGE_RESPONSE,
+)
+from tests.fixtures.jira_mocks import (
+    MOCK_JIRA_COMMENTS,
+    MOCK_JIRA_ISSUE_RESPONSE,
+    MOCK_JIRA_JQL_RESPONSE,
+)
+
+pytestmark = pytest.mark.benchmark
+
+# Number of copies of the recorded results in list responses, to model a page
+# of search results rather than the two or three items in the fixtures.
+LIST_COPIES = 25
+
+
+def _jira_search() -> dict:
+    result = JiraSearchResult.from_api_response(MOCK_JIRA_JQL_RESPONSE)
+    issues = [issue.to_simplified_dict() for issue in result.issues]
+    return {
+        "total": result.total,
+        "start_at": result.start_at,
+        "max_results": result.max_results,
+        "issues": issues * LIST_COPIES,
+    }
+
+
+def _jira_comments() -> list:
+    comments = [
+        {"id": c["id"], "body": c["body"], "author": c["author"]["displayName"]}
+        for c in MOCK_JIRA_COMMENTS["comments"]
+    ]
+    return comments * LIST_COPIES
+
+
+def _confluence_search() -> list:
+    result = ConfluenceSearchResult.from_api_response(MOCK_CQL_SEARCH_RESPONSE)
+    return [page.to_simplified_dict() for page in result.results] * LIST_COPIES
+
+
+def _confluence_comments() -> list:
+    comments = [
+        ConfluenceComment.from_api_response(c).to_simplified_dict()
+        for c in MOCK_COMMENTS_RESPONSE["results"]
+    ]
+    return comments * LIST_COPIES
+
+
+TOOL_RESULTS = {
+    "jira_get_issue": lambda: JiraIssue.from_api_response(
+        MOCK_JIRA_ISSUE_RESPONSE
+    ).to_simplified_dict(),
+    "jira_search": _jira_search,
+    "jira_get_comments": _jira_comments,
+    "confluence_get_page": lambda: {
+        "metadata": ConfluencePage.from_api_response(
+            MOCK_PAGE_RESPONSE
+        ).to_simplified_dict()
+    },
+    "confluence_search": _confluence_search,
+    "confluence_get_comments": _confluence_comments,
+}
+
+MODES = {
+    "pretty/json": ({}, False),
+    "compact/json": ({"MCP_JSON_COMPACT": "true"}, False),
+    "compact+omit/json": (
+        {"MCP_JSON_COMPACT": "true", "MCP_JSON_OMIT_EMPTY": "true"},
+        False,
+    ),
+    "pretty/orjson": ({}, True),
+    "compact/orjson": ({"MCP_JSON_COMPACT": "true"}, True),
+    "compact+omit/orjson": (
+        {"MCP_JSON_COMPACT": "true", "MCP_JSON_OMIT_EMPTY": "true"},
+        True,
+    ),
+}
+
+
+@pytest.mark.parametrize("tool", list(TOOL_RESULTS))
+def test_tool_response_size_and_encode_time(best_of, tool):
+    """Report response bytes and encode time per tool and encoding mode."""
+    result = TOOL_RESULTS[tool]()
+    baseline = len(json.dumps(result, indent=2, ensure_ascii=False).encode())
+
+    print(f"\n{tool}:")
+    for mode, (env, use_orjson) in MODES.items():
+        if use_orjson and encoding.orjson is None:
+            continue
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch.object(encoding, "orjson", encoding.orjson if use_orjson else None),
+        ):
+            size = len(dump_json(result).encode())
+            elapsed = best_of(dump_json, result, repeat=20)
+        print(
+            f"  {mode:20} {size:8} bytes ({size / baseline:4.0%})"
+            f" {elapsed * 1e6:8.1f} us"
+        )
+        if "compact" in mode:
+            assert size < baseline
@@ -2,6 +2,8 @@
 Root pytest configuration file for MCP Atlassian tests.
 """
 
+import sys
+
 import pytest
 
 
@@ -13,6 +15,27 @@ def pytest_addoption(parser):
         default=False,
         help="Run tests that use real API data (requires env vars)",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the micro-benchmarks in tests/benchmarks",
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_caches():
+    """Clear process-level caches so tests sharing a mock site URL stay isolated."""
+
+    def clear() -> None:
+        # Tests import the package both as `mcp_atlassian` and `src.mcp_atlassian`
+        for name, module in list(sys.modules.items()):
+            if name.endswith("mcp_atlassian.utils.cache"):
+                module.clear_shared_caches()
+
+    clear()
+    yield
+    clear()
 
 
 @pytest.fixture
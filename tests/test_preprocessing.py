@@ -103,6 +103,44 @@ def test_process_html_content_with_user_mentions(preprocessor_with_confluence):
     assert "@Test User 123456" in processed_markdown
 
 
+def test_process_html_content_single_output(preprocessor_with_confluence):
+    """Test that only the requested output format is produced."""
+    plain_html = "<p>Simple  <b>text</b></p>"
+    assert preprocessor_with_confluence.process_html_content(
+        plain_html, output_format="html"
+    ) == (plain_html, "")
+
+    html = (
+        '<p>Hi <ac:link><ri:user ri:account-id="123456"/></ac:link></p>'
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[print('hi')]]></ac:plain-text-body></ac:structured-macro>"
+    )
+    both = preprocessor_with_confluence.process_html_content(html)
+    html_only = preprocessor_with_confluence.process_html_content(
+        html, output_format="html"
+    )
+    markdown_only = preprocessor_with_confluence.process_html_content(
+        html, output_format="markdown"
+    )
+
+    assert html_only == (both[0], "")
+    assert markdown_only == ("", both[1])
+    assert "@Test User 123456" in markdown_only[1]
+    assert "print('hi')" in markdown_only[1]
+
+
+def test_process_html_content_markdown_only_bare_text(preprocessor_with_confluence):
+    """Test that Markdown-only output of text fragments matches the full output."""
+    for html, expected in [("hello world", "hello world"), ("a &amp; b", "a & b")]:
+        both = preprocessor_with_confluence.process_html_content(html)
+        markdown_only = preprocessor_with_confluence.process_html_content(
+            html, output_format="markdown"
+        )
+
+        assert both[1] == expected
+        assert markdown_only == ("", expected)
+
+
 def test_clean_jira_text_empty(preprocessor_with_jira):
     """Test cleaning empty Jira text."""
     assert preprocessor_with_jira.clean_jira_text("") == ""
@@ -227,6 +265,16 @@ For more information, see [our website|https://example.com].
     assert "[our website](https://example.com)" in converted
 
 
+def test_jira_to_markdown_unterminated_citation(preprocessor_with_jira):
+    """Test that a "??" without a closing "??" does not backtrack exponentially."""
+    text = "Why does the export fail?? " + "It worked yesterday. " * 20
+    assert preprocessor_with_jira.jira_to_markdown(text) == text
+    assert (
+        preprocessor_with_jira.jira_to_markdown("See ??Platform?? notes")
+        == "See <cite>Platform</cite> notes"
+    )
+
+
 def test_markdown_to_jira(preprocessor_with_jira):
     """Test conversion of Markdown to Jira markup."""
     # Test headers
@@ -403,3 +451,91 @@ def test_process_user_profile_macro_multiple():
     assert "@Test User Two" in processed_html
     assert "@Test User One" in processed_markdown
     assert "@Test User Two" in processed_markdown
+
+
+class CountingConfluenceClient:
+    """Confluence client double that records user lookups."""
+
+    def __init__(self, cloud: bool = False) -> None:
+        self.cloud = cloud
+        self.lookups: list[str] = []
+        self.bulk_requests: list[list[str]] = []
+
+    def get_user_details_by_accountid(self, account_id):
+        self.lookups.append(account_id)
+        if account_id.startswith("gone"):
+            raise ValueError("User not found")
+        return {"displayName": f"Name {account_id}"}
+
+    def get_user_details_by_username(self, username):
+        self.lookups.append(username)
+        return {"displayName": f"Name {username}"}
+
+    def get(self, path, params=None):
+        assert path == "rest/api/user/bulk"
+        self.bulk_requests.append(list(params["accountId"]))
+        return {
+            "results": [
+                {"accountId": account_id, "displayName": f"Name {account_id}"}
+                for account_id in params["accountId"]
+                if not account_id.startswith("gone")
+            ]
+        }
+
+
+def _mentions(*account_ids: str) -> str:
+    return "".join(
+        f'<ac:link><ri:user ri:account-id="{account_id}"/></ac:link> '
+        for account_id in account_ids
+    )
+
+
+def test_user_mentions_are_resolved_once_and_cached():
+    """Test that repeated mentions share one lookup, also across documents."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    html, _ = preprocessor.process_html_content(_mentions("a1", "a2", "a1", "a1"))
+    assert html.count("@Name a1") == 3
+    assert sorted(client.lookups) == ["a1", "a2"]
+
+    preprocessor.process_html_content(_mentions("a2", "a1"))
+    assert sorted(client.lookups) == ["a1", "a2"]
+
+
+def test_unknown_users_are_negatively_cached():
+    """Test that a failed lookup falls back and is not retried right away."""
+    client = CountingConfluenceClient()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    for _ in range(2):
+        html, _ = preprocessor.process_html_content(_mentions("gone1", "gone1"))
+        assert html.count("@user_gone1") == 2
+
+    assert client.lookups == ["gone1"]
+
+
+def test_user_mentions_use_bulk_lookup_on_cloud():
+    """Test that Cloud resolves all mentioned users with one bulk request."""
+    client = CountingConfluenceClient(cloud=True)
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+    profile_macro = (
+        '<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+        '<ri:user ri:account-id="a3" /></ac:parameter></ac:structured-macro>'
+    )
+
+    html, _ = preprocessor.process_html_content(
+        _mentions("a1", "a2", "gone1", "a1") + profile_macro
+    )
+
+    assert client.bulk_requests == [["a1", "a2", "gone1", "a3"]]
+    assert client.lookups == []
+    assert "@Name a1" in html
+    assert "@Name a3" in html
+    assert "@user_gone1" in html
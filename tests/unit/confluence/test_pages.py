@@ -1,11 +1,15 @@
 """Unit tests for the PagesMixin class."""
 
+import os
 from unittest.mock import patch
 
 import pytest
+from atlassian.errors import ApiError
+from fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
 
 from mcp_atlassian.confluence.pages import PagesMixin
 from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.utils.cache import clear_shared_caches
 
 
 class TestPagesMixin:
@@ -66,6 +70,72 @@ class TestPagesMixin:
         assert result.attachments[0].id is not None
         assert result.attachments[1].id is not None
 
+    def test_get_page_content_reuses_conversion(self, pages_mixin):
+        """Test that a recently read page is served without a request."""
+        first = pages_mixin.get_page_content("987654321")
+        second = pages_mixin.get_page_content("987654321")
+
+        pages_mixin.confluence.get_page_by_id.assert_called_once()
+        pages_mixin.preprocessor.process_html_content.assert_called_once()
+        assert second.content == first.content == "Processed Markdown"
+        assert second.version.number == 1
+        assert len(second.attachments) == 2
+
+        # Each output format is converted and cached separately
+        html = pages_mixin.get_page_content("987654321", convert_to_markdown=False)
+        assert html.content == "<p>Processed HTML</p>"
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_content_revalidates_version(self, pages_mixin):
+        """Test that stale entries are checked without fetching the body."""
+        page = MOCK_PAGE_RESPONSE
+        edited_page = {**page, "version": {**page["version"], "number": 2}}
+        pages_mixin.confluence.get_page_by_id.side_effect = [
+            page,
+            page,  # version check: unchanged
+            edited_page,  # version check: edited
+            edited_page,
+        ]
+        with patch.dict(os.environ, {"CONFLUENCE_PAGE_CACHE_FRESHNESS": "0"}):
+            pages_mixin.get_page_content("987654321")
+            pages_mixin.get_page_content("987654321")
+            pages_mixin.preprocessor.process_html_content.assert_called_once()
+
+            result = pages_mixin.get_page_content("987654321")
+
+        assert result.version.number == 2
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+        expands = [
+            call.kwargs["expand"]
+            for call in pages_mixin.confluence.get_page_by_id.call_args_list
+        ]
+        assert expands == [
+            "body.storage,version,space,children.attachment",
+            "version,space,children.attachment",
+            "version,space,children.attachment",
+            "body.storage,version,space,children.attachment",
+        ]
+
+    def test_get_page_content_after_update(self, pages_mixin):
+        """Test that updating a page drops its cached conversion."""
+        pages_mixin.get_page_content("987654321")
+        pages_mixin.update_page("987654321", "Title", "<p>New</p>", is_markdown=False)
+
+        assert pages_mixin.confluence.get_page_by_id.call_count == 2
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_content_persisted_conversion(self, pages_mixin, tmp_path):
+        """Test that conversions can be reused from disk snapshots."""
+        env = {"MCP_CACHE_DIR": str(tmp_path), "CONFLUENCE_PAGE_CACHE_PERSIST": "true"}
+        with patch.dict(os.environ, env):
+            pages_mixin.get_page_content("987654321")
+            clear_shared_caches()
+            result = pages_mixin.get_page_content("987654321")
+
+        assert result.content == "Processed Markdown"
+        assert pages_mixin.confluence.get_page_by_id.call_count == 2
+        pages_mixin.preprocessor.process_html_content.assert_called_once()
+
     def test_get_page_ancestors(self, pages_mixin):
         """Test getting page ancestors (parent pages)."""
         # Arrange
@@ -199,6 +269,7 @@ class TestPagesMixin:
         pages_mixin.confluence.get_all_spaces.return_value = {
             "results": [{"key": "OTHER"}, {"key": "TEST"}]
         }
+        pages_mixin.confluence.get_space.side_effect = ApiError("No space")
 
         # Act
         result = pages_mixin.get_page_by_title("NONEXISTENT", "Page Title")
@@ -208,6 +279,23 @@ class TestPagesMixin:
         pages_mixin.confluence.get_all_spaces.assert_called_once()
         pages_mixin.confluence.get_page_by_title.assert_not_called()
 
+    def test_get_page_by_title_reuses_space_index(self, pages_mixin):
+        """Test that the space index is shared between lookups."""
+        pages_mixin.confluence.get_all_spaces.return_value = {
+            "results": [{"key": "PROJ"}]
+        }
+        pages_mixin.confluence.get_page_by_title.return_value = None
+        pages_mixin.confluence.get_space.side_effect = ApiError("No space")
+
+        pages_mixin.get_page_by_title("PROJ", "First")
+        pages_mixin.get_page_by_title("PROJ", "Second")
+        pages_mixin.get_page_by_title("OTHER", "Third")
+
+        pages_mixin.confluence.get_all_spaces.assert_called_once_with(
+            start=0, limit=500
+        )
+        assert pages_mixin.confluence.get_page_by_title.call_count == 2
+
     def test_get_page_by_title_page_not_found(self, pages_mixin):
         """Test getting a page that doesn't exist."""
         # Arrange
@@ -470,7 +558,7 @@ class TestPagesMixin:
         assert len(results) == 1
         assert results[0].content == "Processed Markdown"
         pages_mixin.preprocessor.process_html_content.assert_called_once_with(
-            "<p>This is some content</p>", space_key="DEMO"
+            "<p>This is some content</p>", space_key="DEMO", output_format="markdown"
         )
 
     def test_get_page_children_empty(self, pages_mixin):
@@ -40,7 +40,7 @@ class TestSearchMixin:
                         "space": {"key": "SPACE", "name": "Test Space"},
                         "version": {"number": 1},
                     },
-                    "excerpt": "Test content excerpt",
+                    "excerpt": "<b>Test</b> content excerpt",
                     "url": "https://confluence.example.com/pages/123456789",
                 }
             ]
@@ -64,6 +64,44 @@ class TestSearchMixin:
         assert result[0].title == "Test Page"
         assert result[0].content == "Processed content"
 
+    def test_search_excerpt_processing(self, search_mixin):
+        """Test that plain excerpts are kept and HTML excerpts converted once."""
+
+        def result_item(content_id: str, excerpt: str) -> dict:
+            return {
+                "content": {
+                    "id": content_id,
+                    "title": f"Page {content_id}",
+                    "type": "page",
+                    "space": {"key": "SPACE", "name": "Test Space"},
+                },
+                "excerpt": excerpt,
+            }
+
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                result_item("1", "Plain excerpt"),
+                result_item("2", "<b>Shared</b> excerpt"),
+                result_item("3", "<b>Shared</b> excerpt"),
+                result_item("4", "snake_case needs escaping"),
+                result_item("1", "<b>Duplicate result</b>"),
+            ]
+        }
+        search_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key, output_format: ("", f"md:{html}")
+        )
+
+        result = search_mixin.search("test query")
+
+        assert [page.content for page in result] == [
+            "Plain excerpt",
+            "md:<b>Shared</b> excerpt",
+            "md:<b>Shared</b> excerpt",
+            "md:snake_case needs escaping",
+            "Plain excerpt",
+        ]
+        assert search_mixin.preprocessor.process_html_content.call_count == 2
+
     def test_search_with_empty_results(self, search_mixin):
         """Test handling of empty search results."""
         # Mock an empty result set
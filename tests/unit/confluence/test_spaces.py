@@ -1,12 +1,18 @@
 """Unit tests for the SpacesMixin class."""
 
+import os
 from unittest.mock import patch
 
 import pytest
 import requests
+from atlassian.errors import ApiError
 from fixtures.confluence_mocks import MOCK_SPACES_RESPONSE
 
-from mcp_atlassian.confluence.spaces import SpacesMixin
+from mcp_atlassian.confluence.spaces import (
+    SPACE_INDEX_PAGE_SIZE,
+    SpacesMixin,
+    get_space_index,
+)
 
 
 class TestSpacesMixin:
@@ -165,3 +171,83 @@ class TestSpacesMixin:
 
         # Assert
         assert result == {}
+
+    @staticmethod
+    def _space_pages(total: int):
+        """Serve `total` spaces in pages of SPACE_INDEX_PAGE_SIZE, like the API."""
+
+        def get_all_spaces(start, limit):
+            keys = [f"S{n}" for n in range(start, min(start + limit, total))]
+            links = (
+                {"next": "/rest/api/space?start=..."} if start + limit < total else {}
+            )
+            return {"results": [{"key": key} for key in keys], "_links": links}
+
+        return get_all_spaces
+
+    def test_space_exists_pages_through_all_spaces(self, spaces_mixin):
+        """Test that the space index covers spaces beyond the first page."""
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(
+            2 * SPACE_INDEX_PAGE_SIZE + 1
+        )
+
+        spaces_mixin.confluence.get_space.side_effect = ApiError("No space")
+
+        assert spaces_mixin.space_exists(f"S{2 * SPACE_INDEX_PAGE_SIZE}")
+        assert spaces_mixin.space_exists("S0")
+        assert not spaces_mixin.space_exists("MISSING")
+        assert spaces_mixin.confluence.get_all_spaces.call_count == 3
+        spaces_mixin.confluence.get_space.assert_called_once_with(
+            "MISSING", expand=None
+        )
+
+    def test_space_exists_confirms_spaces_missing_from_index(self, spaces_mixin):
+        """Test that a space created after the index was built is found."""
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(1)
+        spaces_mixin.confluence.get_space.return_value = {"key": "NEW"}
+
+        assert spaces_mixin.space_exists("NEW")
+        index = get_space_index(spaces_mixin.confluence, spaces_mixin.config)
+        assert index.age() >= 900
+
+    def test_space_exists_without_index(self, spaces_mixin):
+        """Test that a TTL of 0 checks each space with a single request."""
+        spaces_mixin.confluence.get_space.side_effect = [
+            {"key": "S0"},
+            ApiError("No space"),
+        ]
+
+        with patch.dict(os.environ, {"CONFLUENCE_SPACE_CACHE_TTL": "0"}):
+            assert spaces_mixin.space_exists("S0")
+            assert not spaces_mixin.space_exists("MISSING")
+
+        spaces_mixin.confluence.get_all_spaces.assert_not_called()
+        assert spaces_mixin.confluence.get_space.call_count == 2
+
+    def test_space_index_is_shared_per_credentials(self, spaces_mixin):
+        """Test that users with other credentials get their own space index."""
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(1)
+        index = get_space_index(spaces_mixin.confluence, spaces_mixin.config)
+
+        assert get_space_index(spaces_mixin.confluence, spaces_mixin.config) is index
+        spaces_mixin.config.personal_token = "other-user-token"
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(2)
+        other = get_space_index(spaces_mixin.confluence, spaces_mixin.config)
+
+        assert other is not index
+        assert "S1" in other
+        assert "S1" not in index
+
+    def test_space_index_refreshes_in_background(self, spaces_mixin):
+        """Test that a stale index keeps answering while it is rebuilt."""
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(1)
+        spaces_mixin.confluence.get_space.side_effect = ApiError("No space")
+        index = get_space_index(spaces_mixin.confluence, spaces_mixin.config)
+        index.built_at -= 3600
+
+        spaces_mixin.confluence.get_all_spaces.side_effect = self._space_pages(2)
+        with patch.dict(os.environ, {"MCP_FANOUT_THREADS": "0"}):
+            assert not spaces_mixin.space_exists("S1")
+
+        assert spaces_mixin.space_exists("S1")
+        assert spaces_mixin.confluence.get_all_spaces.call_count == 2
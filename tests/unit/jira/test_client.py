@@ -1,6 +1,7 @@
 """Tests for the Jira client module."""
 
 import os
+import time
 from copy import deepcopy
 from typing import Literal
 from unittest.mock import MagicMock, call, patch
@@ -289,3 +290,34 @@ def test_init_no_proxies(monkeypatch):
     )
     client = JiraClient(config=config)
     assert mock_session.proxies == {}
+
+
+def test_iter_paged_prefetches_next_page():
+    """Test that iter_paged requests the next page before it is consumed."""
+    with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
+        client = JiraClient(
+            config=JiraConfig(
+                url="https://test.atlassian.net",
+                auth_type="basic",
+                username="test_username",
+                api_token="test_token",
+            )
+        )
+    client.jira = MagicMock()
+    client.jira.get.side_effect = [
+        {"data": "page1", "nextPageToken": "token1"},
+        {"data": "page2", "nextPageToken": "token2"},
+        {"data": "page3"},
+    ]
+
+    pages = client.iter_paged("get", "/test/url", {"initial": "params"})
+    assert next(pages) == {"data": "page1", "nextPageToken": "token1"}
+    # The second page is already in flight while the first one is processed
+    for _ in range(100):
+        if client.jira.get.call_count == 2:
+            break
+        time.sleep(0.01)
+    assert client.jira.get.call_count == 2
+
+    assert [page["data"] for page in pages] == ["page2", "page3"]
+    assert client.jira.get.call_count == 3
@@ -1,7 +1,9 @@
 """Tests for the Jira Fields mixin."""
 
+import dataclasses
+import os
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -540,3 +542,96 @@ class TestFieldsMixin:
 
         # Verify empty list is returned on error
         assert result == []
+
+
+class TestSharedFieldCatalog:
+    """Tests for the field catalog shared between fetcher instances."""
+
+    @pytest.fixture
+    def make_fetcher(self, mock_config, mock_atlassian_jira):
+        """Build independent JiraFetcher instances sharing one mocked API."""
+
+        def factory(**config_overrides: Any) -> JiraFetcher:
+            config = dataclasses.replace(mock_config, **config_overrides)
+            with patch("atlassian.Jira", return_value=mock_atlassian_jira):
+                fetcher = JiraFetcher(config=config)
+            fetcher.jira = mock_atlassian_jira
+            return fetcher
+
+        return factory
+
+    def test_fields_shared_across_instances(self, make_fetcher, mock_atlassian_jira):
+        """Test that a second fetcher for the same site reuses the catalog."""
+        first, second = make_fetcher(), make_fetcher(api_token="other_token")
+
+        assert first.get_field_id("Summary") == "summary"
+        assert second.get_field_by_id("summary")["name"] == "Summary"
+        assert second.get_fields() is first.get_fields()
+        mock_atlassian_jira.get_all_fields.assert_called_once()
+
+    def test_fields_per_user_scope(self, make_fetcher, mock_atlassian_jira):
+        """Test that JIRA_FIELD_CACHE_PER_USER separates catalogs by credentials."""
+        with patch.dict(os.environ, {"JIRA_FIELD_CACHE_PER_USER": "true"}):
+            make_fetcher().get_fields()
+            make_fetcher().get_fields()
+            make_fetcher(api_token="other_token").get_fields()
+
+        assert mock_atlassian_jira.get_all_fields.call_count == 2
+
+    def test_refresh_and_invalidate(self, make_fetcher, mock_atlassian_jira):
+        """Test that refresh replaces the shared entry and invalidation drops it."""
+        first = make_fetcher()
+        first.get_fields()
+        first.get_fields(refresh=True)
+        make_fetcher().get_fields()
+        assert mock_atlassian_jira.get_all_fields.call_count == 2
+
+        first.invalidate_field_cache()
+        make_fetcher().get_fields()
+        assert mock_atlassian_jira.get_all_fields.call_count == 3
+
+    def test_cache_disabled_with_zero_ttl(self, make_fetcher, mock_atlassian_jira):
+        """Test that JIRA_FIELD_CACHE_TTL=0 keeps field caching per instance."""
+        with patch.dict(os.environ, {"JIRA_FIELD_CACHE_TTL": "0"}):
+            make_fetcher().get_fields()
+            make_fetcher().get_fields()
+
+        assert mock_atlassian_jira.get_all_fields.call_count == 2
+
+    @pytest.mark.parametrize("ttl", ["0", "120"])
+    def test_cache_settings_read_after_import(self, ttl):
+        """Test that cache settings from a .env loaded after import apply."""
+        from mcp_atlassian.jira.fields import _field_catalogs
+
+        with patch.dict(os.environ, {"JIRA_FIELD_CACHE_TTL": ttl}):
+            assert _field_catalogs.ttl == int(ttl)
+
+    def test_snapshot_warm_start(self, make_fetcher, mock_atlassian_jira, tmp_path):
+        """Test that a snapshot in MCP_CACHE_DIR serves fields after a restart."""
+        with patch.dict(os.environ, {"MCP_CACHE_DIR": str(tmp_path)}):
+            make_fetcher().get_fields()
+            # Simulate a restart: the in-memory catalog is gone
+            from mcp_atlassian.jira.fields import _field_catalogs
+
+            _field_catalogs.clear()
+            fetcher = make_fetcher()
+            assert fetcher.get_field_id("Fix Version/s") == "fixVersions"
+
+        mock_atlassian_jira.get_all_fields.assert_called_once()
+
+    def test_epic_fields_resolved_once(self, make_fetcher):
+        """Test that Epic field discovery is memoized on the shared catalog."""
+        first, second = make_fetcher(), make_fetcher()
+        first._try_discover_fields_from_existing_epic = MagicMock()
+        second._try_discover_fields_from_existing_epic = MagicMock()
+
+        first_ids = first.get_field_ids_to_epic()
+        first_ids["mutated"] = "x"
+        second_ids = second.get_field_ids_to_epic()
+
+        assert "mutated" not in second_ids
+        calls = (
+            first._try_discover_fields_from_existing_epic.call_count
+            + second._try_discover_fields_from_existing_epic.call_count
+        )
+        assert calls <= 1
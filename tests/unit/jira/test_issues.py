@@ -3,10 +3,12 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+import requests
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
 from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.models.jira.record import RecordInterner
 
 
 class TestIssuesMixin:
@@ -179,9 +181,9 @@ class TestIssuesMixin:
             issues_mixin.jira.get_issue.assert_any_call(
                 "EPIC-456",
                 expand=None,
-                fields=None,
+                fields="summary,status,customfield_10011",
                 properties=None,
-                update_history=True,
+                update_history=False,
             )
 
             # Verify the issue
@@ -195,6 +197,71 @@ class TestIssuesMixin:
         except Exception as e:
             pytest.fail(f"Test failed: {e}")
 
+    def test_get_issue_reuses_cached_epic(self, issues_mixin: IssuesMixin):
+        """Test that epic details are shared between issue fetches."""
+        issues = {
+            key: {
+                "id": key.split("-")[1],
+                "key": key,
+                "fields": {
+                    "summary": key,
+                    "issuetype": {"name": "Story"},
+                    "customfield_10010": "EPIC-456",
+                },
+            }
+            for key in ("TEST-1", "TEST-2")
+        }
+        issues["EPIC-456"] = self._search_hit(
+            "EPIC-456", customfield_10011="Epic Name Value"
+        )
+        issues_mixin.jira.get_issue.side_effect = lambda key, **kwargs: issues[key]
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={
+                "epic_link": "customfield_10010",
+                "epic_name": "customfield_10011",
+            }
+        )
+
+        first = issues_mixin.get_issue("TEST-1", comment_limit=0)
+        second = issues_mixin.get_issue("TEST-2", comment_limit=0)
+
+        assert first.epic_name == second.epic_name == "Epic Name Value"
+        fetched = [c.args[0] for c in issues_mixin.jira.get_issue.call_args_list]
+        assert fetched == ["TEST-1", "EPIC-456", "TEST-2"]
+
+    def test_resolve_epics_batches_and_memoizes(self, issues_mixin: IssuesMixin):
+        """Test that several epics are fetched with one search and memoized."""
+        field_ids = {"epic_link": "customfield_10010", "epic_name": "customfield_10011"}
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit(
+                "EPIC-1", customfield_10011="One", status={"name": "Done"}
+            ),
+            self._search_hit("EPIC-2", customfield_10011="Two"),
+        ]
+        memo = {"EPIC-3": {"name": "Three", "summary": "EPIC-3", "status": None}}
+
+        epics = issues_mixin._resolve_epics(
+            ["EPIC-1", "epic-2", "EPIC-1", "EPIC-3"], field_ids, memo
+        )
+
+        assert epics["EPIC-1"] == {"name": "One", "summary": "EPIC-1", "status": "Done"}
+        assert epics["EPIC-2"]["name"] == "Two"
+        assert epics["EPIC-3"]["name"] == "Three"
+        assert set(memo) == {"EPIC-1", "EPIC-2", "EPIC-3"}
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once_with(
+            "key in (EPIC-1, epic-2)",
+            fields="summary,status,customfield_10011",
+            limit=2,
+            expand=None,
+        )
+
+        # A second request is served from the shared cache
+        assert issues_mixin._resolve_epics(["EPIC-2"], field_ids) == {
+            "EPIC-2": epics["EPIC-2"]
+        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once()
+        issues_mixin.jira.get_issue.assert_not_called()
+
     def test_get_issue_error_handling(self, issues_mixin: IssuesMixin):
         """Test error handling in get_issue."""
         # Mock the API to raise an exception
@@ -223,6 +290,187 @@ class TestIssuesMixin:
         # Test with invalid string
         assert issues_mixin._normalize_comment_limit("invalid") == 10
 
+    @staticmethod
+    def _search_hit(key: str, **fields) -> dict:
+        return {
+            "id": key.split("-")[1],
+            "key": key,
+            "fields": {"summary": key, **fields},
+        }
+
+    def test_batch_get_issues_chunks_and_orders(self, issues_mixin: IssuesMixin):
+        """Test that keys are fetched with chunked searches and returned in order."""
+        keys = [f"TEST-{n}" for n in range(1, 151)]
+
+        def search(jql, fields, limit, expand):
+            requested = jql.removeprefix("key in (").removesuffix(")").split(", ")
+            # Return the hits out of order and skip a missing key
+            return [
+                self._search_hit(key) for key in reversed(requested) if key != "TEST-7"
+            ]
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = search
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_get_issues(keys + ["TEST-1"])
+
+        assert [issue.key for issue in result] == [k for k in keys if k != "TEST-7"]
+        limits = sorted(
+            call.kwargs["limit"]
+            for call in issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_args_list
+        )
+        assert limits == [50, 100]
+        issues_mixin.jira.get_issue.assert_not_called()
+        issues_mixin.jira.issue_get_comments.assert_not_called()
+
+    def test_batch_get_issues_comments(self, issues_mixin: IssuesMixin):
+        """Test that embedded comments are used and only incomplete ones fetched."""
+        comment = {"id": "1", "body": "Comment", "author": {"displayName": "User"}}
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit("TEST-1", comment={"comments": [comment] * 3, "total": 3}),
+            self._search_hit(
+                "TEST-2", comment={"comments": [comment] * 2, "total": 20}
+            ),
+        ]
+        issues_mixin.jira.issue_get_comments.return_value = {"comments": [comment] * 20}
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_get_issues(
+            ["TEST-1", "TEST-2"], fields="summary,comment", comment_limit=5
+        )
+
+        assert [len(issue.comments) for issue in result] == [3, 5]
+        issues_mixin.jira.issue_get_comments.assert_called_once_with("TEST-2")
+
+    def test_batch_get_issues_epics_in_one_search(self, issues_mixin: IssuesMixin):
+        """Test that linked epics are resolved with a single extra search."""
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={
+                "epic_link": "customfield_10014",
+                "epic_name": "customfield_10011",
+            }
+        )
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = [
+            [
+                self._search_hit("TEST-1", customfield_10014="EPIC-1"),
+                self._search_hit("TEST-2", customfield_10014="EPIC-1"),
+                self._search_hit("TEST-3", customfield_10014="EPIC-2"),
+            ],
+            [
+                self._search_hit("EPIC-1", customfield_10011="Epic One"),
+                self._search_hit("EPIC-2", customfield_10011="Epic Two"),
+            ],
+        ]
+
+        result = issues_mixin.batch_get_issues(
+            ["TEST-1", "TEST-2", "TEST-3"], fields="*all"
+        )
+
+        assert [issue.epic_name for issue in result] == [
+            "Epic One",
+            "Epic One",
+            "Epic Two",
+        ]
+        assert issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_count == 2
+        epic_search = issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_args
+        assert epic_search.args[0] == "key in (EPIC-1, EPIC-2)"
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_batch_get_issues_falls_back_on_rejected_search(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that a rejected key search falls back to single reads."""
+
+        def get_issue(key, **kwargs):
+            if key != "TEST-1":
+                raise requests.HTTPError(response=MagicMock(status_code=404))
+            return self._search_hit(key)
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = (
+            requests.HTTPError(response=MagicMock(status_code=400))
+        )
+        issues_mixin.jira.get_issue.side_effect = get_issue
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_get_issues(["TEST-1", "TEST-404"])
+
+        assert [issue.key for issue in result] == ["TEST-1"]
+        assert issues_mixin.jira.get_issue.call_count == 2
+
+    def test_batch_get_issues_by_numeric_id(self, issues_mixin: IssuesMixin):
+        """Test that issues requested by numeric ID are matched by their ID."""
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "10001", "key": "PROJ-1", "fields": {"summary": "By ID"}},
+            self._search_hit("TEST-2"),
+        ]
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_get_issues(["10001", "TEST-2"])
+
+        assert [issue.key for issue in result] == ["PROJ-1", "TEST-2"]
+
+    def test_batch_get_issues_moved_key(self, issues_mixin: IssuesMixin):
+        """Test that the old key of a moved issue is matched to its new key."""
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit("TEST-1"),
+            self._search_hit("NEW-5"),
+        ]
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_get_issues(["OLD-1", "TEST-1"])
+
+        assert [issue.key for issue in result] == ["NEW-5", "TEST-1"]
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_batch_get_issues_moved_keys_in_search_order(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that several moved keys are attributed with single reads."""
+        moved = {"OLD-1": "NEW-1", "OLD-2": "NEW-2"}
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit("NEW-2"),
+            self._search_hit("NEW-1"),
+        ]
+        issues_mixin.jira.get_issue.side_effect = lambda key, **kwargs: (
+            self._search_hit(moved[key])
+        )
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        not_found: list = []
+
+        result = issues_mixin.batch_get_issues(["OLD-1", "OLD-2"], not_found=not_found)
+
+        assert [issue.key for issue in result] == ["NEW-1", "NEW-2"]
+        assert not_found == []
+
+    def test_batch_get_issues_bad_key_before_moved_key(self, issues_mixin: IssuesMixin):
+        """Test that a missing key is not mistaken for a moved one."""
+
+        def get_issue(key, **kwargs):
+            if key == "BAD-1":
+                raise requests.HTTPError(response=MagicMock(status_code=404))
+            return self._search_hit("NEW-5")
+
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit("NEW-5"),
+            self._search_hit("TEST-1"),
+        ]
+        issues_mixin.jira.get_issue.side_effect = get_issue
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        not_found: list = []
+
+        result = issues_mixin.batch_get_issues(
+            ["BAD-1", "OLD-1", "TEST-1"], not_found=not_found
+        )
+
+        assert [issue.key for issue in result] == ["NEW-5", "TEST-1"]
+        assert not_found == ["BAD-1"]
+
+    def test_batch_get_issues_rejects_malformed_keys(self, issues_mixin: IssuesMixin):
+        """Test that keys which could alter the JQL are rejected."""
+        with pytest.raises(ValueError, match="Invalid issue keys"):
+            issues_mixin.batch_get_issues(["TEST-1", "TEST-2) OR (project = X"])
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+
     def test_create_issue_basic(self, issues_mixin: IssuesMixin):
         """Test creating a basic issue."""
         # Mock create_issue response
@@ -267,6 +515,68 @@ class TestIssuesMixin:
         assert issue.key == "TEST-123"
         assert issue.summary == "Test Issue"
 
+    def test_create_issue_uses_create_metadata(self, issues_mixin: IssuesMixin):
+        """Test that issue fields are validated against cached create metadata."""
+        issues_mixin.jira.issue_createmeta.return_value = {
+            "projects": [
+                {
+                    "key": "TEST",
+                    "issuetypes": [
+                        {"id": "10001", "name": "Bug"},
+                        {"id": "10002", "name": "Task"},
+                    ],
+                }
+            ]
+        }
+        issues_mixin.jira.issue_createmeta_fieldtypes.return_value = {
+            "fields": [
+                {"fieldId": "summary", "required": True, "schema": {"type": "string"}},
+                {
+                    "fieldId": "reporter",
+                    "required": True,
+                    "hasDefaultValue": False,
+                    "schema": {"type": "user"},
+                },
+                {
+                    "fieldId": "customfield_10050",
+                    "name": "Severity",
+                    "required": True,
+                    "schema": {"type": "option"},
+                },
+            ]
+        }
+        issues_mixin.jira.create_issue.return_value = {"key": "TEST-123"}
+        issues_mixin.jira.get_issue.return_value = {"id": "1", "key": "TEST-123"}
+
+        issues_mixin.create_issue(
+            project_key="TEST",
+            summary="Test Issue",
+            issue_type="bug",
+            customfield_10050="High",
+        )
+        issues_mixin.jira.create_issue.assert_called_once_with(
+            fields={
+                "project": {"key": "TEST"},
+                "summary": "Test Issue",
+                "issuetype": {"id": "10001"},
+                "customfield_10050": {"value": "High"},
+            }
+        )
+
+        with pytest.raises(ValueError, match="Severity \\(customfield_10050\\)"):
+            issues_mixin.create_issue(
+                project_key="TEST", summary="Test Issue", issue_type="Bug"
+            )
+        with pytest.raises(ValueError, match="Available issue types: Bug, Task"):
+            issues_mixin.create_issue(
+                project_key="TEST", summary="Test Issue", issue_type="Story"
+            )
+
+        # Metadata was fetched once; invalid issues never reached Jira
+        issues_mixin.jira.issue_createmeta.assert_called_once()
+        issues_mixin.jira.issue_createmeta_fieldtypes.assert_called_once()
+        issues_mixin.jira.create_issue.assert_called_once()
+
     def test_create_issue_no_components(self, issues_mixin: IssuesMixin):
         """Test creating an issue with no components specified."""
         # Mock create_issue response
@@ -996,17 +1306,12 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue responses
-        def get_issue_side_effect(key):
-            if key == "TEST-1":
-                return {
-                    "id": "1",
-                    "key": "TEST-1",
-                    "fields": {"summary": "Test Issue 1"},
-                }
-            return {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}}
-
-        issues_mixin.jira.get_issue.side_effect = get_issue_side_effect
+        # Mock the search reading the created issues back
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}},
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}},
+        ]
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
         issues_mixin._get_account_id.return_value = "user123"
 
         # Call the method
@@ -1015,7 +1320,14 @@ class TestIssuesMixin:
         # Verify results
         assert len(result) == 2
         assert result[0].key == "TEST-1"
+        assert result[0].summary == "Test Issue 1"
         assert result[1].key == "TEST-2"
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once()
+        assert (
+            issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_args[0][0]
+            == "key in (TEST-1, TEST-2)"
+        )
+        issues_mixin.jira.get_issue.assert_not_called()
 
         # Verify bulk create was called correctly
         issues_mixin.jira.create_issues.assert_called_once()
@@ -1065,11 +1377,34 @@ class TestIssuesMixin:
             },
         ]
 
-        # Verify it raises ValueError
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"id": "2", "key": "TEST-2"}],
+            "errors": [],
+        }
+        failed: list = []
+
+        result = issues_mixin.batch_create_issues(issues, hydrate=False, failed=failed)
+
+        # The valid issue is created and the invalid one reported
+        assert [issue.key for issue in result] == ["TEST-2"]
+        assert len(failed) == 1
+        assert failed[0]["index"] == 0
+        assert failed[0]["summary"] == "Test Issue 1"
+        assert "Missing required fields" in failed[0]["error"]
+
+    def test_batch_create_issues_none_prepared(self, issues_mixin: IssuesMixin):
+        """Test that batch_create_issues raises when no issue can be prepared."""
+        issues = [
+            {"project_key": "TEST", "summary": "Test Issue 1"},
+            {"project_key": "TEST", "issue_type": "Bug"},
+        ]
+        failed: list = []
+
         with pytest.raises(ValueError) as exc_info:
-            issues_mixin.batch_create_issues(issues)
+            issues_mixin.batch_create_issues(issues, failed=failed)
 
         assert "Missing required fields" in str(exc_info.value)
+        assert [entry["index"] for entry in failed] == [0, 1]
         assert not issues_mixin.jira.create_issues.called
 
     def test_batch_create_issues_partial_failure(self, issues_mixin: IssuesMixin):
@@ -1097,12 +1432,11 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue response for successful creation
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
-        }
+        # Mock the search reading the created issue back
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+        ]
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
 
         # Call the method
         result = issues_mixin.batch_create_issues(issues)
@@ -1113,7 +1447,138 @@ class TestIssuesMixin:
 
         # Verify error was logged
         issues_mixin.jira.create_issues.assert_called_once()
-        assert len(issues_mixin.jira.get_issue.mock_calls) == 1
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_called_once()
+
+    def test_batch_create_issues_in_chunks(self, issues_mixin: IssuesMixin):
+        """Test that large batches are created in chunks and read back in bulk."""
+        issues = [
+            {"project_key": "TEST", "summary": f"Issue {n}", "issue_type": "Task"}
+            for n in range(1, 121)
+        ]
+
+        def create_issues(issue_updates):
+            return {
+                "issues": [
+                    {"id": summary.split()[1], "key": f"TEST-{summary.split()[1]}"}
+                    for summary in (u["fields"]["summary"] for u in issue_updates)
+                ],
+                "errors": [],
+            }
+
+        def search(jql, fields, limit, expand):
+            requested = jql.removeprefix("key in (").removesuffix(")").split(", ")
+            return [self._search_hit(key) for key in requested]
+
+        issues_mixin.jira.create_issues.side_effect = create_issues
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = search
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_create_issues(issues)
+
+        assert [issue.key for issue in result] == [f"TEST-{n}" for n in range(1, 121)]
+        assert sorted(
+            len(call.args[0]) for call in issues_mixin.jira.create_issues.call_args_list
+        ) == [20, 50, 50]
+        assert issues_mixin.jira.enhanced_jql_get_list_of_tickets.call_count == 2
+        issues_mixin.jira.get_issue.assert_not_called()
+
+    def test_batch_create_issues_reports_failures(self, issues_mixin: IssuesMixin):
+        """Test that rejected issues and failed chunks are reported in failed."""
+        issues = [
+            {"project_key": "TEST", "summary": f"Issue {n}", "issue_type": "Task"}
+            for n in range(60)
+        ]
+
+        def create_issues(issue_updates):
+            if len(issue_updates) < 50:
+                raise Exception("Service unavailable")
+            return {
+                "issues": [
+                    {"id": str(n), "key": f"TEST-{n}"} for n in range(50) if n != 3
+                ],
+                "errors": [
+                    {
+                        "status": 400,
+                        "elementErrors": {
+                            "errorMessages": [],
+                            "errors": {"issuetype": "Invalid issue type"},
+                        },
+                        "failedElementNumber": 3,
+                    }
+                ],
+            }
+
+        issues_mixin.jira.create_issues.side_effect = create_issues
+        failed: list = []
+
+        result = issues_mixin.batch_create_issues(issues, hydrate=False, failed=failed)
+
+        assert len(result) == 49
+        assert failed[0] == {
+            "index": 3,
+            "summary": "Issue 3",
+            "error": "issuetype: Invalid issue type",
+        }
+        assert [entry["index"] for entry in failed[1:]] == list(range(50, 60))
+        assert failed[1]["summary"] == "Issue 50"
+        assert failed[1]["error"] == "Service unavailable"
+
+    def test_batch_create_issues_reads_unindexed_issues(
+        self, issues_mixin: IssuesMixin, caplog
+    ):
+        """Test that issues missing from the search are read back one by one."""
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [
+                {"id": "1", "key": "TEST-1"},
+                {"id": "2", "key": "TEST-2"},
+                {"id": "3", "key": "TEST-3"},
+            ],
+            "errors": [],
+        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            self._search_hit("TEST-1")
+        ]
+
+        def get_issue(key):
+            if key == "TEST-3":
+                raise requests.HTTPError(response=MagicMock(status_code=404))
+            return self._search_hit(key)
+
+        issues_mixin.jira.get_issue.side_effect = get_issue
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+
+        result = issues_mixin.batch_create_issues(
+            [
+                {"project_key": "TEST", "summary": f"Issue {n}", "issue_type": "Task"}
+                for n in range(1, 4)
+            ]
+        )
+
+        assert [(issue.key, issue.summary) for issue in result] == [
+            ("TEST-1", "TEST-1"),
+            ("TEST-2", "TEST-2"),
+            ("TEST-3", ""),
+        ]
+        assert sorted(
+            call.args[0] for call in issues_mixin.jira.get_issue.call_args_list
+        ) == ["TEST-2", "TEST-3"]
+        assert "Could not read created issue TEST-3 back" in caplog.text
+
+    def test_batch_create_issues_without_hydration(self, issues_mixin: IssuesMixin):
+        """Test that created issues are not read back when hydrate is False."""
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"id": "1", "key": "TEST-1"}],
+            "errors": [],
+        }
+
+        result = issues_mixin.batch_create_issues(
+            [{"project_key": "TEST", "summary": "Issue", "issue_type": "Task"}],
+            hydrate=False,
+        )
+
+        assert [(issue.id, issue.key) for issue in result] == [("1", "TEST-1")]
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+        issues_mixin.jira.get_issue.assert_not_called()
 
     def test_batch_create_issues_empty_list(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with an empty list."""
@@ -1141,11 +1606,10 @@ class TestIssuesMixin:
             "errors": [],
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
-        }
+        issues_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = [
+            {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+        ]
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
 
         # Call the method
         result = issues_mixin.batch_create_issues(issues)
@@ -1411,8 +1875,8 @@ class TestIssuesMixin:
             },
         ]
 
-        # Mock the get_paged method
-        issues_mixin.get_paged = MagicMock(return_value=mock_get_paged_result)
+        # Mock the iter_paged method
+        issues_mixin.iter_paged = MagicMock(return_value=iter(mock_get_paged_result))
 
         # Call the method
         result = issues_mixin.batch_get_changelogs(
@@ -1425,15 +1889,101 @@ class TestIssuesMixin:
         assert simplified_result == expected_result
 
         # Verify the method was called with the correct arguments
-        issues_mixin.get_paged.assert_called_once_with(
-            method="post",
-            url=issues_mixin.jira.resource_url("changelog/bulkfetch"),
+        issues_mixin.iter_paged.assert_called_once_with(
+            "post",
+            issues_mixin.jira.resource_url("changelog/bulkfetch"),
             params_or_json={
                 "fieldIds": ["Parent"],
                 "issueIdsOrKeys": ["TEST-1", "TEST-2"],
             },
         )
 
+    def test_batch_get_changelog_records(self, issues_mixin: IssuesMixin):
+        """Test that changelog records match the models and share values."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        author = {"accountId": "user123", "displayName": "Test User"}
+
+        def history(number: int) -> dict:
+            return {
+                "id": str(number),
+                "author": dict(author),
+                "created": f"2024-01-0{number}T10:00:00.000+0000",
+                "items": [{"field": "status", "toString": "Done"}],
+            }
+
+        pages = [
+            {
+                "issueChangeLogs": [
+                    {"issueId": "1", "changeHistories": [history(1), history(2)]},
+                    {"issueId": "2", "changeHistories": [history(3)]},
+                ]
+            },
+            {"issueChangeLogs": [{"issueId": "1", "changeHistories": [history(4)]}]},
+        ]
+        issues_mixin.iter_paged = MagicMock(side_effect=lambda *a, **k: iter(pages))
+
+        models = issues_mixin.batch_get_changelogs(["TEST-1", "TEST-2"])
+        records = issues_mixin.batch_get_changelog_records(["TEST-1", "TEST-2"])
+
+        assert [record.id for record in records] == ["1", "2"]
+        for record, model in zip(records, models, strict=True):
+            assert record["changelogs"] == [
+                changelog.to_simplified_dict() for changelog in model.changelogs
+            ]
+        first, second = records[0]._values[1][0], records[1]._values[1][0]
+        assert (
+            first._values[first._keys.index("author")]
+            is (second._values[second._keys.index("author")])
+        )
+
+        limited = issues_mixin.batch_get_changelog_records(["TEST-1"], limit=1)
+        assert [len(record["changelogs"]) for record in limited] == [1, 1]
+        assert limited[0]["changelogs"][0]["created"].startswith("2024-01-01")
+
+    def test_batch_get_changelog_records_reads_pages_lazily(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test that a page is only requested after the previous one is frozen."""
+        issues_mixin.config = MagicMock()
+        issues_mixin.config.is_cloud = True
+        interner = RecordInterner()
+        frozen: list = []
+        freeze = interner.freeze
+
+        def track_freeze(value):
+            frozen.append(value)
+            return freeze(value)
+
+        interner.freeze = track_freeze
+
+        def history(number: int) -> dict:
+            return {
+                "id": str(number),
+                "created": "2024-01-01T10:00:00.000+0000",
+                "items": [{"field": "status", "toString": "Done"}],
+            }
+
+        def pages():
+            yield {
+                "issueChangeLogs": [
+                    {"issueId": "1", "changeHistories": [history(1), history(2)]}
+                ]
+            }
+            # Both entries of the first page were frozen before this request
+            assert len(frozen) == 2
+            yield {
+                "issueChangeLogs": [{"issueId": "1", "changeHistories": [history(3)]}]
+            }
+
+        issues_mixin.iter_paged = MagicMock(return_value=pages())
+
+        records = issues_mixin.batch_get_changelog_records(
+            ["TEST-1"], interner=interner
+        )
+
+        assert [len(record["changelogs"]) for record in records] == [3]
+
     def test_create_issue_with_labels(self, issues_mixin: IssuesMixin):
         """Test creating an issue with labels in additional_fields."""
         # Mock create_issue response
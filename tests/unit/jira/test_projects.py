@@ -1,5 +1,6 @@
 """Tests for the Jira ProjectsMixin."""
 
+import os
 from typing import Any
 from unittest.mock import MagicMock, call, patch
 
@@ -346,6 +347,87 @@ def test_get_project_role_members_exception(projects_mixin: ProjectsMixin):
     projects_mixin.jira.get_project_actors_for_role_project.assert_called_once()
 
 
+def _role_actors(*users: tuple[str, str]) -> dict[str, list[dict[str, Any]]]:
+    return {
+        "actors": [
+            {
+                "type": "atlassian-user-role-actor",
+                "displayName": name,
+                "actorUser": {"accountId": account_id},
+            }
+            for account_id, name in users
+        ]
+        + [{"type": "atlassian-group-role-actor", "displayName": "jira-users"}]
+    }
+
+
+def test_get_project_members(projects_mixin: ProjectsMixin):
+    """Test that role members are aggregated, deduplicated and cached."""
+    base_url = "https://test.atlassian.net/rest/api/2/project/PROJ1/role"
+    projects_mixin.jira.get_project_roles.return_value = {
+        "Administrators": f"{base_url}/10002",
+        "Developers": f"{base_url}/10001",
+    }
+    actors = {
+        "10002": _role_actors(("a1", "Alice")),
+        "10001": _role_actors(("a2", "Bob"), ("a1", "Alice")),
+    }
+    projects_mixin.jira.get_project_actors_for_role_project.side_effect = (
+        lambda project_key, role_id: actors[role_id]
+    )
+
+    result = projects_mixin.get_project_members("PROJ1")
+
+    assert result == {
+        "members": [
+            {"displayName": "Alice", "accountId": "a1"},
+            {"displayName": "Bob", "accountId": "a2"},
+        ],
+        "failed_roles": [],
+    }
+    assert projects_mixin.get_project_members("proj1") == result
+    projects_mixin.jira.get_project_roles.assert_called_once_with(project_key="PROJ1")
+    assert projects_mixin.jira.get_project_actors_for_role_project.call_count == 2
+
+
+def test_get_project_members_cache_disabled_after_import(
+    projects_mixin: ProjectsMixin,
+):
+    """Test that JIRA_PROJECT_MEMBERS_CACHE_TTL=0 from a .env file disables the cache."""
+    projects_mixin.jira.get_project_roles.return_value = {}
+
+    with patch.dict(os.environ, {"JIRA_PROJECT_MEMBERS_CACHE_TTL": "0"}):
+        projects_mixin.get_project_members("PROJ1")
+        projects_mixin.get_project_members("PROJ1")
+
+    assert projects_mixin.jira.get_project_roles.call_count == 2
+
+
+def test_get_project_members_reports_failed_roles(projects_mixin: ProjectsMixin):
+    """Test that roles that cannot be read are reported and not cached."""
+    base_url = "https://test.atlassian.net/rest/api/2/project/PROJ1/role"
+    projects_mixin.jira.get_project_roles.return_value = {
+        "Administrators": f"{base_url}/10002",
+        "Developers": f"{base_url}/10001",
+    }
+
+    def get_actors(project_key: str, role_id: str) -> dict[str, Any]:
+        if role_id == "10002":
+            raise Exception("Forbidden")
+        return _role_actors(("a2", "Bob"))
+
+    projects_mixin.jira.get_project_actors_for_role_project.side_effect = get_actors
+
+    result = projects_mixin.get_project_members("PROJ1")
+
+    assert result["members"] == [{"displayName": "Bob", "accountId": "a2"}]
+    assert result["failed_roles"] == [
+        {"role": "Administrators", "role_id": "10002", "error": "Forbidden"}
+    ]
+    projects_mixin.get_project_members("PROJ1")
+    assert projects_mixin.jira.get_project_roles.call_count == 2
+
+
 def test_get_project_role_members_invalid_response(projects_mixin: ProjectsMixin):
     """Test get_project_role_members method with invalid response."""
     # Response without actors
@@ -425,6 +507,122 @@ def test_get_project_issue_types(
     projects_mixin.jira.issue_createmeta.assert_called_once_with(project="PROJ1")
 
 
+def test_get_project_createmeta_is_cached(
+    projects_mixin: ProjectsMixin, mock_issue_types: list[dict]
+):
+    """Test that create metadata is fetched once and shared."""
+    createmeta = {"projects": [{"key": "PROJ1", "issuetypes": mock_issue_types}]}
+    projects_mixin.jira.issue_createmeta.return_value = createmeta
+
+    assert projects_mixin.get_project_issue_types("PROJ1") == mock_issue_types
+    assert projects_mixin.get_project_createmeta("proj1") == createmeta
+    assert (
+        projects_mixin.get_project_createmeta(
+            "PROJ1", expand="projects.issuetypes.fields"
+        )
+        == createmeta
+    )
+    projects_mixin.jira.issue_createmeta.assert_called_once_with(project="PROJ1")
+
+    projects_mixin.jira.issue_createmeta_fieldtypes.return_value = {"fields": []}
+    projects_mixin.get_project_createmeta("PROJ1", expand="projects.issuetypes")
+    projects_mixin.get_issue_type_fields("PROJ1", "10001")
+    projects_mixin.get_issue_type_fields("PROJ1", "10001")
+    assert projects_mixin.jira.issue_createmeta.call_count == 2
+    projects_mixin.jira.issue_createmeta_fieldtypes.assert_called_once_with(
+        project="PROJ1", issue_type_id="10001"
+    )
+
+
+def test_get_project_createmeta_stale_while_revalidate(
+    projects_mixin: ProjectsMixin,
+):
+    """Test that stale metadata is served while it is refreshed."""
+    old_meta = {"projects": [{"key": "PROJ1", "issuetypes": []}]}
+    new_meta = {"projects": [{"key": "PROJ1", "issuetypes": [{"id": "1"}]}]}
+    projects_mixin.jira.issue_createmeta.side_effect = [old_meta, new_meta]
+
+    assert projects_mixin.get_project_createmeta("PROJ1") == old_meta
+    env = {"JIRA_PROJECT_METADATA_CACHE_TTL": "0", "MCP_FANOUT_THREADS": "0"}
+    with patch.dict("os.environ", env):
+        assert projects_mixin.get_project_createmeta("PROJ1") == old_meta
+    assert projects_mixin.get_project_createmeta("PROJ1") == new_meta
+    assert projects_mixin.jira.issue_createmeta.call_count == 2
+
+
+def test_get_project_createmeta_projection(projects_mixin: ProjectsMixin):
+    """Test that create metadata is reduced when it is fetched."""
+    priorities = [
+        {"self": "https://x/priority/1", "iconUrl": "https://x/1.svg", "id": "1"},
+        {"self": "https://x/priority/2", "iconUrl": "https://x/2.svg", "id": "2"},
+        {"self": "https://x/priority/3", "iconUrl": "https://x/3.svg", "id": "3"},
+    ]
+    projects_mixin.jira.issue_createmeta.return_value = {
+        "expand": "projects",
+        "projects": [
+            {
+                "self": "https://x/project/1",
+                "key": "PROJ1",
+                "avatarUrls": {"48x48": "https://x/a.png"},
+                "issuetypes": [
+                    {
+                        "id": "10001",
+                        "name": "Bug",
+                        "iconUrl": "https://x/bug.svg",
+                        "fields": {
+                            "priority": {
+                                "required": False,
+                                "name": "Priority",
+                                "allowedValues": priorities,
+                            },
+                            "fixVersions": {"name": "Fix Version/s"},
+                        },
+                    }
+                ],
+            }
+        ],
+    }
+    projects_mixin.jira.issue_createmeta_fieldtypes.return_value = {
+        "startAt": 0,
+        "total": 2,
+        "fields": [
+            {"fieldId": "summary", "key": "summary", "required": True},
+            {"fieldId": "fixVersions", "key": "fixVersions", "required": False},
+        ],
+    }
+
+    with patch.dict("os.environ", {"JIRA_CREATEMETA_MAX_ALLOWED_VALUES": "2"}):
+        createmeta = projects_mixin.get_project_createmeta("PROJ1")
+        field_types = projects_mixin.get_issue_type_fields("PROJ1", "10001")
+
+    assert createmeta == {
+        "projects": [
+            {
+                "key": "PROJ1",
+                "issuetypes": [
+                    {
+                        "id": "10001",
+                        "name": "Bug",
+                        "fields": {
+                            "priority": {
+                                "required": False,
+                                "name": "Priority",
+                                "allowedValues": [{"id": "1"}, {"id": "2"}],
+                                "allowedValuesTotal": 3,
+                            }
+                        },
+                    }
+                ],
+            }
+        ]
+    }
+    assert field_types == {
+        "startAt": 0,
+        "total": 2,
+        "fields": [{"fieldId": "summary", "key": "summary", "required": True}],
+    }
+
+
 def test_get_project_issue_types_empty_response(projects_mixin: ProjectsMixin):
     """Test get_project_issue_types method with empty response."""
     # Empty projects list
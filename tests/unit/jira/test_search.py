@@ -1,10 +1,12 @@
 """Tests for the Jira Search mixin."""
 
+import threading
 from unittest.mock import ANY, MagicMock
 
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
@@ -266,6 +268,192 @@ class TestSearchMixin:
         with pytest.raises(Exception, match="Error searching issues"):
             search_mixin.search_issues("project = TEST")
 
+    def test_search_issues_cloud_fetches_total_concurrently(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test that the Cloud count request overlaps with the issue fetch."""
+        search_mixin.config.is_cloud = True
+        both_started = threading.Barrier(2, timeout=5)
+
+        def count_request(*args, **kwargs):
+            both_started.wait()
+            return {"total": 42}
+
+        def issues_request(*args, **kwargs):
+            both_started.wait()
+            return mock_issues_response["issues"]
+
+        search_mixin.jira.get = MagicMock(side_effect=count_request)
+        search_mixin.jira.enhanced_jql_get_list_of_tickets = MagicMock(
+            side_effect=issues_request
+        )
+
+        result = search_mixin.search_issues("project = TEST")
+
+        assert result.total == 42
+        assert len(result.issues) == 1
+        search_mixin.jira.get.assert_called_once_with(
+            ANY, params={"jql": "project = TEST", "maxResults": 0}
+        )
+
+    def test_search_issues_cloud_skip_count(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test that count_mode='skip' issues only the issue fetch."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql_get_list_of_tickets = MagicMock(
+            return_value=mock_issues_response["issues"]
+        )
+
+        result = search_mixin.search_issues("project = TEST", count_mode="skip")
+
+        assert result.total == -1
+        search_mixin.jira.get.assert_not_called()
+        search_mixin.jira.post.assert_not_called()
+
+    def test_search_issues_cloud_approximate_count(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test that count_mode='approximate' uses the approximate-count endpoint."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.enhanced_jql_get_list_of_tickets = MagicMock(
+            return_value=mock_issues_response["issues"]
+        )
+        search_mixin.jira.post = MagicMock(return_value={"count": 1000})
+
+        result = search_mixin.search_issues("project = TEST", count_mode="approximate")
+
+        assert result.total == 1000
+        search_mixin.jira.post.assert_called_once_with(
+            "rest/api/3/search/approximate-count", data={"jql": "project = TEST"}
+        )
+        search_mixin.jira.get.assert_not_called()
+
+    def test_search_issues_cloud_count_failure_is_not_fatal(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test that a failing count request still returns the issues."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.get = MagicMock(side_effect=Exception("count failed"))
+        search_mixin.jira.enhanced_jql_get_list_of_tickets = MagicMock(
+            return_value=mock_issues_response["issues"]
+        )
+
+        result = search_mixin.search_issues("project = TEST")
+
+        assert result.total == -1
+        assert len(result.issues) == 1
+
+    def test_search_issues_invalid_count_mode(self, search_mixin: SearchMixin):
+        """Test that an unknown count_mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid count_mode"):
+            search_mixin.search_issues("project = TEST", count_mode="fast")
+
+    def test_iter_issue_pages_server(self, search_mixin: SearchMixin):
+        """Test that Server/DC pages are requested with increasing startAt."""
+
+        def jql_page(jql, fields, start, limit, expand):
+            keys = [f"TEST-{n}" for n in range(start, min(start + limit, 5))]
+            return {
+                "issues": [{"id": key, "key": key, "fields": {}} for key in keys],
+                "total": 5,
+                "startAt": start,
+                "maxResults": limit,
+            }
+
+        search_mixin.jira.jql = MagicMock(side_effect=jql_page)
+
+        pages = list(search_mixin.iter_issue_pages("project = TEST", page_size=2))
+
+        assert [len(page.issues) for page in pages] == [2, 2, 1]
+        assert [
+            call.kwargs["start"] for call in search_mixin.jira.jql.call_args_list
+        ] == [
+            0,
+            2,
+            4,
+        ]
+        keys = [issue.key for issue in search_mixin.iter_issues("project = TEST")]
+        assert keys == [f"TEST-{n}" for n in range(5)]
+
+    def test_iter_issue_records(self, search_mixin: SearchMixin):
+        """Test that records hold the simplified issues of all pages."""
+        status = {"name": "Open", "statusCategory": {"name": "To Do"}}
+
+        def jql_page(jql, fields, start, limit, expand):
+            keys = [f"TEST-{n}" for n in range(start, min(start + limit, 3))]
+            return {
+                "issues": [
+                    {
+                        "id": key,
+                        "key": key,
+                        "fields": {"summary": key, "status": status},
+                    }
+                    for key in keys
+                ],
+                "total": 3,
+                "startAt": start,
+                "maxResults": limit,
+            }
+
+        search_mixin.jira.jql = MagicMock(side_effect=jql_page)
+
+        records = list(
+            search_mixin.iter_issue_records(
+                "project = TEST", fields="summary,status", page_size=2
+            )
+        )
+
+        assert [record.to_simplified_dict() for record in records] == [
+            {
+                "id": f"TEST-{n}",
+                "key": f"TEST-{n}",
+                "summary": f"TEST-{n}",
+                "status": {"name": "Open", "category": "To Do", "color": ""},
+            }
+            for n in range(3)
+        ]
+
+    def test_iter_issue_pages_cloud(self, search_mixin: SearchMixin):
+        """Test that Cloud pages follow nextPageToken."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.resource_url.return_value = "rest/api/2/search/jql"
+        search_mixin.jira.get = MagicMock(
+            side_effect=[
+                {
+                    "issues": [{"id": "1", "key": "TEST-1", "fields": {}}],
+                    "nextPageToken": "page-2",
+                },
+                {"issues": [{"id": "2", "key": "TEST-2", "fields": {}}]},
+            ]
+        )
+
+        issues = list(
+            search_mixin.iter_issues(
+                "project = TEST", fields="summary", page_size=500, prefetch=False
+            )
+        )
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-2"]
+        first_call, second_call = search_mixin.jira.get.call_args_list
+        assert first_call.kwargs["params"] == {
+            "jql": "project = TEST",
+            "fields": "summary",
+            "maxResults": 100,
+        }
+        assert second_call.kwargs["params"]["nextPageToken"] == "page-2"
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+
+    def test_iter_issue_pages_auth_error(self, search_mixin: SearchMixin):
+        """Test that 401 responses surface as authentication errors."""
+        response = MagicMock(status_code=401)
+        search_mixin.jira.jql = MagicMock(
+            side_effect=requests.HTTPError(response=response)
+        )
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            list(search_mixin.iter_issue_pages("project = TEST"))
+
     def test_search_issues_with_projects_filter(self, search_mixin: SearchMixin):
         """Test search with projects filter."""
         # Setup mock response
@@ -568,6 +756,27 @@ class TestSearchMixin:
             search_mixin.get_sprint_issues("10001")
         assert "API Error content" in str(e.value)
 
+    @pytest.mark.parametrize(
+        "method, api_method, args",
+        [
+            ("search_issues", "jql", ("project = TEST",)),
+            ("get_board_issues", "get_issues_for_board", ("1000", "")),
+            ("get_sprint_issues", "get_sprint_issues", ("10001",)),
+        ],
+    )
+    def test_simplified_methods_match_models(
+        self, search_mixin: SearchMixin, mock_issues_response, method, api_method, args
+    ):
+        """Test that the *_simplified methods return the simplified models."""
+        getattr(search_mixin.jira, api_method).return_value = mock_issues_response
+
+        for fields in (None, "summary,status", "*all"):
+            expected = getattr(search_mixin, method)(*args, fields=fields)
+            result = getattr(search_mixin, f"{method}_simplified")(*args, fields=fields)
+
+            assert result == expected.to_simplified_dict()
+            assert result["issues"][0]["key"] == "TEST-123"
+
     @pytest.mark.parametrize("is_cloud", [True, False])
     def test_search_issues_with_projects_filter_jql_construction(
         self, search_mixin: SearchMixin, mock_issues_response, is_cloud
@@ -212,6 +212,84 @@ class TestUsersMixin:
             ):
                 users_mixin._get_account_id("testuser")
 
+    def test_get_account_id_is_cached(self, users_mixin):
+        """Test that found and unknown users are remembered."""
+        with (
+            patch.object(
+                users_mixin,
+                "_lookup_user_directly",
+                side_effect=lambda name: "account-1" if name == "Alice" else None,
+            ) as mock_direct,
+            patch.object(
+                users_mixin, "_lookup_user_by_permissions", return_value=None
+            ) as mock_permissions,
+        ):
+            assert users_mixin._get_account_id("Alice") == "account-1"
+            assert users_mixin._get_account_id("alice") == "account-1"
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    users_mixin._get_account_id("nobody")
+
+            assert mock_direct.call_count == 2
+            mock_permissions.assert_called_once_with("nobody")
+
+        with (
+            patch.dict("os.environ", {"MCP_FANOUT_THREADS": "0"}),
+            patch.object(users_mixin, "_lookup_user_directly") as mock_direct,
+        ):
+            assert users_mixin.resolve_account_ids(
+                ["Alice", "nobody", "Alice", "5abcdef1234567890"]
+            ) == {
+                "Alice": "account-1",
+                "nobody": None,
+                "5abcdef1234567890": "5abcdef1234567890",
+            }
+            mock_direct.assert_not_called()
+
+    def test_get_account_id_lookup_errors_are_not_cached(self, users_mixin):
+        """Test that a failed lookup does not remember the user as unknown."""
+        with (
+            patch.object(
+                users_mixin,
+                "_lookup_user_directly",
+                side_effect=[requests.exceptions.Timeout("timed out"), "account-1"],
+            ) as mock_direct,
+            patch.object(users_mixin, "_lookup_user_by_permissions", return_value=None),
+        ):
+            with pytest.raises(ValueError):
+                users_mixin._get_account_id("alice")
+            assert users_mixin._get_account_id("alice") == "account-1"
+
+        assert mock_direct.call_count == 2
+
+    def test_resolve_account_ids_looks_up_each_user_once(self, users_mixin):
+        """Test that a batch naming the same users resolves each of them once."""
+        with patch.object(
+            users_mixin,
+            "_lookup_user_directly",
+            side_effect=lambda name: f"id-{name}",
+        ) as mock_direct:
+            result = users_mixin.resolve_account_ids(["bob", "carol", "bob"] * 10)
+
+        assert result == {"bob": "id-bob", "carol": "id-carol"}
+        assert sorted(call.args[0] for call in mock_direct.call_args_list) == [
+            "bob",
+            "carol",
+        ]
+
+    def test_account_id_cache_settings_read_after_import(self, users_mixin):
+        """Test that JIRA_USER_CACHE_TTL from a .env file loaded after import applies."""
+        with (
+            patch.dict("os.environ", {"JIRA_USER_CACHE_TTL": "0"}),
+            patch.object(
+                users_mixin, "_lookup_user_directly", return_value="account-1"
+            ) as mock_direct,
+        ):
+            users_mixin._get_account_id("alice")
+            users_mixin._get_account_id("alice")
+
+        assert mock_direct.call_count == 2
+
     def test_lookup_user_directly(self, users_mixin):
         """Test _lookup_user_directly when user is found."""
         # Mock the API response
@@ -358,11 +436,9 @@ class TestUsersMixin:
         # Mock API call to raise exception
         users_mixin.jira.user_find_by_user_string.side_effect = Exception("API error")
 
-        # Call the method
-        account_id = users_mixin._lookup_user_directly("error")
-
-        # Verify result
-        assert account_id is None
+        # Verify the error is not mistaken for an unknown user
+        with pytest.raises(Exception, match="API error"):
+            users_mixin._lookup_user_directly("error")
 
     def test_lookup_user_by_permissions(self, users_mixin):
         """Test _lookup_user_by_permissions when user is found."""
@@ -470,11 +546,49 @@ class TestUsersMixin:
         """Test _lookup_user_by_permissions when API call fails."""
         # Mock requests.get to raise exception
         with patch("requests.get", side_effect=Exception("API error")):
-            # Call the method
-            account_id = users_mixin._lookup_user_by_permissions("error")
-
-            # Verify result
-            assert account_id is None
+            # Verify the error is not mistaken for an unknown user
+            with pytest.raises(Exception, match="API error"):
+                users_mixin._lookup_user_by_permissions("error")
+
+    @staticmethod
+    def _permission_search_response(status_code: int) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = b"{}"
+        return response
+
+    @pytest.mark.parametrize("status_code", [400, 404])
+    def test_lookup_user_by_permissions_unsupported(self, users_mixin, status_code):
+        """Test that 400/404 from the permission search count as no match."""
+        users_mixin.jira.user_find_by_user_string.return_value = []
+        with patch(
+            "requests.get",
+            return_value=self._permission_search_response(status_code),
+        ) as mock_get:
+            assert users_mixin._lookup_user_by_permissions("nobody") is None
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    users_mixin._get_account_id("nobody")
+
+        # The unknown user was cached after the first _get_account_id
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize("status_code", [429, 503])
+    def test_lookup_user_by_permissions_failure(self, users_mixin, status_code):
+        """Test that rate limiting and server errors are lookup failures."""
+        users_mixin.jira.user_find_by_user_string.return_value = []
+        with patch(
+            "requests.get",
+            return_value=self._permission_search_response(status_code),
+        ) as mock_get:
+            with pytest.raises(requests.HTTPError):
+                users_mixin._lookup_user_by_permissions("nobody")
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    users_mixin._get_account_id("nobody")
+
+        # The failures were not cached, so every call searched again
+        assert mock_get.call_count == 3
 
     def test_lookup_user_by_permissions_jira_data_center_name_only(self, users_mixin):
         """Test _lookup_user_by_permissions when only 'name' is available (Data Center)."""
@@ -63,6 +63,15 @@ class TestTimestampMixin:
 
         assert result == "2024-01-01 12:34:56"
 
+    def test_format_timestamp_negative_offset(self):
+        """Test formatting a timestamp with a negative offset without a colon."""
+        timestamp = "2024-01-01T12:34:56.789-0500"
+        formatter = TimestampMixin()
+
+        result = formatter.format_timestamp(timestamp)
+
+        assert result == "2024-01-01 12:34:56"
+
     def test_format_timestamp_none(self):
         """Test formatting a None timestamp."""
         formatter = TimestampMixin()
@@ -5,8 +5,10 @@ These tests validate the conversion of Jira API responses to structured models
 and the simplified dictionary conversion for API responses.
 """
 
+import copy
 import os
 import re
+from unittest.mock import patch
 
 import pytest
 
@@ -20,6 +22,7 @@ from src.mcp_atlassian.models.jira import (
     JiraComment,
     JiraIssue,
     JiraIssueLinkType,
+    JiraIssueRecord,
     JiraIssueType,
     JiraPriority,
     JiraProject,
@@ -32,6 +35,8 @@ from src.mcp_atlassian.models.jira import (
     JiraUser,
     JiraWorklog,
 )
+from src.mcp_atlassian.models.jira.common import EntityRegistry
+from src.mcp_atlassian.models.jira.record import RecordInterner
 
 # Optional: Import real API client for optional real-data testing
 try:
@@ -877,6 +882,32 @@ class TestJiraIssue:
         assert "customfield_10014" in simplified_specific
         assert simplified_specific.get("customfield_10014") == "EPIC-KEY-1"
 
+    def test_custom_field_attribute_access(self, jira_issue_data):
+        """Test that custom fields can be read as attributes of the issue."""
+        issue = JiraIssue.from_api_response(jira_issue_data)
+
+        assert issue.customfield_10001 == "Custom Text Field Value"
+        assert issue.summary == "Test Issue Summary"
+        assert not hasattr(issue, "customfield_99999")
+        with pytest.raises(AttributeError):
+            _ = issue.not_a_field
+
+    def test_field_selection(self):
+        """Test that requested fields are compiled once into a selection."""
+        selection = JiraIssue.field_selection("summary, cf_10002,customfield_10001")
+
+        assert [field.key for field in selection.fields] == ["summary", "changelogs"]
+        assert not selection.all_custom_fields
+        assert selection.custom_field_ids == ("customfield_10002", "customfield_10001")
+        assert JiraIssue.field_selection(
+            ["summary", "cf_10002", "customfield_10001"]
+        ) is (selection)
+        assert JiraIssue.field_selection("*all").all_custom_fields
+        assert not JiraIssue.field_selection(None).all_custom_fields
+        assert len(JiraIssue.field_selection(None).fields) == len(
+            JiraIssue.field_selection("*all").fields
+        )
+
     def test_jira_issue_with_default_fields(self, jira_issue_data):
         """Test that JiraIssue returns only essential fields by default."""
         issue = JiraIssue.from_api_response(jira_issue_data)
@@ -986,6 +1017,253 @@ class TestJiraSearchResult:
         assert search_result.max_results == -1
         assert len(search_result.issues) == 1  # Assuming mock data has issues
 
+    def test_from_api_response_shares_entities(self, jira_issue_data):
+        """Test that entities repeated across the issues are built once."""
+        other = copy.deepcopy(jira_issue_data)
+        other["key"] = "PROJ-124"
+        other["fields"]["priority"]["name"] = "Renamed"
+
+        result = JiraSearchResult.from_api_response(
+            {"issues": [jira_issue_data, other]}
+        )
+
+        first, second = result.issues
+        assert first.status is second.status
+        assert first.project is second.project
+        assert first.reporter is second.reporter
+        # Same ID but different data is not shared
+        assert first.priority is not second.priority
+        assert second.priority.name == "Renamed"
+
+    def test_entity_registry_for_site(self, jira_issue_data):
+        """Test that registries of one site share entities across responses."""
+        data = {"issues": [jira_issue_data]}
+        # Set after import, as when the value comes from a .env file
+        with patch.dict(os.environ, {"JIRA_ENTITY_CACHE_TTL": "60"}):
+            first = JiraSearchResult.from_api_response(
+                data, registry=EntityRegistry(site="site-a")
+            )
+            second = JiraSearchResult.from_api_response(
+                data, registry=EntityRegistry(site="site-a")
+            )
+            other_site = JiraSearchResult.from_api_response(
+                data, registry=EntityRegistry(site="site-b")
+            )
+
+        assert first.issues[0].status is second.issues[0].status
+        assert first.issues[0].status is not other_site.issues[0].status
+        assert first.issues[0].status == other_site.issues[0].status
+
+
+# An issue with the less common shapes the simplified output handles: ADF comment
+# bodies, changelogs, named custom fields and values of unexpected types.
+EDGE_CASE_ISSUE = {
+    "id": 10001,
+    "key": "EDGE-1",
+    "self": "https://example.atlassian.net/rest/api/2/issue/10001",
+    "fields": {
+        "summary": "",
+        "description": None,
+        "status": {"name": "Open", "statusCategory": "not-a-dict"},
+        "issuetype": {"id": 3},
+        "priority": "High",
+        "assignee": None,
+        "reporter": {"displayName": "Reporter", "avatarUrls": ["not-a-dict"]},
+        "project": {
+            "key": "EDGE",
+            "projectCategory": {"name": "Platform"},
+            "lead": {"displayName": "Lead"},
+        },
+        "resolution": {"id": 0, "name": "Unresolved"},
+        "duedate": 20240101,
+        "parent": {"key": "EDGE-0"},
+        "subtasks": [{"key": "EDGE-2"}, "EDGE-3"],
+        "labels": ["a", "", None, 1],
+        "components": [{"name": "API"}, "UI", None, {}],
+        "fixVersions": "1.0",
+        "timetracking": {"timeSpentSeconds": 60},
+        "comment": {
+            "comments": [
+                {"body": {"type": "doc", "content": [{"type": "paragraph"}]}},
+                {"body": "Plain", "author": {"displayName": "Bob"}, "created": None},
+                None,
+            ]
+        },
+        "attachment": [{"filename": "a.txt", "size": "12", "mimeType": ""}, {}],
+        "customfield_10010": {"name": "Team Name", "value": "Core"},
+        "customfield_10020": [{"value": "x"}, "y"],
+        "customfield_10030": None,
+    },
+    "changelog": {
+        "histories": [
+            {
+                "author": {"displayName": "Carol"},
+                "created": "2024-01-01T10:00:00.000+0000",
+                "items": [{"field": "status", "fromString": "Open", "to": "3"}],
+            },
+            {},
+        ]
+    },
+}
+
+
+class TestJiraSimplifyApiResponse:
+    """Tests that simplify_api_response matches the models' simplified output."""
+
+    @pytest.mark.parametrize(
+        "requested_fields",
+        [
+            None,
+            "*all",
+            "summary,status,assignee",
+            ["key", "comment", "attachment", "timetracking"],
+            "customfield_10001,cf_10002,customfield_10003,team_name",
+            ("labels", "cf_10020", "project"),
+            {"epic_key", "epic_name"},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "data", ["issue", "edge_case", "empty"], ids=["issue", "edge_case", "empty"]
+    )
+    def test_issue_matches_model(self, jira_issue_data, data, requested_fields):
+        """Test the direct conversion of issues for various requested fields."""
+        data = {"issue": jira_issue_data, "edge_case": EDGE_CASE_ISSUE, "empty": {}}[
+            data
+        ]
+        expected = JiraIssue.from_api_response(
+            data, requested_fields=requested_fields
+        ).to_simplified_dict()
+
+        assert (
+            JiraIssue.simplify_api_response(data, requested_fields=requested_fields)
+            == expected
+        )
+
+    def test_search_result_matches_model(self, jira_search_data):
+        """Test the direct conversion of search results."""
+        data = dict(jira_search_data)
+        data["issues"] = [*data["issues"], EDGE_CASE_ISSUE, None]
+        data["startAt"] = "not-a-number"
+
+        for requested_fields in (None, "*all", "summary,labels"):
+            expected = JiraSearchResult.from_api_response(
+                data, requested_fields=requested_fields
+            ).to_simplified_dict()
+            assert [issue["key"] for issue in expected["issues"]] == [
+                "PROJ-123",
+                "EDGE-1",
+            ]
+            assert (
+                JiraSearchResult.simplify_api_response(
+                    data, requested_fields=requested_fields
+                )
+                == expected
+            )
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            JiraUser,
+            JiraStatus,
+            JiraIssueType,
+            JiraPriority,
+            JiraResolution,
+            JiraTimetracking,
+            JiraComment,
+            JiraProject,
+        ],
+    )
+    @pytest.mark.parametrize(
+        "data",
+        [
+            None,
+            {},
+            "text",
+            {"name": "Named", "displayName": "User", "body": "Body", "key": "K"},
+            {"statusCategory": {"name": "Done"}, "avatarUrls": {"48x48": "u"}},
+        ],
+    )
+    def test_nested_models_match(self, model, data):
+        """Test the direct conversion of the models nested in issues."""
+        assert (
+            model.simplify_api_response(data)
+            == model.from_api_response(data).to_simplified_dict()
+        )
+
+
+class TestJiraIssueRecord:
+    """Tests for the compact JiraIssueRecord."""
+
+    @pytest.mark.parametrize("requested_fields", [None, "*all", "summary,status"])
+    def test_matches_simplified_dict(self, jira_issue_data, requested_fields):
+        """Test that records convert back to the simplified issue."""
+        for data in (jira_issue_data, EDGE_CASE_ISSUE):
+            record = JiraIssueRecord.from_api_response(
+                data, requested_fields=requested_fields
+            )
+            expected = JiraIssue.simplify_api_response(
+                data, requested_fields=requested_fields
+            )
+
+            assert record.to_simplified_dict() == expected
+            assert list(record) == list(expected)
+            assert record.key == expected["key"]
+            assert record.id == expected["id"]
+
+    def test_access(self, jira_issue_data):
+        """Test reading entries of a record."""
+        record = JiraIssueRecord.from_api_response(
+            jira_issue_data, requested_fields="summary,labels"
+        )
+
+        assert record["summary"] == "Test Issue Summary"
+        assert "labels" in record
+        assert "status" not in record
+        assert record.get("status", "missing") == "missing"
+        assert len(record) == 4
+        with pytest.raises(KeyError):
+            _ = record["status"]
+        with pytest.raises(AttributeError):
+            record.summary = "Changed"
+
+    def test_shares_repeated_values(self, jira_issue_data):
+        """Test that records from one interner share equal nested values."""
+        interner = RecordInterner()
+        first, second = (
+            JiraIssueRecord.from_api_response(dict(jira_issue_data, key=key), interner)
+            for key in ("PROJ-1", "PROJ-2")
+        )
+
+        assert first._keys is second._keys
+        status = first._keys.index("status")
+        assert first._values[status] is second._values[status]
+        assert first.key == "PROJ-1"
+        assert second.key == "PROJ-2"
+
+        # Returned values are copies, the records cannot be changed through them
+        first["status"]["name"] = "Changed"
+        assert first["status"]["name"] == second["status"]["name"] != "Changed"
+
+    def test_keeps_types_of_equal_values(self):
+        """Test that values equal across types are not shared."""
+        interner = RecordInterner()
+        values = [
+            {"flags": {"x": 1, "y": 0}, "points": [1], "ratio": {"v": 2}},
+            {"flags": {"x": True, "y": False}, "points": [1.0], "ratio": {"v": 2.0}},
+            {"flags": {"x": 1.0, "y": 0.0}, "points": [True], "ratio": {"v": 2}},
+        ]
+        records = [
+            JiraIssueRecord.from_simplified_dict(simplified, interner)
+            for simplified in values
+        ]
+
+        for record, simplified in zip(records, values, strict=True):
+            thawed = record.to_simplified_dict()
+            assert thawed == simplified
+            for name in simplified:
+                assert repr(thawed[name]) == repr(simplified[name])
+        assert records[0]._values[2] is records[2]._values[2]
+
 
 class TestJiraProject:
     """Tests for the JiraProject model."""
@@ -0,0 +1,186 @@
+"""Tests for the fetcher dependency providers and the pooled fetcher registry."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.servers import dependencies
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.dependencies import (
+    FetcherRegistry,
+    get_confluence_fetcher,
+    get_jira_fetcher,
+)
+
+
+@pytest.fixture
+def registry():
+    """Replace the process-wide registry with a fresh one for each test."""
+    fresh_registry = FetcherRegistry(maxsize=10, ttl=60, validation_ttl=300)
+    with patch.object(dependencies, "fetcher_registry", fresh_registry):
+        yield fresh_registry
+
+
+@pytest.fixture
+def ctx():
+    """Create a mock FastMCP context carrying server-wide configuration."""
+    app_context = MainAppContext(
+        full_jira_config=JiraConfig(
+            url="https://jira.example.com", auth_type="token", personal_token="x"
+        ),
+        full_confluence_config=ConfluenceConfig(
+            url="https://confluence.example.com",
+            auth_type="token",
+            personal_token="x",
+        ),
+    )
+    mock_ctx = MagicMock()
+    mock_ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
+    return mock_ctx
+
+
+def _pat_request(token: str) -> SimpleNamespace:
+    """Build a request whose state looks like UserTokenMiddleware set a PAT."""
+    return SimpleNamespace(
+        url="http://test/mcp",
+        state=SimpleNamespace(
+            user_atlassian_auth_type="pat",
+            user_atlassian_token=token,
+            user_atlassian_email=None,
+        ),
+    )
+
+
+def test_fingerprint_is_stable_and_credential_specific():
+    """Test that fingerprints depend on every part of the credential."""
+    key = FetcherRegistry.fingerprint("jira", "pat", "token-a", "https://x.com/")
+    assert key == FetcherRegistry.fingerprint("jira", "pat", "token-a", "https://x.com")
+    assert "token-a" not in key
+    assert key != FetcherRegistry.fingerprint("jira", "pat", "token-b", "https://x.com")
+    assert key != FetcherRegistry.fingerprint("jira", "pat", "token-a", "https://y.com")
+    assert key != FetcherRegistry.fingerprint(
+        "confluence", "pat", "token-a", "https://x.com"
+    )
+
+
+def test_registry_validation_window():
+    """Test that validation state expires after validation_ttl."""
+    registry = FetcherRegistry(maxsize=2, ttl=60, validation_ttl=300)
+    registry.put("key", MagicMock())
+    assert registry.needs_validation("key") is True
+    registry.mark_validated("key", "account-id")
+    assert registry.needs_validation("key") is False
+    assert registry.get("key").user_info == "account-id"
+
+    registry.validation_ttl = 0
+    assert registry.needs_validation("key") is True
+
+    registry.invalidate("key")
+    assert registry.get("key") is None
+    assert registry.needs_validation("key") is True
+
+
+def test_registry_is_bounded():
+    """Test that the registry evicts entries beyond maxsize."""
+    registry = FetcherRegistry(maxsize=2, ttl=60)
+    for i in range(5):
+        registry.put(f"key-{i}", MagicMock())
+    assert len(registry) == 2
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_reuses_pooled_fetcher(registry, ctx):
+    """Test that the same PAT reuses one fetcher and validates only once."""
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_current_user_account_id.return_value = "account-id"
+    with (
+        patch.object(
+            dependencies, "JiraFetcher", return_value=mock_fetcher
+        ) as mock_fetcher_class,
+        patch.object(
+            dependencies, "get_http_request", side_effect=lambda: _pat_request("pat1")
+        ),
+    ):
+        first = await get_jira_fetcher(ctx)
+        second = await get_jira_fetcher(ctx)
+
+    assert first is second is mock_fetcher
+    mock_fetcher_class.assert_called_once()
+    mock_fetcher.get_current_user_account_id.assert_called_once()
+    assert len(registry) == 1
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_separates_tokens(registry, ctx):
+    """Test that different tokens get different pooled fetchers."""
+    with (
+        patch.object(
+            dependencies, "JiraFetcher", side_effect=lambda config: MagicMock()
+        ),
+        patch.object(
+            dependencies,
+            "get_http_request",
+            side_effect=[_pat_request("pat1"), _pat_request("pat2")],
+        ),
+    ):
+        first = await get_jira_fetcher(ctx)
+        second = await get_jira_fetcher(ctx)
+
+    assert first is not second
+    assert len(registry) == 2
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_failed_validation_is_not_pooled(registry, ctx):
+    """Test that a token failing validation is evicted from the pool."""
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_current_user_account_id.side_effect = Exception("401")
+    with (
+        patch.object(dependencies, "JiraFetcher", return_value=mock_fetcher),
+        patch.object(
+            dependencies, "get_http_request", return_value=_pat_request("bad")
+        ),
+    ):
+        with pytest.raises(ValueError, match="Invalid user Jira token"):
+            await get_jira_fetcher(ctx)
+
+    assert len(registry) == 0
+
+
+@pytest.mark.anyio
+async def test_get_confluence_fetcher_reuses_validation_result(registry, ctx):
+    """Test that the cached user info still populates the derived email."""
+    mock_fetcher = MagicMock()
+    mock_fetcher.get_current_user_info.return_value = {
+        "email": "user@example.com",
+        "displayName": "User",
+    }
+    requests = [_pat_request("pat1"), _pat_request("pat1")]
+    with (
+        patch.object(dependencies, "ConfluenceFetcher", return_value=mock_fetcher),
+        patch.object(dependencies, "get_http_request", side_effect=requests),
+    ):
+        await get_confluence_fetcher(ctx)
+        await get_confluence_fetcher(ctx)
+
+    mock_fetcher.get_current_user_info.assert_called_once()
+    assert requests[1].state.user_atlassian_email == "user@example.com"
+
+
+@pytest.mark.anyio
+async def test_global_fetcher_is_pooled(registry, ctx):
+    """Test that the fallback fetcher built from global config is reused."""
+    with (
+        patch.object(
+            dependencies, "JiraFetcher", side_effect=lambda config: MagicMock()
+        ) as mock_fetcher_class,
+        patch.object(dependencies, "get_http_request", side_effect=RuntimeError),
+    ):
+        first = await get_jira_fetcher(ctx)
+        second = await get_jira_fetcher(ctx)
+
+    assert first is second
+    mock_fetcher_class.assert_called_once()
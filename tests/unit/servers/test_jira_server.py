@@ -2,9 +2,10 @@
 
 import json
 import logging
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import Client, FastMCP
@@ -14,6 +15,11 @@ from starlette.requests import Request
 
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
+from src.mcp_atlassian.models.jira import (
+    JiraIssue,
+    JiraIssueRecord,
+    JiraSearchResult,
+)
 from src.mcp_atlassian.servers.context import MainAppContext
 from src.mcp_atlassian.servers.main import AtlassianMCP
 from src.mcp_atlassian.utils.oauth import OAuthConfig
@@ -96,6 +102,9 @@ def mock_jira_fetcher():
         return mock_search_result
 
     mock_fetcher.search_issues.side_effect = mock_search_issues
+    mock_fetcher.search_issues_simplified.side_effect = lambda jql, **kwargs: (
+        mock_search_issues(jql, **kwargs).to_simplified_dict()
+    )
 
     # Configure create_issue
     def mock_create_issue(
@@ -133,7 +142,7 @@ def mock_jira_fetcher():
     mock_fetcher.create_issue.side_effect = mock_create_issue
 
     # Configure batch_create_issues
-    def mock_batch_create_issues(issues, validate_only=False):
+    def mock_batch_create_issues(issues, validate_only=False, failed=None):
         if not isinstance(issues, list):
             try:
                 parsed_issues = json.loads(issues)
@@ -146,6 +155,11 @@ def mock_jira_fetcher():
                 raise ValueError("Issues must be a list or a valid JSON array string.")
         mock_issues = []
         for idx, issue_data in enumerate(issues, 1):
+            if issue_data["summary"] == "Rejected" and failed is not None:
+                failed.append(
+                    {"index": idx - 1, "summary": "Rejected", "error": "Invalid"}
+                )
+                continue
             mock_issue = MagicMock()
             mock_issue.to_simplified_dict.return_value = {
                 "key": f"{issue_data['project_key']}-{idx}",
@@ -247,6 +261,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         add_worklog,
         batch_create_issues,
         batch_get_changelogs,
+        batch_get_issues,
         create_issue,
         create_issue_link,
         delete_issue,
@@ -265,6 +280,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         remove_issue_link,
         search,
         search_fields,
+        stream_search,
         transition_issue,
         update_issue,
         update_sprint,
@@ -272,8 +288,10 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
 
     jira_sub_mcp = FastMCP(name="TestJiraSubMCP")
     jira_sub_mcp.tool()(get_issue)
+    jira_sub_mcp.tool()(batch_get_issues)
     jira_sub_mcp.tool()(search)
     jira_sub_mcp.tool()(search_fields)
+    jira_sub_mcp.tool()(stream_search)
     jira_sub_mcp.tool()(get_project_issues)
     jira_sub_mcp.tool()(get_transitions)
     jira_sub_mcp.tool()(get_worklog)
@@ -391,6 +409,31 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_batch_get_issues(jira_client, mock_jira_fetcher):
+    """Test that batch_get_issues returns issues and reports missing keys."""
+
+    def batch_get_issues(issue_keys, not_found, **kwargs):
+        not_found.append("PROJ-999")
+        return [JiraIssue.from_api_response(MOCK_JIRA_ISSUE_RESPONSE_SIMPLIFIED)]
+
+    mock_jira_fetcher.batch_get_issues.side_effect = batch_get_issues
+    response = await jira_client.call_tool(
+        "jira_batch_get_issues",
+        {"issue_keys": ["PROJ-123", "PROJ-999"], "fields": "summary,status"},
+    )
+    content = json.loads(response[0].text)
+    assert [issue["key"] for issue in content["issues"]] == ["PROJ-123"]
+    assert content["not_found"] == ["PROJ-999"]
+    mock_jira_fetcher.batch_get_issues.assert_called_once_with(
+        issue_keys=["PROJ-123", "PROJ-999"],
+        fields=["summary", "status"],
+        expand=None,
+        comment_limit=10,
+        not_found=["PROJ-999"],
+    )
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -416,13 +459,81 @@ async def test_search(jira_client, mock_jira_fetcher):
     assert content["total"] > 0
     assert content["start_at"] == 0
     assert content["max_results"] == 10
-    mock_jira_fetcher.search_issues.assert_called_once_with(
+    mock_jira_fetcher.search_issues_simplified.assert_called_once_with(
         jql="project = TEST",
         fields=["summary", "status"],
         limit=10,
         start=0,
         projects_filter="",
         expand="",
+        count_mode="exact",
+    )
+
+
+@pytest.mark.anyio
+async def test_stream_search(test_jira_mcp, mock_jira_fetcher, mock_request):
+    """Test that stream_search sends each page as a log notification."""
+    pages = [
+        JiraSearchResult.from_api_response(
+            {
+                "issues": [
+                    {"id": str(10000 + n), "key": f"PROJ-{n}", "fields": {}}
+                    for n in range(start, start + 2)
+                ],
+                "total": 5,
+            }
+        )
+        for start in (1, 3, 5)
+    ]
+    mock_jira_fetcher.iter_issue_pages.return_value = iter(pages)
+    log_messages = []
+
+    async def log_handler(params):
+        log_messages.append(params)
+
+    with (
+        patch(
+            "src.mcp_atlassian.servers.jira.get_jira_fetcher",
+            AsyncMock(return_value=mock_jira_fetcher),
+        ),
+        patch(
+            "src.mcp_atlassian.servers.dependencies.get_http_request",
+            return_value=mock_request,
+        ),
+        patch.dict(os.environ, {"MCP_JSON_OMIT_EMPTY": "true"}),
+    ):
+        async with Client(
+            transport=FastMCPTransport(test_jira_mcp), log_handler=log_handler
+        ) as client:
+            response = await client.call_tool(
+                "jira_stream_search",
+                {"jql": "project = PROJ", "max_results": 5, "page_size": 2},
+            )
+
+    summary = json.loads(response[0].text)
+    assert summary == {
+        "jql": "project = PROJ",
+        "pages": 3,
+        "issues_streamed": 5,
+        "total": 5,
+    }
+    streamed_pages = [
+        json.loads(message.data)
+        for message in log_messages
+        if message.logger == "jira_stream_search"
+    ]
+    assert [page["page"] for page in streamed_pages] == [1, 2, 3]
+    assert [issue["key"] for issue in streamed_pages[2]["issues"]] == ["PROJ-5"]
+    # Pages are encoded like tool responses, here leaving out empty values
+    assert all(
+        "summary" not in issue for page in streamed_pages for issue in page["issues"]
+    )
+    mock_jira_fetcher.iter_issue_pages.assert_called_once_with(
+        "project = PROJ",
+        fields=ANY,
+        expand=None,
+        page_size=2,
+        projects_filter=None,
     )
 
 
@@ -505,6 +616,46 @@ async def test_batch_create_issues(jira_client, mock_jira_fetcher):
     assert call_kwargs["validate_only"] is False
 
 
+@pytest.mark.anyio
+async def test_batch_create_issues_partial_failure(jira_client):
+    """Test that issues that were not created are reported."""
+    test_issues = [
+        {"project_key": "TEST", "summary": "Created", "issue_type": "Task"},
+        {"project_key": "TEST", "summary": "Rejected", "issue_type": "Task"},
+    ]
+    response = await jira_client.call_tool(
+        "jira_batch_create_issues", {"issues": json.dumps(test_issues)}
+    )
+    content = json.loads(response[0].text)
+    assert content["message"].startswith("Created 1 of 2 issues")
+    assert [issue["summary"] for issue in content["issues"]] == ["Created"]
+    assert content["failed"] == [
+        {"index": 1, "summary": "Rejected", "error": "Invalid"}
+    ]
+
+
+@pytest.mark.anyio
+async def test_batch_get_changelogs(jira_client, mock_jira_fetcher):
+    """Test that changelogs are read as records with the limit applied."""
+    mock_jira_fetcher.config.is_cloud = True
+    changelogs = [{"author": {"display_name": "Alice"}, "created": "2024-01-01"}]
+    mock_jira_fetcher.batch_get_changelog_records.return_value = [
+        JiraIssueRecord.from_simplified_dict({"id": "10001", "changelogs": changelogs})
+    ]
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs",
+        {"issue_ids_or_keys": ["TEST-1"], "limit": 5},
+    )
+
+    assert json.loads(response[0].text) == [
+        {"issue_id": "10001", "changelogs": changelogs}
+    ]
+    mock_jira_fetcher.batch_get_changelog_records.assert_called_once_with(
+        issue_ids_or_keys=["TEST-1"], fields=None, limit=5
+    )
+
+
 @pytest.mark.anyio
 async def test_batch_create_issues_invalid_json(jira_client):
     """Test error handling for invalid JSON in batch issue creation."""
@@ -0,0 +1,109 @@
+"""Tests for the shared cache utilities."""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mcp_atlassian.utils.cache import (
+    SharedTTLCache,
+    clear_shared_caches,
+    config_fingerprint,
+    delete_snapshot,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+def test_shared_ttl_cache_basic_operations():
+    """Test get/set/pop and the process-wide clear hook."""
+    cache: SharedTTLCache[str, int] = SharedTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+
+    cache.set("b", 2)
+    clear_shared_caches()
+    assert len(cache) == 0
+
+
+def test_shared_ttl_cache_disabled_with_zero_ttl():
+    """Test that a TTL of 0 turns the cache into a no-op."""
+    cache: SharedTTLCache[str, int] = SharedTTLCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_shared_ttl_cache_bounded_by_size():
+    """Test that getsizeof bounds the total size and skips oversized values."""
+    cache: SharedTTLCache[str, bytes] = SharedTTLCache(
+        maxsize=10, ttl=60, getsizeof=len
+    )
+    cache.set("a", b"x" * 6)
+    cache.set("b", b"x" * 6)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"x" * 6
+
+    cache.set("b", b"x" * 11)
+    assert cache.get("b") is None
+
+
+def test_shared_ttl_cache_reads_settings_on_first_use():
+    """Test that settings given as functions are read lazily, not at creation."""
+    cache: SharedTTLCache[str, int] = SharedTTLCache(
+        maxsize=lambda: int(os.environ["TEST_CACHE_SIZE"]),
+        ttl=lambda: int(os.environ["TEST_CACHE_TTL"]),
+    )
+
+    with patch.dict(os.environ, {"TEST_CACHE_SIZE": "1", "TEST_CACHE_TTL": "0"}):
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert cache.ttl == 0
+
+    clear_shared_caches()
+    with patch.dict(os.environ, {"TEST_CACHE_SIZE": "1", "TEST_CACHE_TTL": "60"}):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.ttl == 60
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+
+def test_config_fingerprint():
+    """Test that fingerprints follow the site and credentials."""
+    config = SimpleNamespace(
+        url="https://x.atlassian.net/",
+        auth_type="basic",
+        username="u",
+        api_token="secret",
+    )
+    fingerprint = config_fingerprint(config)
+    assert fingerprint is not None
+    assert "secret" not in fingerprint
+    assert fingerprint == config_fingerprint(
+        SimpleNamespace(**{**vars(config), "url": "https://x.atlassian.net"})
+    )
+    assert fingerprint != config_fingerprint(
+        SimpleNamespace(**{**vars(config), "api_token": "other"})
+    )
+    assert config_fingerprint(None) is None
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test that snapshots are written, expired and deleted."""
+    with patch.dict(os.environ, {"MCP_CACHE_DIR": str(tmp_path)}):
+        save_snapshot("test", "key", [{"id": "summary"}])
+        assert load_snapshot("test", "key", max_age=60) == [{"id": "summary"}]
+        assert load_snapshot("test", "other-key", max_age=60) is None
+        assert load_snapshot("test", "key", max_age=-1) is None
+
+        delete_snapshot("test", "key")
+        assert load_snapshot("test", "key", max_age=60) is None
+
+
+def test_snapshots_disabled_without_cache_dir(tmp_path):
+    """Test that nothing is written when MCP_CACHE_DIR is unset."""
+    with patch.dict(os.environ, {}, clear=True):
+        save_snapshot("test", "key", [1])
+        assert load_snapshot("test", "key", max_age=60) is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,126 @@
+"""Tests for the blocking-call execution helpers."""
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import anyio
+import pytest
+
+from mcp_atlassian.utils.concurrency import run_blocking, submit_blocking, tenant_key
+
+
+class _FakeFetcher:
+    """Minimal stand-in for a fetcher whose methods block."""
+
+    def __init__(self, url: str, token: str) -> None:
+        self.config = SimpleNamespace(
+            url=url,
+            auth_type="token",
+            username=None,
+            personal_token=token,
+            api_token=None,
+            oauth_config=None,
+        )
+
+    def slow_call(self, delay: float) -> int:
+        time.sleep(delay)
+        return threading.get_ident()
+
+
+def test_tenant_key():
+    """Test that tenant keys follow the fetcher's site and credentials."""
+    first = _FakeFetcher("https://jira.example.com", "token-a")
+    same = _FakeFetcher("https://jira.example.com/", "token-a")
+    other = _FakeFetcher("https://jira.example.com", "token-b")
+
+    assert tenant_key(first.slow_call) == tenant_key(same.slow_call)
+    assert tenant_key(first.slow_call) != tenant_key(other.slow_call)
+    assert tenant_key(len) is None
+    assert tenant_key(lambda: None) is None
+
+
+@pytest.mark.anyio
+async def test_run_blocking_offloads_to_worker_thread():
+    """Test that calls run off the event loop thread and return their result."""
+    fetcher = _FakeFetcher("https://jira.example.com", "token")
+    worker_ident = await run_blocking(fetcher.slow_call, 0)
+    assert worker_ident != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_run_blocking_propagates_exceptions():
+    """Test that exceptions from the blocking call reach the caller unchanged."""
+
+    def failing_call() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await run_blocking(failing_call)
+
+
+@pytest.mark.anyio
+async def test_run_blocking_inline_when_disabled():
+    """Test that MCP_WORKER_THREADS=0 keeps calls on the event loop thread."""
+    fetcher = _FakeFetcher("https://jira.example.com", "token")
+    with patch.dict(os.environ, {"MCP_WORKER_THREADS": "0"}):
+        worker_ident = await run_blocking(fetcher.slow_call, 0)
+    assert worker_ident == threading.get_ident()
+
+
+async def _elapsed_for(*fetchers: _FakeFetcher, delay: float = 0.2) -> float:
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for fetcher in fetchers:
+            tg.start_soon(run_blocking, fetcher.slow_call, delay)
+    return time.perf_counter() - start
+
+
+@pytest.mark.anyio
+async def test_run_blocking_overlaps_calls():
+    """Test that concurrent calls overlap their waits."""
+    fetcher = _FakeFetcher("https://jira.example.com", "token")
+    with patch.dict(os.environ, {"MCP_TENANT_CONCURRENCY": "4"}):
+        elapsed = await _elapsed_for(fetcher, fetcher, fetcher)
+    assert elapsed < 0.5
+
+
+@pytest.mark.anyio
+async def test_run_blocking_enforces_tenant_limit():
+    """Test that one tenant is serialized while other tenants still overlap."""
+    busy_tenant = _FakeFetcher("https://jira.example.com", "token-a")
+    other_tenant = _FakeFetcher("https://jira.example.com", "token-b")
+    with patch.dict(os.environ, {"MCP_TENANT_CONCURRENCY": "1"}):
+        serialized = await _elapsed_for(busy_tenant, busy_tenant, delay=0.15)
+        overlapped = await _elapsed_for(busy_tenant, other_tenant, delay=0.15)
+    assert serialized >= 0.3
+    assert overlapped < 0.3
+
+
+def test_submit_blocking_runs_in_background():
+    """Test that submitted calls run on the fan-out pool."""
+    fetcher = _FakeFetcher("https://jira.example.com", "token")
+    futures = [submit_blocking(fetcher.slow_call, 0.15) for _ in range(3)]
+    start = time.perf_counter()
+    idents = {future.result() for future in futures}
+    assert time.perf_counter() - start < 0.4
+    assert threading.get_ident() not in idents
+
+
+def test_submit_blocking_inline_when_disabled():
+    """Test that MCP_FANOUT_THREADS=0 runs calls immediately in the caller."""
+
+    def failing_call() -> None:
+        raise ValueError("boom")
+
+    fetcher = _FakeFetcher("https://jira.example.com", "token")
+    with patch.dict(os.environ, {"MCP_FANOUT_THREADS": "0"}):
+        future = submit_blocking(fetcher.slow_call, 0)
+        failed = submit_blocking(failing_call)
+
+    assert future.done()
+    assert future.result() == threading.get_ident()
+    with pytest.raises(ValueError, match="boom"):
+        failed.result()
@@ -2,7 +2,7 @@
 
 import pytest
 
-from mcp_atlassian.utils import parse_date
+from mcp_atlassian.utils import parse_date, parse_iso8601_date
 
 
 def test_parse_date_invalid_input():
@@ -37,3 +37,32 @@ def test_parse_date_rfc3339():
         str(parse_date("1937-01-01T12:00:27.87+00:20"))
         == "1937-01-01 12:00:27.870000+00:20"
     )
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("2024-01-01T10:00:00.000+0000", "2024-01-01 10:00:00+00:00"),
+        ("2024-01-01T10:00:00.000-0500", "2024-01-01 10:00:00-05:00"),
+        ("2024-01-01T10:00:00.000+05:30", "2024-01-01 10:00:00+05:30"),
+        ("2024-01-01T10:00:00Z", "2024-01-01 10:00:00+00:00"),
+        ("2024-01-01", "2024-01-01 00:00:00"),
+    ],
+)
+def test_parse_iso8601_date(date_str, expected):
+    """Test that parse_iso8601_date handles the Atlassian timestamp formats."""
+    assert str(parse_iso8601_date(date_str)) == expected
+    assert str(parse_date(date_str)) == expected
+
+
+def test_parse_iso8601_date_invalid():
+    """Test that parse_iso8601_date returns None for other strings."""
+    assert parse_iso8601_date("not-a-timestamp") is None
+    assert parse_iso8601_date("") is None
+
+
+@pytest.mark.parametrize("date_str", ["2024-01-02+0530", "20240102+05"])
+def test_parse_date_offset_without_time(date_str):
+    """Test that a date with an offset but no time is not read as a time."""
+    with pytest.raises(ValueError):
+        parse_date(date_str)
@@ -0,0 +1,75 @@
+"""Tests for the tool response encoding."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.utils import encoding
+from mcp_atlassian.utils.encoding import dump_json, omit_empty
+
+RESULT = {
+    "key": "PROJ-1",
+    "summary": "Überprüfung",
+    "assignee": None,
+    "labels": [],
+    "fields": {"description": "", "priority": {"name": "High"}},
+    "comments": [{"body": "ok", "author": {}}],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request):
+    """Run a test with and without the optional orjson package."""
+    if request.param == "json":
+        with patch.object(encoding, "orjson", None):
+            yield request.param
+    else:
+        if encoding.orjson is None:
+            pytest.skip("orjson is not installed")
+        yield request.param
+
+
+def test_dump_json_default_is_pretty(encoder):
+    """Test that responses are indented and keep non-ASCII text by default."""
+    with patch.dict(os.environ, {}, clear=True):
+        text = dump_json(RESULT)
+
+    assert text == json.dumps(RESULT, indent=2, ensure_ascii=False)
+
+
+def test_dump_json_compact(encoder):
+    """Test that MCP_JSON_COMPACT drops all insignificant whitespace."""
+    with patch.dict(os.environ, {"MCP_JSON_COMPACT": "true"}):
+        text = dump_json(RESULT)
+
+    assert text == json.dumps(RESULT, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_dump_json_omit_empty(encoder):
+    """Test that MCP_JSON_OMIT_EMPTY removes null and empty values."""
+    with patch.dict(os.environ, {"MCP_JSON_OMIT_EMPTY": "1"}):
+        data = json.loads(dump_json(RESULT))
+
+    assert data == {
+        "key": "PROJ-1",
+        "summary": "Überprüfung",
+        "fields": {"priority": {"name": "High"}},
+        "comments": [{"body": "ok"}],
+    }
+
+
+def test_omit_empty_keeps_falsy_scalars_and_list_positions():
+    """Test that zeros, False and list items are not removed."""
+    data = {"count": 0, "flag": False, "items": [None, {}, {"a": None}], "x": {}}
+
+    assert omit_empty(data) == {"count": 0, "flag": False, "items": [None, {}, {}]}
+
+
+def test_dump_json_falls_back_for_unsupported_values():
+    """Test that values orjson rejects are encoded by the standard library."""
+    if encoding.orjson is None:
+        pytest.skip("orjson is not installed")
+    with patch.dict(os.environ, {"MCP_JSON_COMPACT": "true"}):
+        assert dump_json({"id": 2**70}) == '{"id":1180591620717411303424}'
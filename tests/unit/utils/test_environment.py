@@ -0,0 +1,37 @@
+"""Tests for the environment utilities module."""
+
+import os
+from unittest.mock import patch
+
+from mcp_atlassian.utils.environment import get_bool_env, get_int_env
+
+
+def test_get_int_env_default_when_unset():
+    """Test that get_int_env falls back to the default when unset."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_int_env("MCP_TEST_SETTING", 42) == 42
+
+
+def test_get_int_env_parses_value():
+    """Test that get_int_env parses integers, ignoring surrounding whitespace."""
+    with patch.dict(os.environ, {"MCP_TEST_SETTING": " 7 "}):
+        assert get_int_env("MCP_TEST_SETTING", 42) == 7
+
+
+def test_get_int_env_invalid_or_negative():
+    """Test that malformed or negative values fall back to the default."""
+    with patch.dict(os.environ, {"MCP_TEST_SETTING": "many"}):
+        assert get_int_env("MCP_TEST_SETTING", 42) == 42
+    with patch.dict(os.environ, {"MCP_TEST_SETTING": "-1"}):
+        assert get_int_env("MCP_TEST_SETTING", 42) == 42
+
+
+def test_get_bool_env():
+    """Test that get_bool_env accepts the usual truthy spellings."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_bool_env("MCP_TEST_FLAG") is False
+        assert get_bool_env("MCP_TEST_FLAG", default=True) is True
+    with patch.dict(os.environ, {"MCP_TEST_FLAG": "Yes"}):
+        assert get_bool_env("MCP_TEST_FLAG") is True
+    with patch.dict(os.environ, {"MCP_TEST_FLAG": "off"}):
+        assert get_bool_env("MCP_TEST_FLAG", default=True) is False
@@ -0,0 +1,132 @@
+"""Tests for the conditional-request response cache."""
+
+import os
+from unittest.mock import patch
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.sessions import Session
+
+from mcp_atlassian.utils.cache import clear_shared_caches
+from mcp_atlassian.utils.http_cache import (
+    ConditionalRequestAdapter,
+    configure_conditional_requests,
+)
+
+LINK_TYPES_URL = "https://jira.example.com/rest/api/2/issueLinkType"
+
+
+class _FakeServer(BaseAdapter):
+    """Adapter answering with a fixed ETag, honouring If-None-Match."""
+
+    def __init__(self, body: bytes = b'{"issueLinkTypes": []}') -> None:
+        super().__init__()
+        self.body = body
+        self.etag = '"v1"'
+        self.requests: list[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self.requests.append(request)
+        response = Response()
+        response.url = request.url
+        response.request = request
+        response.headers["ETag"] = self.etag
+        if request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response.headers["Content-Type"] = "application/json;charset=UTF-8"
+            response._content = self.body
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _get(adapter: BaseAdapter, url: str, method: str = "GET") -> Response:
+    request = PreparedRequest()
+    request.prepare(method=method, url=url, headers={"Accept": "application/json"})
+    return adapter.send(request)
+
+
+def test_not_modified_is_served_from_cache():
+    """Test that a revalidated response returns the cached body."""
+    server = _FakeServer()
+    adapter = ConditionalRequestAdapter(server, tenant="tenant")
+
+    first = _get(adapter, LINK_TYPES_URL)
+    second = _get(adapter, LINK_TYPES_URL)
+
+    assert "If-None-Match" not in server.requests[0].headers
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert second.status_code == 200
+    assert second.json() == first.json() == {"issueLinkTypes": []}
+    assert second.headers["Content-Type"] == "application/json;charset=UTF-8"
+
+    server.etag = '"v2"'
+    server.body = b'{"issueLinkTypes": [{"id": "1"}]}'
+    assert _get(adapter, LINK_TYPES_URL).json() == {"issueLinkTypes": [{"id": "1"}]}
+
+
+def test_other_requests_are_not_cached():
+    """Test that only GETs of metadata resources use validators."""
+    server = _FakeServer()
+    adapter = ConditionalRequestAdapter(server, tenant="tenant")
+
+    for _ in range(2):
+        _get(adapter, "https://jira.example.com/rest/api/2/issue/PROJ-1")
+        _get(adapter, LINK_TYPES_URL, method="POST")
+
+    assert all("If-None-Match" not in r.headers for r in server.requests)
+
+
+def test_cache_is_per_tenant():
+    """Test that responses are not shared between credentials."""
+    server = _FakeServer()
+    _get(ConditionalRequestAdapter(server, tenant="tenant-a"), LINK_TYPES_URL)
+    _get(ConditionalRequestAdapter(server, tenant="tenant-b"), LINK_TYPES_URL)
+
+    assert "If-None-Match" not in server.requests[1].headers
+
+
+def test_cache_is_bounded_by_total_size():
+    """Test that the oldest bodies are evicted once the byte budget is used."""
+    server = _FakeServer(body=b"x" * (600 * 1024))
+    adapter = ConditionalRequestAdapter(server, tenant="tenant")
+    urls = [f"{LINK_TYPES_URL}/{n}" for n in range(2)]
+
+    with patch.dict(os.environ, {"MCP_HTTP_CACHE_MAX_MB": "1"}):
+        clear_shared_caches()
+        for url in urls + urls[::-1]:
+            _get(adapter, url)
+
+    # Two bodies do not fit in 1 MB, so the first one was evicted
+    assert server.requests[2].headers["If-None-Match"] == '"v1"'
+    assert "If-None-Match" not in server.requests[3].headers
+
+
+def test_configure_conditional_requests():
+    """Test that the session's adapter is wrapped once, keeping SSL adapters."""
+    session = Session()
+    ssl_adapter = HTTPAdapter()
+    session.mount("https://jira.example.com", ssl_adapter)
+
+    configure_conditional_requests("Jira", "https://jira.example.com/", session, "t")
+    configure_conditional_requests("Jira", "https://jira.example.com/", session, "t")
+
+    adapter = session.get_adapter(LINK_TYPES_URL)
+    assert isinstance(adapter, ConditionalRequestAdapter)
+    assert adapter.adapter is ssl_adapter
+
+    other_session = Session()
+    with patch.dict(os.environ, {"MCP_HTTP_CACHE_TTL": "0"}):
+        configure_conditional_requests(
+            "Jira", "https://jira.example.com", other_session, "t"
+        )
+    configure_conditional_requests(
+        "Jira", "https://jira.example.com", other_session, None
+    )
+    assert not isinstance(
+        other_session.get_adapter(LINK_TYPES_URL), ConditionalRequestAdapter
+    )